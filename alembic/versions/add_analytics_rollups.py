@@ -0,0 +1,63 @@
+"""Add hourly and daily analytics rollup tables
+
+Revision ID: add_analytics_rollups
+Revises: add_campaign_changes
+Create Date: 2025-05-31 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_analytics_rollups'
+down_revision: Union[str, None] = 'add_campaign_changes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Event tables rolled up by created_at; notification_history is pruned by sent_date instead
+EVENT_TABLES = ('users', 'user_credit_cards', 'recommendations', 'recommendation_clicks')
+
+def upgrade() -> None:
+    # Event counts (registrations, card additions, ...) per hour and per day
+    op.create_table(
+        'analytics_event_rollups',
+        sa.Column('granularity', sa.String(8), nullable=False),  # hour or day
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('metric', sa.String(32), nullable=False),
+        sa.Column('count', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('granularity', 'bucket_start', 'metric')
+    )
+
+    # Campaign counts by category, bank and status, as of each hour and day
+    op.create_table(
+        'campaign_count_rollups',
+        sa.Column('granularity', sa.String(8), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('dimension', sa.String(16), nullable=False),  # category, bank or status
+        sa.Column('dimension_value', sa.String(255), nullable=False),
+        sa.Column('campaign_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('granularity', 'bucket_start', 'dimension', 'dimension_value')
+    )
+
+    # How far the event tables have been rolled up
+    op.create_table(
+        'analytics_rollup_state',
+        sa.Column('id', sa.SmallInteger(), primary_key=True, server_default='1'),
+        sa.Column('rolled_up_through', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.CheckConstraint('id = 1', name='ck_analytics_rollup_state_single_row')
+    )
+    op.execute("INSERT INTO analytics_rollup_state (id) VALUES (1)")
+
+    # Incremental runs read only the recent rows of each event table
+    for table in EVENT_TABLES:
+        op.create_index(f'idx_{table}_created_at', table, ['created_at'])
+
+def downgrade() -> None:
+    for table in EVENT_TABLES:
+        op.drop_index(f'idx_{table}_created_at', table_name=table)
+    op.drop_table('analytics_rollup_state')
+    op.drop_table('campaign_count_rollups')
+    op.drop_table('analytics_event_rollups')
@@ -0,0 +1,27 @@
+"""Add delta sync cursor, ETag and Last-Modified to banks
+
+Revision ID: add_bank_delta_sync_state
+Revises: add_campaign_content_hash
+Create Date: 2025-05-27 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_bank_delta_sync_state'
+down_revision: Union[str, None] = 'add_campaign_content_hash'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.add_column('banks', sa.Column('campaign_sync_cursor', sa.String(512), nullable=True))
+    op.add_column('banks', sa.Column('campaign_sync_etag', sa.String(255), nullable=True))
+    op.add_column('banks', sa.Column('campaign_sync_last_modified', sa.String(64), nullable=True))
+
+def downgrade() -> None:
+    op.drop_column('banks', 'campaign_sync_last_modified')
+    op.drop_column('banks', 'campaign_sync_etag')
+    op.drop_column('banks', 'campaign_sync_cursor')
@@ -0,0 +1,106 @@
+"""Add campaign_changes log for delta sync of the mobile catalog
+
+Revision ID: add_campaign_changes
+Revises: add_catalog_version
+Create Date: 2025-05-30 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_campaign_changes'
+down_revision: Union[str, None] = 'add_catalog_version'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table(
+        'campaign_changes',
+        sa.Column('id', sa.BigInteger(), primary_key=True),
+        sa.Column('version', sa.BigInteger(), nullable=False),
+        sa.Column('campaign_id', sa.Integer(), nullable=False),  # No FK: deleted campaigns keep their entries
+        sa.Column('operation', sa.String(10), nullable=False),  # insert, update or delete
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()'))
+    )
+    op.create_index('idx_campaign_changes_version', 'campaign_changes', ['version'])
+    op.create_index('idx_campaign_changes_changed_at', 'campaign_changes', ['changed_at'])
+
+    # Versions up to this one have been pruned from campaign_changes
+    op.add_column(
+        'catalog_state',
+        sa.Column('pruned_through_version', sa.BigInteger(), nullable=False, server_default='0')
+    )
+    # Changes before the log existed aren't in it
+    op.execute("UPDATE catalog_state SET pruned_through_version = version")
+
+    # Log every changed campaign under the version its statement bumped to
+    op.execute("""
+        CREATE OR REPLACE FUNCTION campaigns_catalog_version_trigger()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            new_version bigint;
+        BEGIN
+            -- Sync upserts whose rows were all unchanged touch nothing
+            IF EXISTS (SELECT 1 FROM changed_campaigns) THEN
+                new_version := bump_catalog_version();
+                INSERT INTO campaign_changes (version, campaign_id, operation)
+                SELECT new_version, id, lower(TG_OP) FROM changed_campaigns;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Card application URLs and category names are part of every campaign
+    # that references them. (Bank, card and merchant renames already rewrite
+    # the campaigns' search vectors, which logs them.)
+    for table, column, watched in (
+        ('credit_cards', 'card_id', ('application_url',)),
+        ('campaign_categories', 'category_id', ('name', 'enum')),
+    ):
+        changed = " OR ".join(f"OLD.{name} IS DISTINCT FROM NEW.{name}" for name in watched)
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION {table}_campaign_changes()
+            RETURNS TRIGGER AS $$
+            DECLARE
+                new_version bigint;
+            BEGIN
+                -- Bumped here: the statement-level version trigger runs after this one
+                new_version := bump_catalog_version();
+                INSERT INTO campaign_changes (version, campaign_id, operation)
+                SELECT new_version, id, 'update' FROM campaigns WHERE {column} = NEW.id;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER {table}_campaign_changes
+                AFTER UPDATE OF {", ".join(watched)} ON {table}
+                FOR EACH ROW
+                WHEN ({changed})
+                EXECUTE FUNCTION {table}_campaign_changes();
+        """)
+
+def downgrade() -> None:
+    for table in ('credit_cards', 'campaign_categories'):
+        op.execute(f"""
+            DROP TRIGGER IF EXISTS {table}_campaign_changes ON {table};
+            DROP FUNCTION IF EXISTS {table}_campaign_changes();
+        """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION campaigns_catalog_version_trigger()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM changed_campaigns) THEN
+                PERFORM bump_catalog_version();
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.drop_column('catalog_state', 'pruned_through_version')
+    op.drop_index('idx_campaign_changes_changed_at', table_name='campaign_changes')
+    op.drop_index('idx_campaign_changes_version', table_name='campaign_changes')
+    op.drop_table('campaign_changes')
@@ -0,0 +1,24 @@
+"""Add content_hash to campaigns for sync change detection
+
+Revision ID: add_campaign_content_hash
+Revises: add_campaign_external_unique
+Create Date: 2025-05-27 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_campaign_content_hash'
+down_revision: Union[str, None] = 'add_campaign_external_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Left NULL for existing rows; the next sync fills it in
+    op.add_column('campaigns', sa.Column('content_hash', sa.String(64), nullable=True))
+
+def downgrade() -> None:
+    op.drop_column('campaigns', 'content_hash')
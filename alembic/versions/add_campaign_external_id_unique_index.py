@@ -0,0 +1,43 @@
+"""Add unique index on campaigns (bank_id, external_id, source) for sync upserts
+
+Revision ID: add_campaign_external_unique
+Revises: add_reminder_claim_columns
+Create Date: 2025-05-27 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_campaign_external_unique'
+down_revision: Union[str, None] = 'add_reminder_claim_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Earlier syncs could import the same external campaign twice. Keep the
+    # oldest row linked to the bank feed and detach the duplicates, rather than
+    # deleting rows that reminders or notifications may point at.
+    op.execute("""
+        UPDATE campaigns
+        SET external_id = NULL
+        WHERE external_id IS NOT NULL
+          AND id NOT IN (
+              SELECT MIN(id)
+              FROM campaigns
+              WHERE external_id IS NOT NULL
+              GROUP BY bank_id, external_id, source
+          )
+    """)
+
+    op.create_index(
+        'uq_campaigns_bank_external_source',
+        'campaigns',
+        ['bank_id', 'external_id', 'source'],
+        unique=True
+    )
+
+def downgrade() -> None:
+    op.drop_index('uq_campaigns_bank_external_source', table_name='campaigns')
@@ -0,0 +1,39 @@
+"""Add (created_at, id) indexes for keyset pagination of campaign listings
+
+Revision ID: add_campaign_keyset_indexes
+Revises: add_campaign_search_vector
+Create Date: 2025-05-29 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_campaign_keyset_indexes'
+down_revision: Union[str, None] = 'add_campaign_search_vector'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Listings only show active campaigns, newest first, optionally narrowed to a
+# bank, card or category
+INDEXES = [
+    ('idx_campaigns_active_created', []),
+    ('idx_campaigns_bank_created', ['bank_id']),
+    ('idx_campaigns_card_created', ['card_id']),
+    ('idx_campaigns_category_created', ['category_id']),
+]
+
+def upgrade() -> None:
+    for name, prefix in INDEXES:
+        op.create_index(
+            name,
+            'campaigns',
+            [*prefix, sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('is_active')
+        )
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='campaigns')
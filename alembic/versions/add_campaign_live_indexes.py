@@ -0,0 +1,36 @@
+"""Add partial indexes on live campaigns for the lifecycle sweeper and hot queries
+
+Revision ID: add_campaign_live_indexes
+Revises: add_analytics_rollups
+Create Date: 2025-05-31 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_campaign_live_indexes'
+down_revision: Union[str, None] = 'add_analytics_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The lifecycle sweeper deactivates campaigns as they expire, so is_active
+# covers only live and upcoming campaigns. Hot queries narrow that set to a
+# category or merchant and the current window; the sweeper reads the next
+# start and end boundaries.
+INDEXES = [
+    ('idx_campaigns_live_category', ['category_id', 'end_date'], 'is_active'),
+    ('idx_campaigns_live_merchant', ['merchant_id', 'end_date'], 'is_active AND merchant_id IS NOT NULL'),
+    ('idx_campaigns_live_end_date', ['end_date'], 'is_active'),
+    ('idx_campaigns_live_start_date', ['start_date'], 'is_active'),
+]
+
+def upgrade() -> None:
+    for name, columns, where in INDEXES:
+        op.create_index(name, 'campaigns', columns, postgresql_where=sa.text(where))
+
+def downgrade() -> None:
+    for name, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name='campaigns')
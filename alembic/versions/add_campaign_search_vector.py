@@ -0,0 +1,114 @@
+"""Add Turkish-normalized full-text search vector to campaigns
+
+Revision ID: add_campaign_search_vector
+Revises: add_pending_campaigns_index
+Create Date: 2025-05-29 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_campaign_search_vector'
+down_revision: Union[str, None] = 'add_pending_campaigns_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.add_column('campaigns', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Fold Turkish letters to ASCII before lowercasing, so "İndirim", "indirim"
+    # and "Indirim" all index and match the same way regardless of the
+    # database collation
+    op.execute("""
+        CREATE OR REPLACE FUNCTION campaign_search_normalize(value text)
+        RETURNS text AS $$
+            SELECT lower(translate(coalesce(value, ''), 'İIıŞşĞğÜüÖöÇç', 'iiissgguuoocc'));
+        $$ LANGUAGE sql IMMUTABLE;
+    """)
+
+    # Weights: campaign name A, bank/card/merchant names B, description C
+    op.execute("""
+        CREATE OR REPLACE FUNCTION campaign_search_vector(
+            campaign_name text, campaign_description text,
+            campaign_bank_id integer, campaign_card_id integer, campaign_merchant_id integer
+        )
+        RETURNS tsvector AS $$
+            SELECT
+                setweight(to_tsvector('simple', campaign_search_normalize(campaign_name)), 'A') ||
+                setweight(to_tsvector('simple', campaign_search_normalize(concat_ws(' ',
+                    (SELECT name FROM banks WHERE id = campaign_bank_id),
+                    (SELECT name FROM credit_cards WHERE id = campaign_card_id),
+                    (SELECT name FROM merchants WHERE id = campaign_merchant_id)
+                ))), 'B') ||
+                setweight(to_tsvector('simple', campaign_search_normalize(campaign_description)), 'C');
+        $$ LANGUAGE sql STABLE;
+    """)
+
+    # Covers every writer: CRUD, admin endpoints and the bank sync's bulk upsert
+    op.execute("""
+        CREATE OR REPLACE FUNCTION campaigns_search_vector_update()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.search_vector = campaign_search_vector(
+                NEW.name, NEW.description, NEW.bank_id, NEW.card_id, NEW.merchant_id
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER campaigns_search_vector_update
+            BEFORE INSERT OR UPDATE OF name, description, bank_id, card_id, merchant_id ON campaigns
+            FOR EACH ROW
+            EXECUTE FUNCTION campaigns_search_vector_update();
+    """)
+
+    # Renaming a bank, card or merchant re-indexes its campaigns
+    for table, column in (('banks', 'bank_id'), ('credit_cards', 'card_id'), ('merchants', 'merchant_id')):
+        op.execute(f"""
+            CREATE OR REPLACE FUNCTION {table}_search_name_update()
+            RETURNS TRIGGER AS $$
+            BEGIN
+                UPDATE campaigns
+                SET search_vector = campaign_search_vector(name, description, bank_id, card_id, merchant_id)
+                WHERE {column} = NEW.id;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+
+            CREATE TRIGGER {table}_search_name_update
+                AFTER UPDATE OF name ON {table}
+                FOR EACH ROW
+                WHEN (OLD.name IS DISTINCT FROM NEW.name)
+                EXECUTE FUNCTION {table}_search_name_update();
+        """)
+
+    op.execute("""
+        UPDATE campaigns
+        SET search_vector = campaign_search_vector(name, description, bank_id, card_id, merchant_id);
+    """)
+
+    op.create_index(
+        'idx_campaigns_search_vector',
+        'campaigns',
+        ['search_vector'],
+        postgresql_using='gin'
+    )
+
+def downgrade() -> None:
+    op.drop_index('idx_campaigns_search_vector', table_name='campaigns')
+    for table in ('banks', 'credit_cards', 'merchants'):
+        op.execute(f"""
+            DROP TRIGGER IF EXISTS {table}_search_name_update ON {table};
+            DROP FUNCTION IF EXISTS {table}_search_name_update();
+        """)
+    op.execute("""
+        DROP TRIGGER IF EXISTS campaigns_search_vector_update ON campaigns;
+        DROP FUNCTION IF EXISTS campaigns_search_vector_update();
+        DROP FUNCTION IF EXISTS campaign_search_vector(text, text, integer, integer, integer);
+        DROP FUNCTION IF EXISTS campaign_search_normalize(text);
+    """)
+    op.drop_column('campaigns', 'search_vector')
@@ -0,0 +1,59 @@
+"""Add campaign_sync_runs table for the standalone sync worker
+
+Revision ID: add_campaign_sync_runs
+Revises: add_bank_delta_sync_state
+Create Date: 2025-05-28 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_campaign_sync_runs'
+down_revision: Union[str, None] = 'add_bank_delta_sync_state'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+run_status = sa.Enum('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', name='campaignsyncrunstatus')
+
+def upgrade() -> None:
+    op.create_table(
+        'campaign_sync_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('bank_id', sa.Integer(), nullable=True),
+        sa.Column('trigger', sa.String(20), nullable=False, server_default='manual'),
+        sa.Column('status', run_status, nullable=False, server_default='QUEUED'),
+        sa.Column('requested_by', sa.Integer(), nullable=True),
+        sa.Column('worker_id', sa.String(255), nullable=True),
+        sa.Column('total_banks', sa.Integer(), nullable=True),
+        sa.Column('completed_banks', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('progress', postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column('result', postgresql.JSONB(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['bank_id'], ['banks.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['requested_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_campaign_sync_runs_id', 'campaign_sync_runs', ['id'])
+    # Workers poll for queued runs and the admin panel lists recent ones
+    op.create_index(
+        'idx_campaign_sync_runs_queued',
+        'campaign_sync_runs',
+        ['created_at'],
+        postgresql_where=sa.text("status = 'QUEUED'")
+    )
+    op.create_index('idx_campaign_sync_runs_created_at', 'campaign_sync_runs', ['created_at'])
+
+def downgrade() -> None:
+    op.drop_index('idx_campaign_sync_runs_created_at', table_name='campaign_sync_runs')
+    op.drop_index('idx_campaign_sync_runs_queued', table_name='campaign_sync_runs')
+    op.drop_index('ix_campaign_sync_runs_id', table_name='campaign_sync_runs')
+    op.drop_table('campaign_sync_runs')
+    run_status.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,98 @@
+"""Add catalog version, bumped by triggers on catalog writes
+
+Revision ID: add_catalog_version
+Revises: add_campaign_keyset_indexes
+Create Date: 2025-05-30 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_catalog_version'
+down_revision: Union[str, None] = 'add_campaign_keyset_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    op.create_table(
+        'catalog_state',
+        sa.Column('id', sa.SmallInteger(), primary_key=True, server_default='1'),
+        sa.Column('version', sa.BigInteger(), nullable=False, server_default='1'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.CheckConstraint('id = 1', name='ck_catalog_state_single_row')
+    )
+    op.execute("INSERT INTO catalog_state (id, version) VALUES (1, 1)")
+
+    # The row lock taken by the bump is held until commit, so versions become
+    # visible in the order their writes commit
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_catalog_version()
+        RETURNS bigint AS $$
+            UPDATE catalog_state SET version = version + 1, updated_at = now() WHERE id = 1
+            RETURNING version;
+        $$ LANGUAGE sql;
+
+        CREATE OR REPLACE FUNCTION catalog_version_trigger()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM bump_catalog_version();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE FUNCTION campaigns_catalog_version_trigger()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            -- Sync upserts whose rows were all unchanged touch nothing
+            IF EXISTS (SELECT 1 FROM changed_campaigns) THEN
+                PERFORM bump_catalog_version();
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    # Statement-level, so a bulk sync upsert or bulk review bumps once
+    for event, transition in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+        op.execute(f"""
+            CREATE TRIGGER campaigns_catalog_version_{event.lower()}
+                AFTER {event} ON campaigns
+                REFERENCING {transition} TABLE AS changed_campaigns
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION campaigns_catalog_version_trigger();
+        """)
+
+    # Bank sync bookkeeping (cursors, last sync time) doesn't change the catalog
+    op.execute("""
+        CREATE TRIGGER banks_catalog_version
+            AFTER INSERT OR DELETE OR UPDATE OF name, logo_url ON banks
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION catalog_version_trigger();
+
+        CREATE TRIGGER credit_cards_catalog_version
+            AFTER INSERT OR UPDATE OR DELETE ON credit_cards
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION catalog_version_trigger();
+
+        CREATE TRIGGER campaign_categories_catalog_version
+            AFTER INSERT OR UPDATE OR DELETE ON campaign_categories
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION catalog_version_trigger();
+    """)
+
+def downgrade() -> None:
+    op.execute("""
+        DROP TRIGGER IF EXISTS campaign_categories_catalog_version ON campaign_categories;
+        DROP TRIGGER IF EXISTS credit_cards_catalog_version ON credit_cards;
+        DROP TRIGGER IF EXISTS banks_catalog_version ON banks;
+        DROP TRIGGER IF EXISTS campaigns_catalog_version_delete ON campaigns;
+        DROP TRIGGER IF EXISTS campaigns_catalog_version_update ON campaigns;
+        DROP TRIGGER IF EXISTS campaigns_catalog_version_insert ON campaigns;
+        DROP FUNCTION IF EXISTS campaigns_catalog_version_trigger();
+        DROP FUNCTION IF EXISTS catalog_version_trigger();
+        DROP FUNCTION IF EXISTS bump_catalog_version();
+    """)
+    op.drop_table('catalog_state')
@@ -0,0 +1,46 @@
+"""Announce catalog version bumps on the cache_invalidation channel
+
+Revision ID: add_catalog_version_notify
+Revises: add_campaign_live_indexes
+Create Date: 2025-06-01 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_catalog_version_notify'
+down_revision: Union[str, None] = 'add_campaign_live_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Every catalog write bumps the version, so every process hears of it on
+    # commit, whichever code path made the write
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_catalog_version()
+        RETURNS bigint AS $$
+        DECLARE
+            new_version bigint;
+        BEGIN
+            UPDATE catalog_state SET version = version + 1, updated_at = now() WHERE id = 1
+            RETURNING version INTO new_version;
+            PERFORM pg_notify(
+                'cache_invalidation',
+                json_build_object('entity', 'catalog', 'version', new_version)::text
+            );
+            RETURN new_version;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_catalog_version()
+        RETURNS bigint AS $$
+            UPDATE catalog_state SET version = version + 1, updated_at = now() WHERE id = 1
+            RETURNING version;
+        $$ LANGUAGE sql;
+    """)
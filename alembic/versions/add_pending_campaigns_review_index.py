@@ -0,0 +1,29 @@
+"""Add partial index for keyset pagination of pending campaigns
+
+Revision ID: add_pending_campaigns_index
+Revises: add_campaign_sync_runs
+Create Date: 2025-05-28 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_pending_campaigns_index'
+down_revision: Union[str, None] = 'add_campaign_sync_runs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # The review queue pages newest-first over pending campaigns only
+    op.create_index(
+        'idx_campaigns_pending_created',
+        'campaigns',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+def downgrade() -> None:
+    op.drop_index('idx_campaigns_pending_created', table_name='campaigns')
@@ -0,0 +1,35 @@
+"""Add claim columns to campaign_reminders for multi-worker dispatch
+
+Revision ID: add_reminder_claim_columns
+Revises: partition_notification_history
+Create Date: 2025-05-26 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_reminder_claim_columns'
+down_revision: Union[str, None] = 'partition_notification_history'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # Worker that currently owns the reminder and when it claimed it
+    op.add_column('campaign_reminders', sa.Column('claimed_by', sa.String(255), nullable=True))
+    op.add_column('campaign_reminders', sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Only pending reminders are ever scanned by the dispatcher
+    op.create_index(
+        'idx_campaign_reminders_pending',
+        'campaign_reminders',
+        ['remind_at'],
+        postgresql_where=sa.text('is_sent = false AND is_active = true')
+    )
+
+def downgrade() -> None:
+    op.drop_index('idx_campaign_reminders_pending', table_name='campaign_reminders')
+    op.drop_column('campaign_reminders', 'claimed_at')
+    op.drop_column('campaign_reminders', 'claimed_by')
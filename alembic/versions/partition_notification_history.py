@@ -0,0 +1,163 @@
+"""Partition notification_history by month and add rollup table
+
+Revision ID: partition_notification_history
+Revises: b2322c2fd31e
+Create Date: 2025-05-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'partition_notification_history'
+down_revision: Union[str, None] = 'b2322c2fd31e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Number of future monthly partitions created up front. The retention task
+# keeps this window rolling forward after the migration.
+PARTITIONS_AHEAD = 3
+
+COLUMNS = """
+    id, user_id, merchant_id, campaign_id, latitude, longitude, sent_at,
+    sent_date, location_hash, category_id, title, body, is_read, read_at, data
+"""
+
+
+def upgrade() -> None:
+    # Keep the existing id sequence alive while the old table is swapped out
+    op.execute("ALTER TABLE notification_history RENAME TO notification_history_legacy")
+    op.execute("ALTER SEQUENCE notification_history_id_seq OWNED BY NONE")
+
+    # Create the partitioned parent table. The partition key has to be part
+    # of the primary key, so the key becomes (id, sent_date).
+    op.execute("""
+        CREATE TABLE notification_history (
+            id integer NOT NULL DEFAULT nextval('notification_history_id_seq'),
+            user_id integer NOT NULL REFERENCES users(id),
+            merchant_id integer REFERENCES merchants(id),
+            campaign_id integer NOT NULL REFERENCES campaigns(id),
+            latitude double precision,
+            longitude double precision,
+            sent_at timestamp with time zone DEFAULT now(),
+            sent_date date NOT NULL DEFAULT CURRENT_DATE,
+            location_hash varchar(50),
+            category_id integer REFERENCES campaign_categories(id),
+            title varchar(255) NOT NULL,
+            body text NOT NULL,
+            is_read boolean NOT NULL DEFAULT false,
+            read_at timestamp with time zone,
+            data jsonb,
+            PRIMARY KEY (id, sent_date)
+        ) PARTITION BY RANGE (sent_date)
+    """)
+    op.execute("ALTER SEQUENCE notification_history_id_seq OWNED BY notification_history.id")
+
+    # One partition per month, from the oldest existing row up to a few
+    # months ahead of today
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month_start date;
+            last_month date := date_trunc('month', CURRENT_DATE)::date
+                + interval '{PARTITIONS_AHEAD} months';
+        BEGIN
+            SELECT COALESCE(date_trunc('month', MIN(sent_date))::date,
+                            date_trunc('month', CURRENT_DATE)::date)
+              INTO month_start
+              FROM notification_history_legacy;
+
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF notification_history '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'notification_history_' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    (month_start + interval '1 month')::date
+                );
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END $$;
+    """)
+
+    op.execute(f"""
+        INSERT INTO notification_history ({COLUMNS})
+        SELECT {COLUMNS} FROM notification_history_legacy
+    """)
+    op.execute("DROP TABLE notification_history_legacy")
+
+    # Indexes are created on the parent and propagate to every partition.
+    # They cover the daily dedup lookup and the per-user inbox listing.
+    op.create_index(
+        'idx_notification_history_dedup',
+        'notification_history',
+        ['user_id', 'sent_date', 'campaign_id']
+    )
+    op.create_index(
+        'idx_notification_history_inbox',
+        'notification_history',
+        ['user_id', 'is_read', sa.text('sent_at DESC')]
+    )
+    op.create_index('idx_notification_history_campaign', 'notification_history', ['campaign_id'])
+
+    # Per-user, per-campaign monthly aggregates of dropped partitions
+    op.create_table(
+        'notification_history_rollups',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('campaign_id', sa.Integer(), sa.ForeignKey('campaigns.id'), nullable=False),
+        sa.Column('period_month', sa.Date(), nullable=False),
+        sa.Column('notification_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('read_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('first_sent_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_sent_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id', 'campaign_id', 'period_month', name='uq_notification_rollup_user_campaign_month')
+    )
+    op.create_index('idx_notification_rollups_user', 'notification_history_rollups', ['user_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_notification_rollups_user', table_name='notification_history_rollups')
+    op.drop_table('notification_history_rollups')
+
+    op.execute("ALTER TABLE notification_history RENAME TO notification_history_partitioned")
+    op.execute("ALTER SEQUENCE notification_history_id_seq OWNED BY NONE")
+    op.execute("DROP INDEX IF EXISTS idx_notification_history_dedup")
+    op.execute("DROP INDEX IF EXISTS idx_notification_history_inbox")
+    op.execute("DROP INDEX IF EXISTS idx_notification_history_campaign")
+
+    op.execute("""
+        CREATE TABLE notification_history (
+            id integer NOT NULL DEFAULT nextval('notification_history_id_seq') PRIMARY KEY,
+            user_id integer NOT NULL REFERENCES users(id),
+            merchant_id integer REFERENCES merchants(id),
+            campaign_id integer NOT NULL REFERENCES campaigns(id),
+            latitude double precision,
+            longitude double precision,
+            sent_at timestamp with time zone DEFAULT now(),
+            sent_date date NOT NULL DEFAULT CURRENT_DATE,
+            location_hash varchar(50),
+            category_id integer REFERENCES campaign_categories(id),
+            title varchar(255) NOT NULL,
+            body text NOT NULL,
+            is_read boolean NOT NULL DEFAULT false,
+            read_at timestamp with time zone,
+            data jsonb
+        )
+    """)
+    op.execute("ALTER SEQUENCE notification_history_id_seq OWNED BY notification_history.id")
+    op.execute(f"""
+        INSERT INTO notification_history ({COLUMNS})
+        SELECT {COLUMNS} FROM notification_history_partitioned
+    """)
+    op.execute("DROP TABLE notification_history_partitioned CASCADE")
+
+    op.create_index('idx_notification_history_user', 'notification_history', ['user_id'])
+    op.create_index('idx_notification_history_campaign', 'notification_history', ['campaign_id'])
+    op.create_index('idx_notification_history_merchant', 'notification_history', ['merchant_id'])
+    op.create_index('idx_notification_history_category', 'notification_history', ['category_id'])
+    op.create_index('idx_notification_history_sent_date', 'notification_history', ['sent_date'])
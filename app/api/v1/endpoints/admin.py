@@ -8,6 +8,8 @@ from app.db.base import get_db
 from app.models.campaign import Campaign, Bank, CreditCard, Merchant
 from app.models.user import Recommendation, RecommendationClick
 from app.schemas.campaign import BankCreate, BankInDB, CreditCardCreate, CreditCardInDB, MerchantCreate, MerchantInDB
+from app.services.cache_invalidation import publish_invalidation
+from app.services.campaign_stats import CampaignStatsService
 
 from app.api.v1.endpoints import admin_campaigns
 from app.api.v1.endpoints.admin_analytics import router as analytics_router
@@ -51,6 +53,8 @@ def create_bank(
     """
     db_bank = Bank(**bank.dict())
     db.add(db_bank)
+    db.flush()
+    publish_invalidation(db, "bank", [db_bank.id])
     db.commit()
     db.refresh(db_bank)
     return db_bank
@@ -78,6 +82,8 @@ def create_credit_card(
     """
     db_credit_card = CreditCard(**credit_card.dict())
     db.add(db_credit_card)
+    db.flush()
+    publish_invalidation(db, "card", [db_credit_card.id])
     db.commit()
     db.refresh(db_credit_card)
     return db_credit_card
@@ -105,6 +111,8 @@ def create_merchant(
     """
     db_merchant = Merchant(**merchant.dict())
     db.add(db_merchant)
+    db.flush()
+    publish_invalidation(db, "merchant", [db_merchant.id])
     db.commit()
     db.refresh(db_merchant)
     return db_merchant
@@ -172,40 +180,7 @@ def get_campaign_stats(
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     
-    # Get recommendations by campaign
-    campaign_stats = db.query(
-        Recommendation.campaign_id,
-        func.count(Recommendation.id).label('impression_count'),
-        func.count(RecommendationClick.id).label('click_count')
-    ).outerjoin(
-        RecommendationClick,
-        Recommendation.id == RecommendationClick.recommendation_id
-    ).filter(
-        Recommendation.created_at >= start_date,
-        Recommendation.created_at <= end_date
-    ).group_by(Recommendation.campaign_id).all()
-    
-    # Enrich with campaign details
-    campaign_details = []
-    for campaign_id, impression_count, click_count in campaign_stats:
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-        if campaign:
-            ctr = 0
-            if impression_count > 0:
-                ctr = (click_count / impression_count) * 100
-                
-            campaign_details.append({
-                "campaign_id": campaign_id,
-                "campaign_name": campaign.name,
-                "bank_name": campaign.bank.name if campaign.bank else "Unknown",
-                "card_name": campaign.credit_card.name if campaign.credit_card else "Unknown",
-                "impression_count": impression_count,
-                "click_count": click_count,
-                "ctr": round(ctr, 2)
-            })
-    
-    # Sort by impression count descending
-    campaign_details.sort(key=lambda x: x["impression_count"], reverse=True)
+    campaign_details = CampaignStatsService(db).get_campaign_performance(start_date, end_date)
     
     return {
         "period_days": days,
@@ -1,59 +1,75 @@
 from typing import Any, List, Dict
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.db.base import get_db
 from app.api.v1.deps import get_current_admin_user
+from app.services.analytics_rollup_service import AnalyticsRollupService
 
 router = APIRouter()
 
 @router.get("/dashboard")
 def get_dashboard_analytics(
     *,
+    db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin_user),
+    days: int = Query(7, ge=1, le=365),
 ) -> Any:
     """
     Get dashboard analytics for admin.
+
+    Read from the analytics rollups, which lag the event tables by up to
+    ANALYTICS_ROLLUP_INTERVAL_MINUTES (see `rolled_up_through`).
     """
-    # In a real app, this would fetch data from a database
+    service = AnalyticsRollupService(db)
+    now = datetime.now(timezone.utc)
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    latest_campaigns = service.get_campaign_counts()
+    by_status = latest_campaigns[-1]["by_status"] if latest_campaigns else {}
+    totals = service.get_event_totals()
+    daily_activity = service.get_event_series("day", today - timedelta(days=days - 1))
+
     return {
-        "campaigns_active": 32,
-        "campaigns_pending": 5,
-        "users_total": 1250,
-        "cards_registered": 3210,
-        "recent_activity": [
-            {"type": "campaign_created", "timestamp": "2023-04-15T10:30:00Z"},
-            {"type": "user_registered", "timestamp": "2023-04-15T09:45:00Z"},
-            {"type": "card_added", "timestamp": "2023-04-15T08:30:00Z"}
-        ]
+        "campaigns_active": by_status.get("active", 0),
+        "campaigns_pending": by_status.get("pending", 0),
+        "users_total": totals["registrations"],
+        "cards_registered": totals["card_additions"],
+        "period_days": days,
+        "period_totals": {
+            metric: sum(day[metric] for day in daily_activity)
+            for metric in totals
+        },
+        "daily_activity": daily_activity,
+        "recent_activity": service.get_event_series("hour", now - timedelta(hours=24)),
+        "rolled_up_through": service.get_rolled_up_through()
     }
 
 @router.get("/campaign-stats")
 def get_campaign_stats(
     *,
+    db: Session = Depends(get_db),
     current_admin = Depends(get_current_admin_user),
+    days: int = Query(30, ge=1, le=365),
 ) -> Any:
     """
     Get campaign statistics for admin.
+
+    Current campaign counts by category, bank and status (category and bank
+    counts cover the active campaigns), and the daily history of the last
+    `days` days.
     """
-    # In a real app, this would fetch and aggregate data from a database
+    service = AnalyticsRollupService(db)
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    latest = service.get_campaign_counts()
+    current = latest[-1] if latest else {"bucket_start": None, "by_category": {}, "by_bank": {}, "by_status": {}}
+
     return {
-        "by_category": {
-            "dining": 15,
-            "shopping": 22,
-            "travel": 8,
-            "entertainment": 12
-        },
-        "by_bank": {
-            "Garanti BBVA": 18,
-            "Yapı Kredi": 14,
-            "İş Bankası": 12,
-            "Akbank": 10,
-            "Others": 5
-        },
-        "by_status": {
-            "active": 32,
-            "pending": 5,
-            "expired": 24
-        }
+        "as_of": current["bucket_start"],
+        "by_category": current["by_category"],
+        "by_bank": current["by_bank"],
+        "by_status": current["by_status"],
+        "history": service.get_campaign_counts("day", since=today - timedelta(days=days - 1))
     }
@@ -3,14 +3,19 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
 from sqlalchemy.orm import Session
 
 from app.db.base import get_db
-from app.models.campaign import Campaign, CampaignStatus, CampaignSource
+from app.models.campaign import Bank, Campaign, CampaignStatus, CampaignSource
+from app.services.bank_api_client import bank_api_client
+from app.services.campaign_sync_run_service import CampaignSyncRunService
 from app.services.campaign_sync_service import CampaignSyncService
 from app.schemas.campaign import (
     CampaignCreate, 
     CampaignUpdate, 
-    CampaignImportResponse,
+    CampaignSyncRunRead,
     PendingCampaignRead,
-    CampaignApproval
+    PendingCampaignPage,
+    CampaignApproval,
+    CampaignBulkApproval,
+    CampaignBulkReview
 )
 from app.api.v1.deps import get_current_admin_user
 
@@ -30,6 +35,29 @@ async def get_pending_campaigns(
     pending_campaigns = campaign_sync_service.get_pending_campaigns(skip=skip, limit=limit)
     return pending_campaigns
 
+@router.get("/pending/page", response_model=PendingCampaignPage)
+async def get_pending_campaigns_page(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    bank_id: Optional[int] = Query(None, description="Only campaigns of this bank"),
+    category_id: Optional[int] = Query(None, description="Only campaigns in this category"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    Get pending campaigns one page at a time, newest first
+    """
+    campaign_sync_service = CampaignSyncService(db)
+    try:
+        return campaign_sync_service.get_pending_campaigns_page(
+            limit=limit,
+            cursor=cursor,
+            bank_id=bank_id,
+            category_id=category_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/approve/{campaign_id}", response_model=CampaignApproval)
 async def approve_campaign(
     campaign_id: int = Path(..., description="The ID of the campaign to approve"),
@@ -74,35 +102,104 @@ async def reject_campaign(
     
     return result
 
-@router.post("/sync-banks", response_model=CampaignImportResponse)
-async def sync_campaigns_now(
+@router.post("/bulk-approve", response_model=CampaignBulkApproval)
+async def bulk_approve_campaigns(
+    selection: CampaignBulkReview = Body(...),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    Approve all pending campaigns matching the given IDs and/or filters
+    """
+    return _bulk_review(db, CampaignStatus.APPROVED, selection, current_user.id)
+
+@router.post("/bulk-reject", response_model=CampaignBulkApproval)
+async def bulk_reject_campaigns(
+    selection: CampaignBulkReview = Body(...),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin_user)
 ):
     """
-    Manually trigger the campaign sync process for all banks
+    Reject all pending campaigns matching the given IDs and/or filters
     """
+    return _bulk_review(db, CampaignStatus.REJECTED, selection, current_user.id)
+
+def _bulk_review(db: Session, status: CampaignStatus, selection: CampaignBulkReview, admin_id: int):
     campaign_sync_service = CampaignSyncService(db)
-    result = await campaign_sync_service.sync_all_banks()
-    
+    result = campaign_sync_service.bulk_review_campaigns(
+        status=status,
+        admin_id=admin_id,
+        review_notes=selection.notes,
+        campaign_ids=selection.campaign_ids,
+        bank_id=selection.bank_id,
+        category_id=selection.category_id,
+        created_from=selection.created_from,
+        created_to=selection.created_to
+    )
+
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["message"])
-    
+
     return result
 
-@router.post("/sync-bank/{bank_id}", response_model=CampaignImportResponse)
+@router.post("/sync-banks", response_model=CampaignSyncRunRead, status_code=202)
+async def sync_campaigns_now(
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    Queue a campaign sync of all banks
+
+    The sync runs in the campaign sync worker; poll /sync-runs/{run_id} for its progress.
+    """
+    return CampaignSyncRunService(db).enqueue(requested_by=current_user.id)
+
+@router.post("/sync-bank/{bank_id}", response_model=CampaignSyncRunRead, status_code=202)
 async def sync_bank_campaigns(
     bank_id: int = Path(..., description="The ID of the bank to sync campaigns from"),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_admin_user)
 ):
     """
-    Manually trigger the campaign sync process for a specific bank
+    Queue a campaign sync of a specific bank
     """
-    campaign_sync_service = CampaignSyncService(db)
-    result = await campaign_sync_service.sync_bank_campaigns(bank_id)
-    
-    if not result["success"]:
-        raise HTTPException(status_code=400, detail=result["message"])
-    
-    return result 
\ No newline at end of file
+    bank = db.query(Bank).filter(Bank.id == bank_id).first()
+    if not bank:
+        raise HTTPException(status_code=404, detail="Bank not found")
+
+    return CampaignSyncRunService(db).enqueue(bank_id=bank_id, requested_by=current_user.id)
+
+@router.get("/sync-runs", response_model=List[CampaignSyncRunRead])
+async def get_sync_runs(
+    bank_id: Optional[int] = Query(None, description="Only runs of this bank"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    Get the most recent campaign sync runs
+    """
+    return CampaignSyncRunService(db).list_recent(limit=limit, bank_id=bank_id)
+
+@router.get("/sync-runs/{run_id}", response_model=CampaignSyncRunRead)
+async def get_sync_run(
+    run_id: int = Path(..., description="The ID of the sync run"),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    Get the status and per-bank progress of a campaign sync run
+    """
+    run = CampaignSyncRunService(db).get(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="Sync run not found")
+    return run
+
+@router.get("/bank-api-stats")
+async def get_bank_api_stats(
+    current_user = Depends(get_current_admin_user)
+):
+    """
+    Get bank API latency, error counts and circuit breaker state per bank (this process only)
+    """
+    return bank_api_client.get_stats()
@@ -1,7 +1,7 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, or_
 from datetime import datetime
 from pydantic import BaseModel
 from app.db.base import get_db
@@ -61,8 +61,16 @@ def check_campaign_notification_eligibility(
         today = datetime.now().date()
         notification = db.query(NotificationHistory).filter(
             NotificationHistory.user_id == user_id,
-            NotificationHistory.campaign_id == campaign_id,
-            NotificationHistory.location_hash == location_hash,
+            or_(
+                and_(
+                    NotificationHistory.campaign_id == campaign_id,
+                    NotificationHistory.location_hash == location_hash
+                ),
+                # Digest pushes list every coalesced campaign with its own location
+                NotificationHistory.data.contains(
+                    {"campaignLocations": [{"campaignId": campaign_id, "locationHash": location_hash}]}
+                )
+            ),
             NotificationHistory.sent_date == today
         ).first()
         
@@ -381,12 +389,16 @@ async def notify_nearby_campaigns(
                 }
 
                 try:
-                    # Send notification
-                    result = await notification_service.send_notification(notification_payload, db)
+                    # Queue notification; it is pushed with the user's other
+                    # pending notifications once the digest window ends
+                    result = await notification_service.queue_notification(notification_payload)
                     if result.get('success'):
                         notification_sent = True
-                        print(f"✅ Notification sent successfully for campaign {campaign.id}")
+                        print(f"✅ Notification queued successfully for campaign {campaign.id}")
                         break  # Exit campaign loop after successful notification
+                    elif result.get('rate_limited'):
+                        print(f"❌ Notification rate limit reached for user {current_user.id}")
+                        return {"success": True, "message": "Notification rate limit reached"}
                     else:
                         print(f"❌ Failed to send notification: {result.get('message')}")
                 except Exception as e:
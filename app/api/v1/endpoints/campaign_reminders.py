@@ -7,6 +7,7 @@ from app.api import deps
 from app.models.campaign_reminder import CampaignReminder
 from app.schemas.campaign_reminder import CampaignReminderCreate, CampaignReminderResponse
 from app.services.reminder_service import ReminderService
+from app.services.reminder_scheduler import reminder_scheduler
 
 router = APIRouter()
 
@@ -48,4 +49,5 @@ def delete_reminder(
     # Soft delete - set is_active to False
     reminder.is_active = False
     db.commit()
+    reminder_scheduler.remove(reminder_id)
     return {"message": "Reminder deactivated successfully"} 
\ No newline at end of file
@@ -1,8 +1,8 @@
 from typing import Any, List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
 from sqlalchemy.orm import Session
 from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import text, inspect as sa_inspect
 import logging
 from sqlalchemy.sql import and_, or_
 
@@ -15,11 +15,19 @@ from app.schemas.campaign import (
     CampaignInDB,
     CampaignWithRelations,
     CampaignOut,
-    CampaignWithDetailsRead
+    CampaignWithDetailsRead,
+    CampaignChanges
 )
 from app.api.deps import get_current_active_user, get_current_active_superuser
 from app.models.user import User, user_credit_cards
 from app.core.enum_helpers import safely_get_enum
+from app.services.cache_invalidation import publish_invalidation
+from app.services.campaign_change_log import CampaignChangeLogService, ChangesPruned
+from app.services.campaign_pagination import count_campaigns, decode_cursor, keyset_page
+from app.services.campaign_search import CampaignSearchService
+from app.services.campaign_stats import CampaignStatsService
+from app.services.catalog_cache import catalog_response
+from app.services.catalog_snapshot import snapshot_response
 
 # Create the main router
 router = APIRouter()
@@ -44,102 +52,101 @@ def ensure_utf8(value):
     # Explicitly convert to string and ensure proper encoding
     return str(value)
 
-# Helper function to convert Campaign object to CampaignOut
+def _enum_member(value, enum_class, default):
+    """Enum member for a stored value, which may be the member itself or its (legacy) string form"""
+    if isinstance(value, str) and '.' in value:
+        # e.g. "CampaignSource.MANUAL" -> "MANUAL"
+        value = value.split('.')[-1]
+    return safely_get_enum(value, enum_class, default)
+
+# Campaign columns that are CampaignOut fields, copied into the output next to
+# the computed fields; internal columns (content hash, review notes, ...) stay out
+CAMPAIGN_COLUMNS = [
+    column.key for column in sa_inspect(Campaign).column_attrs
+    if column.key in CampaignOut.model_fields and not CampaignOut.model_fields[column.key].exclude
+    and not column.deferred
+]
+
+# Helper function to convert Campaign objects to CampaignOut
+def campaigns_to_campaign_out(campaigns: List[Campaign], db: Session) -> List[dict]:
+    """
+    Convert a page of Campaign objects to dictionaries matching CampaignOut schema
+
+    Related banks, cards, merchants and categories are loaded with one
+    IN query each for the whole page instead of per campaign.
+    """
+    if not campaigns:
+        return []
+
+    def lookup(*columns, ids):
+        ids = {id_ for id_ in ids if id_ is not None}
+        if not ids:
+            return {}
+        return {row[0]: row for row in db.query(*columns).filter(columns[0].in_(ids)).all()}
+
+    banks = lookup(Bank.id, Bank.name, ids=(c.bank_id for c in campaigns))
+    cards = lookup(CreditCard.id, CreditCard.name, CreditCard.application_url, ids=(c.card_id for c in campaigns))
+    merchants = lookup(Merchant.id, Merchant.name, ids=(c.merchant_id for c in campaigns))
+    categories = lookup(
+        CampaignCategory.id, CampaignCategory.enum, CampaignCategory.name,
+        ids=(c.category_id for c in campaigns)
+    )
+
+    results = []
+    for campaign in campaigns:
+        bank = banks.get(campaign.bank_id)
+        card = cards.get(campaign.card_id)
+        merchant = merchants.get(campaign.merchant_id)
+        category = categories.get(campaign.category_id)
+
+        result = {key: getattr(campaign, key) for key in CAMPAIGN_COLUMNS}
+        result.update({
+            "category": _enum_member(category.enum, CategoryEnum, CategoryEnum.OTHER) if category else CategoryEnum.OTHER,
+            "campaign_category_name": category.name if category else None,
+            "discount_type": _enum_member(campaign.discount_type, DiscountType, DiscountType.PERCENTAGE),
+            "source": _enum_member(campaign.source, CampaignSource, CampaignSource.MANUAL),
+            "status": _enum_member(campaign.status, CampaignStatus, CampaignStatus.APPROVED),
+            "discount_value": float(campaign.discount_value),
+            "min_amount": float(campaign.min_amount) if campaign.min_amount is not None else 0.0,
+            "max_discount": float(campaign.max_discount) if campaign.max_discount is not None else None,
+            "bank_name": bank.name if bank else None,
+            "card_name": card.name if card else None,
+            "merchant_name": merchant.name if merchant else None,
+            "credit_card_application_url": card.application_url if card else None
+        })
+        results.append(result)
+
+    return results
+
 def campaign_to_campaign_out(campaign: Campaign, db: Session) -> dict:
     """Convert a Campaign object to a dictionary matching CampaignOut schema"""
-    # Create a copy of the campaign data to avoid modifying the original
-    campaign_data = {}
-    
-    # Handle source field explicitly
-    if hasattr(campaign, 'source'):
-        source_str = str(campaign.source)
-        # Remove enum class name if present (e.g., "CampaignSource.MANUAL" -> "MANUAL")
-        if '.' in source_str:
-            source_str = source_str.split('.')[-1]
-        campaign_data['source'] = CampaignSource(source_str.upper() if source_str else "MANUAL")
-    else:
-        campaign_data['source'] = CampaignSource.MANUAL
-    
-    # Handle discount_type field
-    if hasattr(campaign, 'discount_type'):
-        discount_type_str = str(campaign.discount_type)
-        if '.' in discount_type_str:
-            discount_type_str = discount_type_str.split('.')[-1]
-        campaign_data['discount_type'] = DiscountType(discount_type_str.upper() if discount_type_str else "PERCENTAGE")
-    else:
-        campaign_data['discount_type'] = DiscountType.PERCENTAGE
-    
-    # Get category from database
-    category = None
-    if campaign.category_id:
-        category = db.query(CampaignCategory).filter(CampaignCategory.id == campaign.category_id).first()
-        if category:
-            campaign_data['category'] = CategoryEnum(category.enum)
-    if not category:
-        campaign_data['category'] = CategoryEnum.OTHER
-        
-    # Handle status field
-    if hasattr(campaign, 'status'):
-        status_str = str(campaign.status)
-        if '.' in status_str:
-            status_str = status_str.split('.')[-1]
-        campaign_data['status'] = CampaignStatus(status_str.upper() if status_str else "APPROVED")
-    else:
-        campaign_data['status'] = CampaignStatus.APPROVED
-    
-    # Get related data
-    bank = db.query(Bank).filter(Bank.id == campaign.bank_id).first()
-    card = db.query(CreditCard).filter(CreditCard.id == campaign.card_id).first()
-    merchant = None
-    if campaign.merchant_id:
-        merchant = db.query(Merchant).filter(Merchant.id == campaign.merchant_id).first()
-    
-    # Get category name
-    category_name = None
-    if campaign.category_id:
-        category = db.query(CampaignCategory).filter(CampaignCategory.id == campaign.category_id).first()
-        if category:
-            category_name = category.name
-    
-    # Create the output dictionary with all required fields
-    result = {
-        "id": campaign.id,
-        "name": campaign.name,
-        "description": campaign.description,
-        "bank_id": campaign.bank_id,
-        "card_id": campaign.card_id,
-        "category": campaign_data['category'],
-        "campaign_category_name": category_name,
-        "discount_type": campaign_data['discount_type'],
-        "source": campaign_data['source'],
-        "status": campaign_data['status'],
-        "discount_value": float(campaign.discount_value),
-        "min_amount": float(campaign.min_amount) if campaign.min_amount is not None else 0.0,
-        "max_discount": float(campaign.max_discount) if campaign.max_discount is not None else None,
-        "start_date": campaign.start_date,
-        "end_date": campaign.end_date,
-        "merchant_id": campaign.merchant_id,
-        "is_active": campaign.is_active,
-        "requires_enrollment": campaign.requires_enrollment,
-        "enrollment_url": campaign.enrollment_url,
-        "created_at": campaign.created_at,
-        "updated_at": campaign.updated_at,
-        "bank_name": bank.name if bank else None,
-        "card_name": card.name if card else None,
-        "merchant_name": merchant.name if merchant else None,
-        "credit_card_application_url": card.application_url if card else None
-    }
-    
-    # Copy over any other fields from campaign to result
-    # Use getattr to avoid AttributeError if the field doesn't exist
-    for key, value in vars(campaign).items():
-        if key not in result and not key.startswith('_'):
-            result[key] = value
-            
-    # Add debug logging
-    print(f"Processed campaign ID={campaign.id}, Source={result['source']}, Category={result['category']}")
-            
-    return result
+    return campaigns_to_campaign_out([campaign], db)[0]
+
+def parse_cursor(cursor: Optional[str]):
+    """Decode a listing cursor, answering 400 if it's malformed"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def paginate_campaigns(query, response: Response, limit: int, cursor=None, skip: int = 0, include_count: bool = False) -> List[Campaign]:
+    """
+    One page of a campaign listing, newest first
+
+    The next page's cursor goes out in the X-Next-Cursor header (absent on
+    the last page); pass it back as `cursor` to continue. With include_count
+    the cached or estimated total goes out in X-Total-Count.
+    """
+    campaigns, next_cursor = keyset_page(query, limit, cursor=cursor, skip=skip)
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    if include_count:
+        total, estimated = count_campaigns(query)
+        response.headers["X-Total-Count"] = str(total)
+        response.headers["X-Total-Count-Estimated"] = "true" if estimated else "false"
+    return campaigns
 
 # Static endpoints
 @static_endpoints.get("/test", response_model=dict)
@@ -154,33 +161,84 @@ def test_endpoint(
 
 @static_endpoints.get("/stats", response_model=dict)
 def get_campaign_stats(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get campaign statistics.
     """
-    total = db.query(Campaign).count()
-    active = db.query(Campaign).filter(Campaign.is_active == True).count()
-    
-    # Get campaigns expiring in the next 7 days
-    import datetime
-    now = datetime.datetime.now()
-    seven_days_later = now + datetime.timedelta(days=7)
-    expiring_soon = db.query(Campaign).filter(
-        Campaign.end_date >= now,
-        Campaign.end_date <= seven_days_later,
-        Campaign.is_active == True
-    ).count()
-    
-    return {
-        "total": total,
-        "active": active, 
-        "expiring_soon": expiring_soon
-    }
+    def build(response: Response):
+        summary = CampaignStatsService(db).get_summary()
+        return {
+            "total": summary["total"],
+            "active": summary["active"],
+            "expiring_soon": summary["expiring_soon"]
+        }
+
+    return catalog_response(request, db, build)
+
+@static_endpoints.get("/changes", response_model=CampaignChanges)
+def get_campaign_changes(
+    request: Request,
+    since: int = Query(..., ge=0, description="Catalog version the client last synced to"),
+    limit: int = Query(500, ge=1, le=2000),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor / next_cursor from the previous page"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Campaigns changed since a catalog version.
+
+    Returns the full records of added or updated campaigns and the IDs of
+    deleted or deactivated ones, so the app can update its local copy
+    instead of reloading the catalog. Store the returned `version` and pass
+    it as `since` on the next sync. Answers 410 when the changes are older
+    than the log keeps; the app should then reload the full catalog.
+    """
+    def build(response: Response):
+        service = CampaignChangeLogService(db)
+        try:
+            changes = service.get_changes(since, limit=limit, cursor=cursor)
+        except ChangesPruned as e:
+            raise HTTPException(status_code=410, detail=str(e))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        changes["changed"] = campaigns_to_campaign_out(changes["changed"], db)
+        return changes
+
+    return catalog_response(request, db, build, response_model=CampaignChanges)
+
+@static_endpoints.get(
+    "/snapshot",
+    response_class=Response,
+    responses={200: {"content": {"application/x-msgpack": {}}}, 304: {"description": "Snapshot unchanged"}}
+)
+def get_catalog_snapshot(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    The whole active campaign catalog as one compact binary snapshot.
+
+    A gzip-compressed, columnar MessagePack document of CampaignOut records
+    (see app.services.catalog_snapshot.encode_snapshot), built once per
+    catalog version. The app downloads it on a cold start or for offline
+    mode, then keeps up with /changes?since=<X-Catalog-Version>.
+    """
+    def build():
+        campaigns = db.query(Campaign).filter(
+            Campaign.is_active == True,
+            Campaign.end_date > datetime.now()
+        ).order_by(Campaign.id).all()
+        return campaigns_to_campaign_out(campaigns, db)
+
+    return snapshot_response(request, db, build)
 
 @static_endpoints.get("/categories", response_model=List[Dict[str, Any]])
 def get_campaign_categories(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
@@ -188,30 +246,33 @@ def get_campaign_categories(
     Get list of campaign categories with full details.
     Only returns categories that have active and not expired campaigns.
     """
-    try:
-        # Get categories that have active and not expired campaigns
-        current_time = datetime.utcnow()
-        categories = (
-            db.query(CampaignCategory)
-            .join(Campaign, Campaign.category_id == CampaignCategory.id)
-            .filter(Campaign.is_active == True)
-            .filter(Campaign.end_date >= current_time)
-            .distinct()
-            .order_by(CampaignCategory.name)
-            .all()
-        )
+    def build(response: Response):
+        try:
+            # Get categories that have active and not expired campaigns
+            current_time = datetime.utcnow()
+            categories = (
+                db.query(CampaignCategory)
+                .join(Campaign, Campaign.category_id == CampaignCategory.id)
+                .filter(Campaign.is_active == True)
+                .filter(Campaign.end_date >= current_time)
+                .distinct()
+                .order_by(CampaignCategory.name)
+                .all()
+            )
         
-        # Convert to response format
-        return [{
-            'id': category.id,
-            'name': category.name,
-            'enum': category.enum,
-            'icon_url': category.icon_url,
-            'color': category.color
-        } for category in categories]
-    except Exception as e:
-        logger.error(f"Error fetching campaign categories: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Error fetching campaign categories: {str(e)}")
+            # Convert to response format
+            return [{
+                'id': category.id,
+                'name': category.name,
+                'enum': category.enum,
+                'icon_url': category.icon_url,
+                'color': category.color
+            } for category in categories]
+        except Exception as e:
+            logger.error(f"Error fetching campaign categories: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Error fetching campaign categories: {str(e)}")
+
+    return catalog_response(request, db, build)
 
 @static_endpoints.get("/last-captured", response_model=Dict[str, Any])
 def get_last_captured_campaign(
@@ -259,6 +320,7 @@ def get_last_captured_campaign(
 
 @static_endpoints.get("/", response_model=List[Dict[str, Any]])
 def list_campaigns(
+    request: Request,
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -268,52 +330,61 @@ def list_campaigns(
     is_active: Optional[bool] = True,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
+    include_count: bool = Query(False, description="Send the (cached or estimated) total in X-Total-Count"),
 ) -> Any:
     """
     List campaigns with optional filters.
     """
-    try:
-        # Build the base query
-        query = db.query(Campaign).filter(Campaign.is_active == True)
-        
-        # Add filter conditions
-        if bank_id:
-            query = query.filter(Campaign.bank_id == bank_id)
+    keyset = parse_cursor(cursor)
+
+    def build(response: Response):
+        try:
+            # Build the base query
+            query = db.query(Campaign).filter(Campaign.is_active == True)
+        
+            # Add filter conditions
+            if bank_id:
+                query = query.filter(Campaign.bank_id == bank_id)
             
-        if card_id:
-            query = query.filter(Campaign.card_id == card_id)
+            if card_id:
+                query = query.filter(Campaign.card_id == card_id)
             
-        if category:
-            query = query.filter(Campaign.category == category)
+            if category:
+                query = query.filter(Campaign.category == category)
         
-        # Order and paginate
-        query = query.order_by(Campaign.created_at.desc())
-        total = query.count()
-        campaigns = query.offset(skip).limit(limit).all()
+            # Order and paginate
+            campaigns = paginate_campaigns(query, response, limit, keyset, skip, include_count)
         
-        # Convert to output format
-        results = [campaign_to_campaign_out(campaign, db) for campaign in campaigns]
+            # Convert to output format
+            results = campaigns_to_campaign_out(campaigns, db)
         
-        # Log the number of results
-        logger.info(f"Found {len(results)} campaigns matching filter criteria")
+            # Log the number of results
+            logger.info(f"Found {len(results)} campaigns matching filter criteria")
         
-        return results
+            return results
     
-    except Exception as e:
-        logger.error(f"Error fetching campaigns: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch campaigns: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error fetching campaigns: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to fetch campaigns: {str(e)}")
+
+    return catalog_response(request, db, build)
 
 @static_endpoints.get("/special", response_model=List[CampaignOut])
 def get_special_campaigns(
+    response: Response,
     skip: int = 0,
     limit: int = 20,
     category: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
+    include_count: bool = Query(False, description="Send the (cached or estimated) total in X-Total-Count"),
     current_user: User = Depends(get_current_active_user),
     db: Session = Depends(get_db),
 ) -> Any:
     """
     Get special campaigns matching user's active cards.
     """
+    keyset = parse_cursor(cursor)
     try:
         # Get user's active cards
         user_cards = (
@@ -349,11 +420,10 @@ def get_special_campaigns(
                 query = query.filter(Campaign.category_id == category_obj.id)
         
         # Order by created date and paginate
-        query = query.order_by(Campaign.created_at.desc())
-        campaigns = query.offset(skip).limit(limit).all()
+        campaigns = paginate_campaigns(query, response, limit, keyset, skip, include_count)
         
         # Convert to output format
-        return [campaign_to_campaign_out(campaign, db) for campaign in campaigns]
+        return campaigns_to_campaign_out(campaigns, db)
         
     except Exception as e:
         logger.error(f"Error fetching special campaigns: {str(e)}")
@@ -361,83 +431,61 @@ def get_special_campaigns(
 
 @static_endpoints.get("/category/{category_id}", response_model=List[CampaignOut])
 def get_campaigns_by_category(
+    request: Request,
     category_id: int,
     skip: int = 0, 
     limit: int = 10,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
+    include_count: bool = Query(False, description="Send the (cached or estimated) total in X-Total-Count"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get campaigns by category ID.
     """
-    try:
-        # Get current time for filtering expired campaigns
-        current_time = datetime.utcnow()
-        
-        # Query campaigns with category ID and not expired
-        campaigns = db.query(Campaign)\
-            .filter(Campaign.is_active == True)\
-            .filter(Campaign.category_id == category_id)\
-            .filter(Campaign.end_date >= current_time)\
-            .order_by(Campaign.created_at.desc())\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+    keyset = parse_cursor(cursor)
+
+    def build(response: Response):
+        try:
+            # Get current time for filtering expired campaigns
+            current_time = datetime.utcnow()
+        
+            # Query campaigns with category ID and not expired
+            query = db.query(Campaign)\
+                .filter(Campaign.is_active == True)\
+                .filter(Campaign.category_id == category_id)\
+                .filter(Campaign.end_date >= current_time)
+            campaigns = paginate_campaigns(query, response, limit, keyset, skip, include_count)
             
-        # Convert to output format using campaign_to_campaign_out
-        results = [campaign_to_campaign_out(campaign, db) for campaign in campaigns]
+            # Convert to output format
+            results = campaigns_to_campaign_out(campaigns, db)
         
-        return results
+            return results
         
-    except Exception as e:
-        logger.error(f"Error fetching campaigns by category: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error fetching campaigns by category: {str(e)}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return catalog_response(request, db, build, response_model=List[CampaignOut])
 
 @static_endpoints.get("/search", response_model=List[Dict[str, Any]])
 def search_campaigns(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
-    q: str = Query(..., description="Search query for campaign name or description"),
+    q: str = Query(..., description="Search query; matches campaign, bank, card and merchant names and descriptions"),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """
-    Search campaigns by name or description with case-insensitive matching.
+    Search active campaigns, best matches first.
+    Every word must match, as a prefix, ignoring case and Turkish letters.
     """
     try:
-        # Get current time
-        now = datetime.now()
-        
-        # Build the search query
-        search_query = db.query(Campaign).filter(
-            Campaign.is_active == True,
-            Campaign.start_date <= now,
-            Campaign.end_date > now
-        )
-        
-        # Add case-insensitive search conditions
-        search_terms = q.split()  # Split query into words
-        for term in search_terms:
-            search_term = f"%{term}%"
-            search_query = search_query.filter(
-                or_(
-                    Campaign.name.ilike(search_term),
-                    Campaign.description.ilike(search_term)
-                )
-            )
-        
-        # Apply pagination
-        total = search_query.count()
-        campaigns = search_query.offset(skip).limit(limit).all()
+        campaigns = CampaignSearchService(db).search(q, skip=skip, limit=limit)
         
         # Convert campaigns to dictionary format
-        result = []
-        for campaign in campaigns:
-            campaign_dict = campaign_to_campaign_out(campaign, db)
-            result.append(campaign_dict)
-        
-        return result
+        return campaigns_to_campaign_out(campaigns, db)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -447,41 +495,47 @@ def search_campaigns(
 # Dynamic endpoints
 @dynamic_endpoints.get("/category/{category}", response_model=List[CampaignOut])
 def get_campaigns_by_category(
+    request: Request,
     category: str,
     skip: int = 0, 
     limit: int = 10,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
+    include_count: bool = Query(False, description="Send the (cached or estimated) total in X-Total-Count"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
     Get campaigns by category.
     """
-    try:
-        # Get category ID from enum value
-        category_obj = db.query(CampaignCategory).filter(CampaignCategory.enum == category.upper()).first()
-        if not category_obj:
-            return []
+    keyset = parse_cursor(cursor)
+
+    def build(response: Response):
+        try:
+            # Get category ID from enum value
+            category_obj = db.query(CampaignCategory).filter(CampaignCategory.enum == category.upper()).first()
+            if not category_obj:
+                return []
             
-        # Query campaigns with category ID
-        campaigns = db.query(Campaign)\
-            .filter(Campaign.is_active == True)\
-            .filter(Campaign.category_id == category_obj.id)\
-            .order_by(Campaign.created_at.desc())\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+            # Query campaigns with category ID
+            query = db.query(Campaign)\
+                .filter(Campaign.is_active == True)\
+                .filter(Campaign.category_id == category_obj.id)
+            campaigns = paginate_campaigns(query, response, limit, keyset, skip, include_count)
             
-        # Convert to output format using campaign_to_campaign_out
-        results = [campaign_to_campaign_out(campaign, db) for campaign in campaigns]
+            # Convert to output format
+            results = campaigns_to_campaign_out(campaigns, db)
         
-        return results
+            return results
         
-    except Exception as e:
-        logger.error(f"Error fetching campaigns by category: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        except Exception as e:
+            logger.error(f"Error fetching campaigns by category: {str(e)}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return catalog_response(request, db, build, response_model=List[CampaignOut])
 
 @dynamic_endpoints.get("/{campaign_id}", response_model=Dict[str, Any])
 def get_campaign(
+    request: Request,
     *,
     db: Session = Depends(get_db),
     campaign_id: int = Path(..., gt=0),
@@ -489,22 +543,23 @@ def get_campaign(
     """
     Get a specific campaign by ID.
     """
-    try:
-        # Get campaign with basic details
-        campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
-        if not campaign:
-            raise HTTPException(status_code=404, detail="Campaign not found")
+    def build(response: Response):
+        try:
+            # Get campaign with basic details
+            campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
+            if not campaign:
+                raise HTTPException(status_code=404, detail="Campaign not found")
             
-        # Convert to output format using campaign_to_campaign_out helper
-        response = campaign_to_campaign_out(campaign, db)
-        
-        return response
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error fetching campaign {campaign_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch campaign: {str(e)}")
+            # Convert to output format using campaign_to_campaign_out helper
+            return campaign_to_campaign_out(campaign, db)
+        
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error fetching campaign {campaign_id}: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to fetch campaign: {str(e)}")
+
+    return catalog_response(request, db, build)
 
 @dynamic_endpoints.post("/", response_model=CampaignInDB)
 def create_campaign(
@@ -534,6 +589,8 @@ def create_campaign(
     # Create campaign
     campaign = Campaign(**campaign_in.dict())
     db.add(campaign)
+    db.flush()
+    publish_invalidation(db, "campaign", [campaign.id])
     db.commit()
     db.refresh(campaign)
     return campaign
@@ -557,6 +614,7 @@ def update_campaign(
     for field, value in update_data.items():
         setattr(campaign, field, value)
     
+    publish_invalidation(db, "campaign", [campaign.id])
     db.commit()
     db.refresh(campaign)
     return campaign
@@ -578,43 +636,51 @@ def delete_campaign(
     
     # Soft delete
     campaign.is_active = False
+    publish_invalidation(db, "campaign", [campaign.id])
     db.commit()
     
     return {"success": True, "message": "Campaign deactivated successfully"}
 
 @static_endpoints.get("/active", response_model=List[Dict[str, Any]])
 def get_active_campaigns(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
+    include_count: bool = Query(False, description="Send the (cached or estimated) total in X-Total-Count"),
 ):
     """
     Get active campaigns that have not expired.
     """
-    try:
-        # Get current time
-        now = datetime.now()
+    keyset = parse_cursor(cursor)
+
+    def build(response: Response):
+        try:
+            # Get current time
+            now = datetime.now()
         
-        # Query active campaigns with date validations
-        query = db.query(Campaign).filter(
-            Campaign.is_active == True,
-            Campaign.start_date <= now,
-            Campaign.end_date > now
-        )
+            # Query active campaigns with date validations
+            query = db.query(Campaign).filter(
+                Campaign.is_active == True,
+                Campaign.start_date <= now,
+                Campaign.end_date > now
+            )
         
-        # Order by created date and paginate
-        query = query.order_by(Campaign.created_at.desc())
-        campaigns = query.offset(skip).limit(limit).all()
+            # Order by created date and paginate
+            campaigns = paginate_campaigns(query, response, limit, keyset, skip, include_count)
         
-        # Convert to output format
-        results = [campaign_to_campaign_out(campaign, db) for campaign in campaigns]
+            # Convert to output format
+            results = campaigns_to_campaign_out(campaigns, db)
         
-        return results
+            return results
         
-    except Exception as e:
-        logger.error(f"Error fetching active campaigns: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch active campaigns: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error fetching active campaigns: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Failed to fetch active campaigns: {str(e)}")
+
+    return catalog_response(request, db, build)
 
 # Include the sub-routers in the main router
 # Static endpoints must be included first
@@ -1,19 +1,266 @@
-from fastapi import APIRouter, Body
-from typing import Dict, Any
+from fastapi import APIRouter, Body, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta, timezone
+from email.utils import format_datetime
+import asyncio
+import hashlib
+import json
+import math
+import random
 import uuid
 
 # Create a router for the mock bank API
 router = APIRouter()
 
+# Simulator control and campaign feed; process-wide and unauthenticated, so
+# only mounted by the standalone app from create_mock_bank_app
+simulator_router = APIRouter()
+
+
+class BankSimulatorConfig(BaseModel):
+    """
+    Behaviour of the simulated bank
+
+    The campaign feed is a pure function of (seed, campaign_count, rates, day),
+    so every sync against the same configuration sees the same data.
+    """
+    seed: int = 1
+    campaign_count: int = 1000  # Campaigns live on day 0
+    daily_change_rate: float = 0.05  # Share of live campaigns updated per day
+    daily_delete_rate: float = 0.005  # Share of live campaigns deleted per day
+    daily_new_rate: float = 0.005  # New campaigns per day, as a share of campaign_count
+    page_size: int = 500
+    day: Optional[int] = None  # Simulated day; defaults to days since epoch_date
+    epoch_date: date = date(2025, 1, 1)
+    latency_ms: float = 0  # Added to every response
+    latency_jitter_ms: float = 0
+    error_rate: float = 0  # Share of requests answered with 503
+    hang_rate: float = 0  # Share of requests that stall for hang_seconds
+    hang_seconds: float = 30
+
+
+simulator_config = BankSimulatorConfig()
+
+# Settings that change how responses arrive but not what the feed contains
+NETWORK_CONDITION_FIELDS = {"latency_ms", "latency_jitter_ms", "error_rate", "hang_rate", "hang_seconds"}
+
+CATEGORIES = ["electronics", "fashion", "grocery", "travel", "dining", "fuel", "movie", "other"]
+DISCOUNT_TYPES = ["percentage", "cashback", "points", "installment"]
+
+
+def _unit(*parts: Any) -> float:
+    """Deterministic pseudo-random number in [0, 1) for the given parts"""
+    digest = hashlib.blake2b(":".join(str(part) for part in parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+
+class MockBankFeed:
+    """Deterministic campaign catalog of the simulated bank"""
+
+    def __init__(self, config: BankSimulatorConfig):
+        self.config = config
+        self.new_per_day = max(0, round(config.campaign_count * config.daily_new_rate))
+
+    def current_day(self) -> int:
+        if self.config.day is not None:
+            return self.config.day
+        return max(0, (date.today() - self.config.epoch_date).days)
+
+    def universe_size(self, day: int) -> int:
+        """Number of campaign IDs created up to the given day"""
+        return self.config.campaign_count + day * self.new_per_day
+
+    def born_day(self, index: int) -> int:
+        if index < self.config.campaign_count:
+            return 0
+        return 1 + (index - self.config.campaign_count) // self.new_per_day
+
+    def deleted_day(self, index: int) -> float:
+        """Day the campaign is deleted on (geometric lifetime), or infinity"""
+        rate = self.config.daily_delete_rate
+        if rate <= 0:
+            return math.inf
+        if rate >= 1:
+            return self.born_day(index) + 1
+        u = _unit(self.config.seed, index, "delete") or 1e-12
+        return self.born_day(index) + 1 + math.floor(math.log(u) / math.log(1 - rate))
+
+    def last_change_day(self, index: int, day: int) -> int:
+        """Most recent day up to `day` on which the campaign was created or updated"""
+        born = self.born_day(index)
+        rate = self.config.daily_change_rate
+        if rate > 0:
+            for candidate in range(day, born, -1):
+                if _unit(self.config.seed, index, candidate) < rate:
+                    return candidate
+        return born
+
+    def campaign(self, index: int, version: int) -> Dict[str, Any]:
+        seed = self.config.seed
+        start = self.config.epoch_date + timedelta(days=self.born_day(index))
+        category = CATEGORIES[int(_unit(seed, index, "category") * len(CATEGORIES))]
+        discount_type = DISCOUNT_TYPES[int(_unit(seed, index, "type") * len(DISCOUNT_TYPES))]
+        return {
+            "external_id": f"SIM-{seed}-{index}",
+            "name": f"Simulated campaign {index}",
+            "description": f"Campaign {index}, revision {version}",
+            "category": category,
+            "discount_type": discount_type,
+            "discount_value": round(5 + _unit(seed, index, version, "value") * 45, 2),
+            "min_amount": round(_unit(seed, index, "min") * 500, 2),
+            "max_discount": round(100 + _unit(seed, index, version, "max") * 900, 2),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=30 + int(_unit(seed, index, "length") * 335))).isoformat(),
+            "is_active": True,
+            "requires_enrollment": _unit(seed, index, "enroll") < 0.2,
+            "enrollment_url": None
+        }
+
+    def page(
+        self,
+        day: int,
+        start: int = 0,
+        since: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], List[str], Optional[int]]:
+        """
+        One page of the feed, scanning the campaign ID space from `start`
+
+        Returns the page's campaigns, its tombstones and where the next page
+        starts (None on the last page). Delta pages skip unchanged campaigns,
+        so only changes are transferred.
+        """
+        size = self.config.page_size
+        end = self.universe_size(day)
+        campaigns, deleted = [], []
+        index = start
+
+        while index < end and len(campaigns) + len(deleted) < size:
+            deleted_on = self.deleted_day(index)
+            if deleted_on <= day:
+                # Only tombstone campaigns the client may have seen
+                if since is not None and self.born_day(index) <= since < deleted_on:
+                    deleted.append(f"SIM-{self.config.seed}-{index}")
+            else:
+                changed = self.last_change_day(index, day)
+                if since is None or changed > since:
+                    campaigns.append(self.campaign(index, changed))
+            index += 1
+
+        return campaigns, deleted, index if index < end else None
+
+    def iter_all(self, day: int) -> Iterator[Dict[str, Any]]:
+        start = 0
+        while start is not None:
+            campaigns, _, start = self.page(day, start)
+            yield from campaigns
+
+
+async def _simulate_conditions(config: BankSimulatorConfig) -> None:
+    """Apply the configured latency, hangs and errors to a request"""
+    delay = config.latency_ms + random.uniform(-1, 1) * config.latency_jitter_ms
+    if delay > 0:
+        await asyncio.sleep(delay / 1000)
+    if config.hang_rate and random.random() < config.hang_rate:
+        await asyncio.sleep(config.hang_seconds)
+    if config.error_rate and random.random() < config.error_rate:
+        raise HTTPException(status_code=503, detail="Simulated bank outage")
+
+
+@simulator_router.get("/simulator/config", response_model=BankSimulatorConfig)
+async def get_simulator_config() -> BankSimulatorConfig:
+    """Current configuration of the simulated bank"""
+    return simulator_config
+
+
+@simulator_router.put("/simulator/config", response_model=BankSimulatorConfig)
+async def update_simulator_config(config: BankSimulatorConfig = Body(...)) -> BankSimulatorConfig:
+    """Reconfigure the simulated bank, e.g. between load test runs"""
+    global simulator_config
+    simulator_config = config
+    return simulator_config
+
+
+@simulator_router.get("/campaigns/feed")
+async def mock_campaign_feed(
+    request: Request,
+    page: int = Query(0, ge=0, description="Campaign index the page starts at, from next_page"),
+    since: Optional[str] = Query(None, description="Delta cursor from a previous sync"),
+    format: str = Query("envelope", pattern="^(envelope|array|ndjson)$"),
+    day: Optional[int] = Query(None, description="Override the simulated day")
+):
+    """
+    Mock campaign feed
+
+    - envelope (default): pages of {"campaigns", "deleted", "next_page", "next_cursor"};
+      with `since`, only campaigns changed after the cursor plus tombstones
+    - array / ndjson: the full feed in one streamed response
+    Answers 304 when If-None-Match matches the current ETag.
+    """
+    config = simulator_config
+    await _simulate_conditions(config)
+
+    feed = MockBankFeed(config)
+    current_day = feed.current_day() if day is None else day
+    since_day = None
+    if since:
+        try:
+            since_day = int(since.lstrip("d"))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    # The ETag names the catalog version, so a client that already has it gets a 304;
+    # it covers every setting that shapes the feed, not the network conditions
+    content = config.model_dump(mode="json", exclude=NETWORK_CONDITION_FIELDS | {"day"})
+    etag = '"%s-%d"' % (
+        hashlib.blake2b(json.dumps(content, sort_keys=True).encode(), digest_size=8).hexdigest(),
+        current_day
+    )
+    last_modified = datetime.combine(config.epoch_date + timedelta(days=current_day), time.min, tzinfo=timezone.utc)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True)
+    }
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    if format == "array":
+        def generate_array():
+            yield "["
+            for position, campaign in enumerate(feed.iter_all(current_day)):
+                yield ("," if position else "") + json.dumps(campaign)
+            yield "]"
+        return StreamingResponse(generate_array(), media_type="application/json", headers=headers)
+
+    if format == "ndjson":
+        def generate_lines():
+            for campaign in feed.iter_all(current_day):
+                yield json.dumps(campaign) + "\n"
+        return StreamingResponse(generate_lines(), media_type="application/x-ndjson", headers=headers)
+
+    campaigns, deleted, next_page = feed.page(current_day, page, since=since_day)
+    body = {
+        "campaigns": campaigns,
+        "deleted": deleted,
+        "next_cursor": f"d{current_day}"
+    }
+    if next_page is not None:
+        body["next_page"] = next_page
+    return JSONResponse(body, headers=headers)
+
+
 @router.post("/campaigns/enroll")
 async def mock_enroll_in_campaign(data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
     """
     Mock endpoint for bank campaign enrollment
     This simulates what a real bank API would return when enrolling in a campaign
     """
+    await _simulate_conditions(simulator_config)
+
     # Generate a unique enrollment ID
     enrollment_id = str(uuid.uuid4())
-    
+
     return {
         "success": True,
         "message": "Enrollment successful",
@@ -28,9 +275,28 @@ async def mock_check_enrollment_status(enrollment_id: str) -> Dict[str, Any]:
     Mock endpoint for checking campaign enrollment status
     This simulates what a real bank API would return when checking enrollment status
     """
+    await _simulate_conditions(simulator_config)
+
     return {
         "success": True,
         "status": "approved",
         "message": "Enrollment is active",
         "expiry": "2025-12-31T23:59:59"
-    } 
\ No newline at end of file
+    }
+
+
+def create_mock_bank_app(config: Optional[BankSimulatorConfig] = None) -> FastAPI:
+    """
+    Standalone simulated bank, for benchmarks against a local port:
+
+        uvicorn app.api.v1.endpoints.mock_bank_api:create_mock_bank_app --factory --port 9000
+
+    Point a bank's api_base_url at it and set campaign_sync_endpoint to /campaigns/feed.
+    """
+    global simulator_config
+    if config is not None:
+        simulator_config = config
+    app = FastAPI(title="Mock Bank API")
+    app.include_router(router)
+    app.include_router(simulator_router)
+    return app
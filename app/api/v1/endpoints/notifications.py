@@ -42,9 +42,12 @@ async def send_notification(
     - campaignId: Campaign ID (optional)
     - fcm_token: Firebase Cloud Messaging token
     - type: Notification type (e.g., NEARBY_CAMPAIGN)
+    
+    Notifications for a user are coalesced into a digest push and
+    subject to the per-user hourly and daily caps.
     """
     notification_service = NotificationService()
-    result = await notification_service.send_notification(notification, db)
+    result = await notification_service.queue_notification(notification)
     return result
 
 @router.get("/history", response_model=PaginatedNotificationResponse)
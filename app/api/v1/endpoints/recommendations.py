@@ -16,7 +16,7 @@ from app.models.campaign import Campaign, CampaignSource
 from app.schemas.campaign import CampaignOut
 from app.api.deps import get_current_active_user
 from app.models.user import User
-from app.api.v1.endpoints.campaigns import campaign_to_campaign_out
+from app.api.v1.endpoints.campaigns import campaigns_to_campaign_out
 import random
 
 router = APIRouter()
@@ -94,15 +94,12 @@ def get_recommended_campaigns(
         if not campaigns:
             return []
             
-        # Convert campaigns to output format using campaign_to_campaign_out
-        campaign_outs = []
-        for campaign in campaigns:
-            campaign_out = campaign_to_campaign_out(campaign, db)
-            campaign_outs.append(campaign_out)
-            
         # Apply random sampling if needed
-        if len(campaign_outs) > limit:
-            campaign_outs = random.sample(campaign_outs, limit)
+        if len(campaigns) > limit:
+            campaigns = random.sample(campaigns, limit)
+            
+        # Convert the sampled campaigns to output format
+        campaign_outs = campaigns_to_campaign_out(campaigns, db)
             
         print(f"Returning {len(campaign_outs)} recommended campaigns")
         return campaign_outs
@@ -12,12 +12,70 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
     ALGORITHM: str = "HS256"  # Algorithm for JWT
     
+    # Encryption of stored bank API credentials
+    PREVIOUS_SECRET_KEYS: List[str] = []  # Older secret keys, still accepted when decrypting stored data
+    BANK_CREDENTIAL_CACHE_TTL_SECONDS: int = 300  # How long decrypted bank API credentials are kept in memory
+    
     # Frontend URL
     FRONTEND_URL: str = "payviya://reset-password"  # Mobile app deep link scheme for development
     
     # Firebase
     FIREBASE_CREDENTIALS_PATH: str = "firebase-service-account.json"
-    
+
+    # Notification history partitions (monthly, on sent_date)
+    NOTIFICATION_HISTORY_RETENTION_MONTHS: int = 6  # Older partitions are rolled up and dropped
+    NOTIFICATION_HISTORY_PARTITIONS_AHEAD: int = 3  # Future partitions kept ready for inserts
+
+    # Notification digest and per-user push caps
+    NOTIFICATION_DIGEST_WINDOW_SECONDS: int = 30  # Notifications queued within this window become one push
+    NOTIFICATION_HOURLY_CAP: int = 3
+    NOTIFICATION_DAILY_CAP: int = 10
+
+    # Reminder scheduler
+    REMINDER_SCHEDULER_HORIZON_MINUTES: int = 60  # Reminders due within this window are kept in memory
+    REMINDER_SCHEDULER_REFRESH_MINUTES: int = 5  # How often the in-memory schedule is rebuilt
+    REMINDER_CLAIM_LEASE_SECONDS: int = 300  # Claims older than this are released to other workers
+    REMINDER_SWEEP_MINUTES: int = 1  # Fallback sweep for due reminders the scheduler missed, failed or lost
+    REMINDER_CLAIM_BATCH_SIZE: int = 500  # Max reminders claimed per dispatch
+    REMINDER_DELIVERY_CONCURRENCY: int = 50  # Max FCM sends in flight; sizes the FCM send thread pool
+
+    # Bank API client
+    BANK_API_TIMEOUT_SECONDS: float = 10  # Total time per call; campaign feed streams only bound each read
+    BANK_API_CONNECT_TIMEOUT_SECONDS: float = 3
+    BANK_API_POOL_SIZE: int = 20  # Max open connections per bank
+    BANK_API_KEEPALIVE_SECONDS: float = 30
+    BANK_API_MAX_RETRIES: int = 2  # Retries for idempotent calls only
+    BANK_API_RETRY_BACKOFF_SECONDS: float = 0.5  # Base of the jittered exponential backoff
+    BANK_API_CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive failures before a bank's circuit opens
+    BANK_API_CIRCUIT_RESET_SECONDS: float = 30  # How long an open circuit rejects calls
+
+    # Campaign sync
+    CAMPAIGN_SYNC_CONCURRENCY: int = 5  # Max banks synced at the same time
+    CAMPAIGN_SYNC_BANK_TIMEOUT_SECONDS: int = 120  # A bank taking longer is reported as failed
+    CAMPAIGN_SYNC_INTERVAL_MINUTES: Optional[int] = None  # e.g. 60 for hourly delta syncs; unset runs nightly at 02:00
+    CAMPAIGN_SYNC_UPSERT_CHUNK_SIZE: int = 1000  # Imported campaigns per INSERT or UPDATE statement
+    CAMPAIGN_SYNC_STREAM_CHUNK_SIZE: int = 1000  # Streamed campaigns handed to the import pipeline at a time
+    CAMPAIGN_SYNC_MAX_PAGES: int = 10000  # Guard against feeds whose next links never end
+    CAMPAIGN_SYNC_WORKER_POLL_SECONDS: int = 10  # How often an idle sync worker checks for queued runs
+    CAMPAIGN_SYNC_RUN_HEARTBEAT_SECONDS: int = 30  # Heartbeat interval of a running sync run
+    CAMPAIGN_SYNC_RUN_LEASE_SECONDS: int = 600  # A running run without heartbeats for this long is failed
+    CAMPAIGN_COUNT_CACHE_TTL_SECONDS: int = 60  # How long listing counts are reused
+    CAMPAIGN_COUNT_CACHE_SIZE: int = 1024  # Listing counts kept per process
+    CAMPAIGN_COUNT_EXACT_LIMIT: int = 10000  # Listings expected to match more campaigns get an estimated count
+
+    # Catalog response cache
+    CATALOG_RESPONSE_CACHE_SIZE: int = 1024  # Rendered responses kept per process
+    CATALOG_CACHE_TIME_BUCKET_SECONDS: int = 60  # Max reuse of listings that filter on the current time
+    CAMPAIGN_CHANGE_LOG_RETENTION_DAYS: int = 30  # Clients that haven't synced for longer reload the catalog
+    CAMPAIGN_LIFECYCLE_SWEEP_MINUTES: int = 5  # Catch-up sweep for boundaries added since the next one was scheduled
+    CACHE_INVALIDATION_ENABLED: bool = True  # Listen for cache invalidations from other processes
+    CACHE_INVALIDATION_POLL_SECONDS: int = 30  # Liveness check interval of an idle invalidation listener
+
+    # Analytics rollups
+    ANALYTICS_ROLLUP_INTERVAL_MINUTES: int = 15  # How often the rollup job runs
+    ANALYTICS_ROLLUP_LAG_MINUTES: int = 60  # Window recounted on every run, for rows that commit late
+    ANALYTICS_HOURLY_RETENTION_DAYS: int = 30  # Hourly rows are dropped after this; daily rows are kept
+
     # SMTP Settings for Mailtrap
     SMTP_HOST: str = "smtp.mailtrap.io"
     SMTP_PORT: int = 587  # TLS port
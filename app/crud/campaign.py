@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from app.crud.base import CRUDBase
 from app.models.campaign import Campaign
 from app.schemas.campaign import CampaignCreate, CampaignUpdate
+from app.services.cache_invalidation import publish_invalidation
 
 
 class CRUDCampaign(CRUDBase[Campaign, CampaignCreate, CampaignUpdate]):
@@ -30,6 +31,8 @@ class CRUDCampaign(CRUDBase[Campaign, CampaignCreate, CampaignUpdate]):
             priority=obj_in.priority
         )
         db.add(db_obj)
+        db.flush()
+        publish_invalidation(db, "campaign", [db_obj.id])
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -42,7 +45,10 @@ class CRUDCampaign(CRUDBase[Campaign, CampaignCreate, CampaignUpdate]):
         else:
             update_data = obj_in.dict(exclude_unset=True)
         
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+        db_obj = super().update(db, db_obj=db_obj, obj_in=update_data)
+        publish_invalidation(db, "campaign", [db_obj.id])
+        db.commit()
+        return db_obj
 
 
 campaign = CRUDCampaign(Campaign) 
\ No newline at end of file
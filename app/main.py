@@ -21,7 +21,15 @@ sys.path.append(os.path.dirname(parent_dir))
 from app.api.v1.router import api_router
 from app.models.campaign import CampaignSource
 from app.core.config import settings
-from app.tasks.reminder_notifications import send_reminder_notifications
+from app.tasks.reminder_notifications import schedule_reminder_notifications
+from app.services.reminder_scheduler import reminder_scheduler
+from app.tasks.notification_retention_task import schedule_notification_retention
+from app.tasks.campaign_change_log_task import schedule_campaign_change_log_retention
+from app.tasks.analytics_rollup_task import schedule_analytics_rollup
+from app.tasks.campaign_lifecycle_task import schedule_campaign_lifecycle
+from app.tasks.credential_rotation_task import schedule_credential_rotation
+from app.services.cache_invalidation import invalidation_bus
+from app.services.bank_api_client import bank_api_client
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
@@ -48,7 +56,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all methods
     allow_headers=["*"],  # Allow all headers
-    expose_headers=["Content-Length", "Content-Type", "Authorization"],
+    expose_headers=["Content-Length", "Content-Type", "Authorization", "X-Next-Cursor", "X-Total-Count", "X-Total-Count-Estimated", "ETag", "X-Catalog-Version"],
     max_age=86400,  # Cache preflight requests for 24 hours
 )
 
@@ -67,26 +75,32 @@ async def startup_event():
     # Configure scheduler with proper async handling
     scheduler.configure(timezone=pytz.UTC)
     
-    # Schedule reminder notification task (every 5 minutes)
-    scheduler.add_job(
-        send_reminder_notifications,
-        'interval',
-        minutes=5,
-        name='reminder_notifications',
-        misfire_grace_time=300  # Allow job to be late by up to 5 minutes
-    )
+    # Start the reminder scheduler; it dispatches reminders as they become due
+    # and is rebuilt from the database periodically
+    schedule_reminder_notifications(scheduler)
     
-    # Add immediate run of reminder notifications
-    scheduler.add_job(
-        send_reminder_notifications,
-        'date',
-        run_date=datetime.utcnow(),
-        name='immediate_reminder_check'
-    )
+    # Keep notification history partitions created and expired ones rolled up
+    schedule_notification_retention(scheduler)
+    
+    # Prune campaign change log entries older than the delta-sync window
+    schedule_campaign_change_log_retention(scheduler)
+    
+    # Keep the admin dashboard's analytics rollups up to date
+    schedule_analytics_rollup(scheduler)
+    
+    # Deactivate campaigns as they expire and refresh caches as they start
+    schedule_campaign_lifecycle(scheduler)
+    
+    # Re-encrypt bank credentials still stored under a previous secret key
+    schedule_credential_rotation(scheduler)
     
     # Start the scheduler
     scheduler.start()
     
+    # Evict local caches when other processes write campaign data
+    if settings.CACHE_INVALIDATION_ENABLED:
+        invalidation_bus.start()
+    
     logger.info("Application startup complete")
 
 @app.on_event("shutdown")
@@ -96,6 +110,9 @@ async def shutdown_event():
     
     # Shutdown scheduler gracefully
     scheduler.shutdown(wait=False)
+    reminder_scheduler.stop()
+    invalidation_bus.stop()
+    await bank_api_client.close()
     
     # Close any remaining event loops
     try:
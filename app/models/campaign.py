@@ -1,9 +1,11 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, Text, ForeignKey, DateTime, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, BigInteger, Integer, SmallInteger, String, Float, Boolean, Text, ForeignKey, DateTime, Enum, Index, event
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func, text
 
 from app.db.base import Base
-from app.models.enums import DiscountType, CampaignSource, CampaignStatus
+from app.models.enums import DiscountType, CampaignSource, CampaignStatus, CampaignSyncRunStatus
+from app.utils.crypto import invalidate_bank_credentials
 
 
 class CampaignCategory(Base):
@@ -24,6 +26,27 @@ class CampaignCategory(Base):
 
 class Campaign(Base):
     __tablename__ = "campaigns"
+    __table_args__ = (
+        # Conflict target for the bank sync upsert
+        Index("uq_campaigns_bank_external_source", "bank_id", "external_id", "source", unique=True),
+        # Keyset pagination of the admin review queue
+        Index(
+            "idx_campaigns_pending_created",
+            text("created_at DESC"), text("id DESC"),
+            postgresql_where=text("status = 'PENDING'")
+        ),
+        Index("idx_campaigns_search_vector", "search_vector", postgresql_using="gin"),
+        # Keyset pagination of the active listings
+        Index("idx_campaigns_active_created", text("created_at DESC"), text("id DESC"), postgresql_where=text("is_active")),
+        Index("idx_campaigns_bank_created", "bank_id", text("created_at DESC"), text("id DESC"), postgresql_where=text("is_active")),
+        Index("idx_campaigns_card_created", "card_id", text("created_at DESC"), text("id DESC"), postgresql_where=text("is_active")),
+        Index("idx_campaigns_category_created", "category_id", text("created_at DESC"), text("id DESC"), postgresql_where=text("is_active")),
+        # Live campaigns (expired ones are deactivated by the lifecycle sweeper)
+        Index("idx_campaigns_live_category", "category_id", "end_date", postgresql_where=text("is_active")),
+        Index("idx_campaigns_live_merchant", "merchant_id", "end_date", postgresql_where=text("is_active AND merchant_id IS NOT NULL")),
+        Index("idx_campaigns_live_end_date", "end_date", postgresql_where=text("is_active")),
+        Index("idx_campaigns_live_start_date", "start_date", postgresql_where=text("is_active")),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -48,8 +71,11 @@ class Campaign(Base):
     external_id = Column(String(255), nullable=True)  # ID in the external system
     priority = Column(Integer, default=0)  # Higher number = higher priority
     last_sync_at = Column(DateTime(timezone=True), nullable=True)  # When was it last synced
+    content_hash = Column(String(64), nullable=True)  # SHA-256 of the normalized bank feed payload
     review_notes = Column(Text, nullable=True)  # Admin notes on approval/rejection
     reviewed_by = Column(Integer, ForeignKey("users.id"), nullable=True)  # Who reviewed it
+    # Full-text document (name, bank/card/merchant names, description), maintained by a database trigger
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -63,6 +89,14 @@ class Campaign(Base):
     notifications = relationship("NotificationHistory", back_populates="campaign")
     reminders = relationship("CampaignReminder", back_populates="campaign", passive_deletes=True)
 
+    @property
+    def bank_name(self):
+        return self.bank.name if self.bank else None
+
+    @property
+    def card_name(self):
+        return self.credit_card.name if self.credit_card else None
+
     def to_json(self):
         """Convert campaign object to JSON serializable dictionary"""
         return {
@@ -111,6 +145,8 @@ class CampaignReminder(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     is_sent = Column(Boolean, default=False)
     is_active = Column(Boolean, nullable=False, default=True)
+    claimed_by = Column(String(255), nullable=True)  # Worker currently dispatching this reminder
+    claimed_at = Column(DateTime(timezone=True), nullable=True)  # Claim lease start
 
     # Relationship with cascade delete
     campaign = relationship("Campaign", back_populates="reminders", passive_deletes=True)
@@ -186,6 +222,11 @@ class Bank(Base):
     last_campaign_sync_at = Column(DateTime(timezone=True), nullable=True)
     auto_approve_campaigns = Column(Boolean, default=False)  # Whether to auto-approve from this bank
     
+    # Delta sync position, as handed out by the bank's campaign feed
+    campaign_sync_cursor = Column(String(512), nullable=True)
+    campaign_sync_etag = Column(String(255), nullable=True)
+    campaign_sync_last_modified = Column(String(64), nullable=True)  # HTTP-date, sent back verbatim
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -194,6 +235,66 @@ class Bank(Base):
     credit_cards = relationship("CreditCard", back_populates="bank")
 
 
+@event.listens_for(Bank, "after_update")
+@event.listens_for(Bank, "after_delete")
+def _invalidate_bank_credentials(mapper, connection, target):
+    """Drop the bank's decrypted API credentials cached in this process"""
+    invalidate_bank_credentials(target.id)
+
+
+class CatalogState(Base):
+    """
+    Single row holding the campaign catalog version
+
+    Bumped by database triggers on every campaign, category, bank and card
+    write, whichever process or code path makes it.
+    """
+    __tablename__ = "catalog_state"
+
+    id = Column(SmallInteger, primary_key=True, default=1)
+    version = Column(BigInteger, nullable=False, default=1)
+    pruned_through_version = Column(BigInteger, nullable=False, default=0)  # Older entries are gone from campaign_changes
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CampaignChange(Base):
+    """A campaign written at a catalog version, logged by a database trigger"""
+    __tablename__ = "campaign_changes"
+    __table_args__ = (
+        Index("idx_campaign_changes_version", "version"),
+        Index("idx_campaign_changes_changed_at", "changed_at"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    version = Column(BigInteger, nullable=False)
+    campaign_id = Column(Integer, nullable=False)  # No FK: deleted campaigns keep their entries
+    operation = Column(String(10), nullable=False)  # insert, update or delete
+    changed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CampaignSyncRun(Base):
+    """A bank campaign sync, queued by the API or the schedule and executed by a sync worker"""
+    __tablename__ = "campaign_sync_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    bank_id = Column(Integer, ForeignKey("banks.id", ondelete="CASCADE"), nullable=True)  # None syncs every enabled bank
+    trigger = Column(String(20), nullable=False, default="manual")  # manual or schedule
+    status = Column(Enum(CampaignSyncRunStatus), nullable=False, default=CampaignSyncRunStatus.QUEUED)
+    requested_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    worker_id = Column(String(255), nullable=True)
+    total_banks = Column(Integer, nullable=True)
+    completed_banks = Column(Integer, nullable=False, default=0)
+    progress = Column(JSONB, nullable=False, default=list)  # Result of each bank, as it finishes
+    result = Column(JSONB, nullable=True)  # sync_all_banks / sync_bank_campaigns summary
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    bank = relationship("Bank")
+
+
 class CreditCard(Base):
     __tablename__ = "credit_cards"
 
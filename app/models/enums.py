@@ -35,4 +35,10 @@ class CampaignStatus(str, enum.Enum):
     PENDING = "PENDING"         # Pending approval (for imported campaigns)
     APPROVED = "APPROVED"       # Approved and active
     REJECTED = "REJECTED"       # Rejected by admin
-    ARCHIVED = "ARCHIVED"       # No longer active but kept for reference 
\ No newline at end of file
+    ARCHIVED = "ARCHIVED"       # No longer active but kept for reference
+
+class CampaignSyncRunStatus(str, enum.Enum):
+    QUEUED = "QUEUED"           # Waiting for a sync worker
+    RUNNING = "RUNNING"         # Claimed by a sync worker
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
@@ -1,5 +1,5 @@
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, DateTime, Date, ForeignKey, Float, Boolean, Text
+from sqlalchemy import Column, Integer, String, DateTime, Date, ForeignKey, Float, Boolean, Text, UniqueConstraint
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -8,15 +8,17 @@ from app.db.base import Base
 
 class NotificationHistory(Base):
     __tablename__ = "notification_history"
+    # Monthly range partitions on sent_date, see NotificationRetentionService
+    __table_args__ = {"postgresql_partition_by": "RANGE (sent_date)"}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     merchant_id = Column(Integer, ForeignKey("merchants.id"), nullable=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
     latitude = Column(Float, nullable=True)  # Optional for reminder notifications
     longitude = Column(Float, nullable=True)  # Optional for reminder notifications
     sent_at = Column(DateTime(timezone=True), server_default=func.now())
-    sent_date = Column(Date, nullable=False, server_default=func.current_date())
+    sent_date = Column(Date, primary_key=True, nullable=False, server_default=func.current_date())  # Partition key
     location_hash = Column(String(50), nullable=True)  # Optional for reminder notifications
     category_id = Column(Integer, ForeignKey("campaign_categories.id"), nullable=True)  # Optional for reminder notifications
     
@@ -31,4 +33,22 @@ class NotificationHistory(Base):
     user = relationship("User", back_populates="notifications")
     merchant = relationship("Merchant", back_populates="notifications")
     campaign = relationship("Campaign", back_populates="notifications")
-    category = relationship("CampaignCategory", back_populates="notifications") 
\ No newline at end of file
+    category = relationship("CampaignCategory", back_populates="notifications")
+
+
+class NotificationHistoryRollup(Base):
+    """Monthly per-user, per-campaign aggregate of expired notification history"""
+    __tablename__ = "notification_history_rollups"
+    __table_args__ = (
+        UniqueConstraint("user_id", "campaign_id", "period_month", name="uq_notification_rollup_user_campaign_month"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    campaign_id = Column(Integer, ForeignKey("campaigns.id"), nullable=False)
+    period_month = Column(Date, nullable=False)  # First day of the rolled up month
+    notification_count = Column(Integer, nullable=False, server_default='0')
+    read_count = Column(Integer, nullable=False, server_default='0')
+    first_sent_at = Column(DateTime(timezone=True), nullable=True)
+    last_sent_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
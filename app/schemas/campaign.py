@@ -3,7 +3,7 @@ from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field, HttpUrl, validator
 from enum import Enum
 
-from app.models.campaign import DiscountType, CampaignSource, CampaignStatus
+from app.models.campaign import DiscountType, CampaignSource, CampaignStatus, CampaignSyncRunStatus
 from app.models.campaign_category import CategoryEnum
 from app.core.enum_helpers import safely_get_enum, get_all_enum_values
 
@@ -321,6 +321,7 @@ class CampaignOut(CampaignRead):
     status: CampaignStatus = CampaignStatus.APPROVED
     credit_card_application_url: Optional[str] = None
     min_amount: float = 0.0
+    external_id: Optional[str] = Field(None, exclude=True)  # The bank's own ID; internal
     
     class Config:
         from_attributes = True
@@ -334,11 +335,37 @@ class PendingCampaignRead(CampaignRead):
     priority: int
     last_sync_at: Optional[datetime] = None
     review_notes: Optional[str] = None
+    bank_name: Optional[str] = None
+    card_name: Optional[str] = None
     
     class Config:
         from_attributes = True
 
 
+class PendingCampaignPage(BaseModel):
+    items: List[PendingCampaignRead]
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next page; None on the last page
+
+
+# Campaign changes since a catalog version, for delta sync
+class CampaignChanges(BaseModel):
+    version: int  # Catalog version these changes run up to; pass as `since` next time
+    changed: List[CampaignOut]  # Added or updated campaigns, full records
+    deleted: List[int]  # IDs of campaigns deleted or no longer active
+    has_more: bool = False
+    next_cursor: Optional[str] = None  # Pass back as `cursor` (with the same `since`) for the rest
+
+
+# Selection of pending campaigns to approve or reject in bulk
+class CampaignBulkReview(BaseModel):
+    campaign_ids: Optional[List[int]] = None
+    bank_id: Optional[int] = None
+    category_id: Optional[int] = None
+    created_from: Optional[datetime] = None  # Imported at or after
+    created_to: Optional[datetime] = None  # Imported before
+    notes: Optional[str] = None
+
+
 # Schema for campaign with bank and card details
 class CampaignWithDetailsRead(CampaignRead):
     bank: Optional[Dict[str, Any]] = None
@@ -358,13 +385,45 @@ class CampaignImportResponse(BaseModel):
     total_campaigns: Optional[int] = None
     imported_campaigns: Optional[int] = None
     updated_campaigns: Optional[int] = None
+    unchanged_campaigns: Optional[int] = None
+    deleted_campaigns: Optional[int] = None
+    not_modified: Optional[bool] = None
     new_campaigns: Optional[int] = None
     pending_approval: Optional[int] = None
     auto_approved: Optional[int] = None
 
 
+# Schema for queued/running bank sync runs
+class CampaignSyncRunRead(BaseModel):
+    id: int
+    bank_id: Optional[int] = None
+    trigger: str
+    status: CampaignSyncRunStatus
+    requested_by: Optional[int] = None
+    worker_id: Optional[str] = None
+    total_banks: Optional[int] = None
+    completed_banks: int = 0
+    progress: List[Dict[str, Any]] = []
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
 # Schema for campaign approval/rejection responses
 class CampaignApproval(BaseModel):
     success: bool
     message: str
-    campaign_id: int 
\ No newline at end of file
+    campaign_id: int
+
+
+class CampaignBulkApproval(BaseModel):
+    success: bool
+    message: str
+    updated_campaigns: int
+    campaign_ids: List[int] 
\ No newline at end of file
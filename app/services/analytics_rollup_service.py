@@ -0,0 +1,230 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EVENT_ROLLUP_TABLE = "analytics_event_rollups"
+CAMPAIGN_ROLLUP_TABLE = "campaign_count_rollups"
+STATE_TABLE = "analytics_rollup_state"
+
+GRANULARITIES = ("hour", "day")
+
+# Metric -> (table, timestamp column, extra condition). notification_history
+# is partitioned by sent_date, so its window is also given on sent_date to
+# skip older partitions.
+EVENT_SOURCES = {
+    "registrations": ("users", "created_at", ""),
+    "card_additions": ("user_credit_cards", "created_at", ""),
+    "recommendations": ("recommendations", "created_at", ""),
+    "clicks": ("recommendation_clicks", "created_at", ""),
+    "notifications": ("notification_history", "sent_at", "AND sent_date >= CAST(:since AS date) - 1"),
+}
+
+# Lifecycle of a campaign for the status dimension; start and end dates are
+# stored without a time zone and compared with the app's local time, as the
+# listing endpoints do
+CAMPAIGN_STATUS_SQL = """
+    CASE
+        WHEN c.status = 'PENDING' THEN 'pending'
+        WHEN c.status = 'REJECTED' THEN 'rejected'
+        WHEN c.end_date < :local_now THEN 'expired'
+        WHEN NOT c.is_active THEN 'inactive'
+        WHEN c.start_date > :local_now THEN 'scheduled'
+        ELSE 'active'
+    END
+"""
+
+
+class AnalyticsRollupService:
+    """
+    Service for the hourly and daily analytics rollups behind the admin dashboard
+
+    Event tables are rolled up incrementally: each run recounts the hours
+    since its previous run, minus ANALYTICS_ROLLUP_LAG_MINUTES for rows
+    committed late, and overwrites those buckets, so runs are idempotent.
+    Campaign counts are a snapshot of the catalog, taken into the current
+    hour and day on every run.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def roll_up(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Bring the rollup tables up to date
+
+        Returns:
+        - Window that was recounted and the number of rows written
+        """
+        now = now or datetime.now(timezone.utc)
+
+        # Serializes concurrent runs from several app processes
+        rolled_up_through = self.db.execute(
+            text(f"SELECT rolled_up_through FROM {STATE_TABLE} WHERE id = 1 FOR UPDATE")
+        ).scalar()
+
+        # The first run rolls up all history
+        since = None
+        if rolled_up_through is not None:
+            since = (rolled_up_through - timedelta(minutes=settings.ANALYTICS_ROLLUP_LAG_MINUTES))\
+                .replace(minute=0, second=0, microsecond=0)
+
+        event_rows = self._roll_up_events(since, now)
+        campaign_rows = self._snapshot_campaign_counts(now)
+        pruned = self.db.execute(
+            text(f"DELETE FROM {EVENT_ROLLUP_TABLE} WHERE granularity = 'hour' AND bucket_start < :cutoff"),
+            {"cutoff": now - timedelta(days=settings.ANALYTICS_HOURLY_RETENTION_DAYS)}
+        ).rowcount
+        pruned += self.db.execute(
+            text(f"DELETE FROM {CAMPAIGN_ROLLUP_TABLE} WHERE granularity = 'hour' AND bucket_start < :cutoff"),
+            {"cutoff": now - timedelta(days=settings.ANALYTICS_HOURLY_RETENTION_DAYS)}
+        ).rowcount
+
+        self.db.execute(
+            text(f"UPDATE {STATE_TABLE} SET rolled_up_through = :now, updated_at = now() WHERE id = 1"),
+            {"now": now}
+        )
+        self.db.commit()
+
+        return {
+            "success": True,
+            "since": since.isoformat() if since else None,
+            "until": now.isoformat(),
+            "event_rows": event_rows,
+            "campaign_rows": campaign_rows,
+            "pruned_rows": pruned or 0
+        }
+
+    def _roll_up_events(self, since: Optional[datetime], until: datetime) -> int:
+        """Recount the hourly buckets from `since`, then the days they fall in"""
+        rows = 0
+        for metric, (table, column, extra) in EVENT_SOURCES.items():
+            window = f"{column} >= :since {extra} AND" if since is not None else ""
+            result = self.db.execute(text(f"""
+                INSERT INTO {EVENT_ROLLUP_TABLE} (granularity, bucket_start, metric, count)
+                SELECT 'hour', date_trunc('hour', {column}, 'UTC'), :metric, COUNT(*)
+                FROM {table}
+                WHERE {window} {column} < :until
+                GROUP BY 2
+                ON CONFLICT (granularity, bucket_start, metric) DO UPDATE SET count = EXCLUDED.count
+            """), {"metric": metric, "since": since, "until": until})
+            rows += result.rowcount or 0
+
+        # Days are summed from their hours, which are all kept well past the lag
+        window = "AND bucket_start >= date_trunc('day', CAST(:since AS timestamptz), 'UTC')" if since is not None else ""
+        result = self.db.execute(text(f"""
+            INSERT INTO {EVENT_ROLLUP_TABLE} (granularity, bucket_start, metric, count)
+            SELECT 'day', date_trunc('day', bucket_start, 'UTC'), metric, SUM(count)
+            FROM {EVENT_ROLLUP_TABLE}
+            WHERE granularity = 'hour' {window}
+            GROUP BY 2, 3
+            ON CONFLICT (granularity, bucket_start, metric) DO UPDATE SET count = EXCLUDED.count
+        """), {"since": since})
+        return rows + (result.rowcount or 0)
+
+    def _snapshot_campaign_counts(self, now: datetime) -> int:
+        """Count campaigns by category, bank and status into the current hour and day"""
+        rows = 0
+        local_now = datetime.now()
+        for granularity in GRANULARITIES:
+            params = {"granularity": granularity, "now": now, "local_now": local_now}
+            bucket = f"date_trunc('{granularity}', CAST(:now AS timestamptz), 'UTC')"
+            # Replaced as a whole, so categories or banks that dropped to zero disappear
+            self.db.execute(text(f"""
+                DELETE FROM {CAMPAIGN_ROLLUP_TABLE}
+                WHERE granularity = :granularity AND bucket_start = {bucket}
+            """), params)
+            # Category and bank counts cover the campaigns currently listed;
+            # the status breakdown covers all of them
+            result = self.db.execute(text(f"""
+                INSERT INTO {CAMPAIGN_ROLLUP_TABLE} (granularity, bucket_start, dimension, dimension_value, campaign_count)
+                SELECT :granularity, {bucket}, dimension, dimension_value, campaign_count
+                FROM (
+                    SELECT
+                        CASE
+                            WHEN GROUPING(category) = 0 THEN 'category'
+                            WHEN GROUPING(bank) = 0 THEN 'bank'
+                            ELSE 'status'
+                        END AS dimension,
+                        COALESCE(category, bank, status) AS dimension_value,
+                        CASE
+                            WHEN GROUPING(status) = 0 THEN COUNT(*)
+                            ELSE COUNT(*) FILTER (WHERE status = 'active')
+                        END AS campaign_count
+                    FROM (
+                        SELECT
+                            COALESCE(cc.name, 'Unknown') AS category,
+                            COALESCE(b.name, 'Unknown') AS bank,
+                            {CAMPAIGN_STATUS_SQL} AS status
+                        FROM campaigns c
+                        LEFT JOIN campaign_categories cc ON cc.id = c.category_id
+                        LEFT JOIN banks b ON b.id = c.bank_id
+                    ) classified
+                    GROUP BY GROUPING SETS ((category), (bank), (status))
+                ) counts
+                WHERE campaign_count > 0
+            """), params)
+            rows += result.rowcount or 0
+        return rows
+
+    def get_rolled_up_through(self) -> Optional[datetime]:
+        return self.db.execute(text(f"SELECT rolled_up_through FROM {STATE_TABLE} WHERE id = 1")).scalar()
+
+    def get_event_series(self, granularity: str, since: datetime) -> List[Dict[str, Any]]:
+        """Event counts per bucket from `since`, oldest first, one entry per bucket with every metric"""
+        rows = self.db.execute(text(f"""
+            SELECT bucket_start, metric, count
+            FROM {EVENT_ROLLUP_TABLE}
+            WHERE granularity = :granularity AND bucket_start >= :since
+            ORDER BY bucket_start
+        """), {"granularity": granularity, "since": since}).fetchall()
+
+        series: Dict[datetime, Dict[str, Any]] = {}
+        for bucket_start, metric, count in rows:
+            entry = series.setdefault(bucket_start, {"bucket_start": bucket_start, **{m: 0 for m in EVENT_SOURCES}})
+            entry[metric] = count
+        return list(series.values())
+
+    def get_event_totals(self) -> Dict[str, int]:
+        """All-time event counts, summed from the daily rows"""
+        rows = self.db.execute(text(f"""
+            SELECT metric, SUM(count)
+            FROM {EVENT_ROLLUP_TABLE}
+            WHERE granularity = 'day'
+            GROUP BY metric
+        """)).fetchall()
+        totals = {metric: 0 for metric in EVENT_SOURCES}
+        totals.update({metric: int(total) for metric, total in rows})
+        return totals
+
+    def get_campaign_counts(self, granularity: str = "hour", since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Campaign counts by dimension per bucket, oldest first
+
+        Without `since`, only the latest bucket is returned.
+        """
+        if since is None:
+            condition = f"bucket_start = (SELECT MAX(bucket_start) FROM {CAMPAIGN_ROLLUP_TABLE} WHERE granularity = :granularity)"
+        else:
+            condition = "bucket_start >= :since"
+        rows = self.db.execute(text(f"""
+            SELECT bucket_start, dimension, dimension_value, campaign_count
+            FROM {CAMPAIGN_ROLLUP_TABLE}
+            WHERE granularity = :granularity AND {condition}
+            ORDER BY bucket_start, dimension, campaign_count DESC
+        """), {"granularity": granularity, "since": since}).fetchall()
+
+        buckets: Dict[datetime, Dict[str, Any]] = {}
+        for bucket_start, dimension, value, count in rows:
+            entry = buckets.setdefault(
+                bucket_start,
+                {"bucket_start": bucket_start, "by_category": {}, "by_bank": {}, "by_status": {}}
+            )
+            entry[f"by_{dimension}"][value] = count
+        return list(buckets.values())
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import aiohttp
+from aiohttp import ClientError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class BankApiUnavailable(Exception):
+    """Raised without calling the bank while its circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Per-bank circuit breaker
+
+    Opens after `failure_threshold` consecutive failures and rejects calls
+    for `reset_seconds`. After that a single trial call is let through: a
+    success closes the circuit again, a failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """End a call that neither succeeded nor failed against the bank"""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class LatencyStats:
+    """Latency and error counts of one bank's API calls"""
+
+    def __init__(self, window: int = 200):
+        self.calls = 0
+        self.errors = 0
+        self.recent = deque(maxlen=window)
+
+    def record(self, seconds: float, success: bool) -> None:
+        self.calls += 1
+        if not success:
+            self.errors += 1
+        self.recent.append(seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": round(sum(recent) / len(recent) * 1000, 1) if recent else None,
+            "p95_ms": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000, 1) if recent else None
+        }
+
+
+class BankApiClient:
+    """
+    Shared HTTP client for bank APIs
+
+    Keeps one pooled, keep-alive aiohttp session per bank, applies timeouts,
+    retries idempotent calls with jittered exponential backoff, fails fast
+    through a per-bank circuit breaker and records latency per bank.
+    """
+
+    RETRY_STATUSES = {429, 502, 503, 504}
+
+    def __init__(self):
+        self._sessions: Dict[int, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+        self._breakers: Dict[int, CircuitBreaker] = {}
+        self._stats: Dict[int, LatencyStats] = {}
+
+    def session_for(self, bank_id: int) -> aiohttp.ClientSession:
+        """Pooled session of a bank, created on first use in the running event loop"""
+        loop = asyncio.get_running_loop()
+        entry = self._sessions.get(bank_id)
+        if entry and entry[0] is loop and not entry[1].closed:
+            return entry[1]
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit_per_host=settings.BANK_API_POOL_SIZE,
+                keepalive_timeout=settings.BANK_API_KEEPALIVE_SECONDS
+            ),
+            timeout=aiohttp.ClientTimeout(
+                total=settings.BANK_API_TIMEOUT_SECONDS,
+                connect=settings.BANK_API_CONNECT_TIMEOUT_SECONDS
+            )
+        )
+        self._sessions[bank_id] = (loop, session)
+        return session
+
+    def breaker_for(self, bank_id: int) -> CircuitBreaker:
+        if bank_id not in self._breakers:
+            self._breakers[bank_id] = CircuitBreaker(
+                failure_threshold=settings.BANK_API_CIRCUIT_FAILURE_THRESHOLD,
+                reset_seconds=settings.BANK_API_CIRCUIT_RESET_SECONDS
+            )
+        return self._breakers[bank_id]
+
+    @asynccontextmanager
+    async def track(self, bank_id: int) -> AsyncIterator[None]:
+        """
+        Guard a call to a bank with its circuit breaker and record its latency
+
+        Raises:
+        - BankApiUnavailable: The bank's circuit is open
+        """
+        breaker = self.breaker_for(bank_id)
+        if not breaker.allow():
+            raise BankApiUnavailable(f"Bank {bank_id} API is unavailable (circuit open)")
+
+        stats = self._stats.setdefault(bank_id, LatencyStats())
+        start = time.monotonic()
+        try:
+            yield
+        except (ClientError, asyncio.TimeoutError) as e:
+            stats.record(time.monotonic() - start, success=False)
+            if isinstance(e, aiohttp.ClientResponseError) and e.status < 500 and e.status != 429:
+                # The bank answered; a rejected request doesn't make it unhealthy
+                breaker.record_success()
+            else:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            # Not the bank's fault (e.g. cancelled); release a half-open trial
+            breaker.release()
+            raise
+        else:
+            stats.record(time.monotonic() - start, success=True)
+            breaker.record_success()
+
+    async def request(
+        self,
+        bank,
+        method: str,
+        endpoint: str,
+        api_key: str,
+        api_secret: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None
+    ) -> Any:
+        """
+        Call a bank API endpoint and return the decoded JSON response
+
+        Parameters:
+        - idempotent: Whether the call may be retried; defaults to True for GET
+
+        Raises:
+        - BankApiUnavailable: The bank's circuit is open
+        - aiohttp.ClientError / asyncio.TimeoutError: The call failed after all retries
+        """
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported method: {method}")
+        if idempotent is None:
+            idempotent = method == "GET"
+
+        url = f"{bank.api_base_url}{endpoint}"
+        headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": api_key,
+            "X-API-Secret": api_secret
+        }
+        attempts = 1 + (settings.BANK_API_MAX_RETRIES if idempotent else 0)
+
+        for attempt in range(1, attempts + 1):
+            try:
+                async with self.track(bank.id):
+                    session = self.session_for(bank.id)
+                    async with session.request(method, url, headers=headers, json=data, params=params) as response:
+                        response.raise_for_status()
+                        return await response.json()
+            except BankApiUnavailable:
+                raise
+            except (ClientError, asyncio.TimeoutError) as e:
+                retryable = not isinstance(e, aiohttp.ClientResponseError) or e.status in self.RETRY_STATUSES
+                if attempt == attempts or not retryable:
+                    logger.error(f"Bank API error ({bank.id} {method} {endpoint}): {str(e)}")
+                    raise
+                # Full jitter: spread retries from many workers over the backoff window
+                delay = random.uniform(0, settings.BANK_API_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+                logger.warning(f"Retrying bank API call ({bank.id} {method} {endpoint}) in {delay:.2f}s: {str(e)}")
+                await asyncio.sleep(delay)
+
+    def get_stats(self) -> Dict[int, Dict[str, Any]]:
+        """Latency, error counts and circuit state per bank"""
+        return {
+            bank_id: {**stats.to_dict(), "circuit": self.breaker_for(bank_id).state}
+            for bank_id, stats in self._stats.items()
+        }
+
+    async def close(self) -> None:
+        """Close the pooled sessions owned by the running event loop"""
+        loop = asyncio.get_running_loop()
+        for bank_id, (session_loop, session) in list(self._sessions.items()):
+            if session_loop is loop:
+                await session.close()
+                del self._sessions[bank_id]
+
+
+# Shared by every service in the process, so connections are reused across requests
+bank_api_client = BankApiClient()
@@ -1,11 +1,10 @@
 import logging
 from typing import Dict, Any, Optional
-import aiohttp
-from aiohttp import ClientError
 from sqlalchemy.orm import Session
 
 from app.models.campaign import Bank, Campaign
-from app.utils.crypto import encrypt_data, decrypt_data
+from app.services.bank_api_client import bank_api_client
+from app.utils.crypto import get_bank_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -56,8 +55,7 @@ class BankService:
             }
         
         # Decrypt API credentials
-        api_key = decrypt_data(bank.api_key) if bank.api_key else None
-        api_secret = decrypt_data(bank.api_secret) if bank.api_secret else None
+        api_key, api_secret = get_bank_credentials(bank)
         
         if not api_key or not api_secret:
             return {
@@ -122,8 +120,7 @@ class BankService:
             }
         
         # Decrypt API credentials
-        api_key = decrypt_data(bank.api_key) if bank.api_key else None
-        api_secret = decrypt_data(bank.api_secret) if bank.api_secret else None
+        api_key, api_secret = get_bank_credentials(bank)
         
         if not api_key or not api_secret:
             return {
@@ -166,33 +163,13 @@ class BankService:
         api_key: str,
         api_secret: str
     ) -> Dict[str, Any]:
-        """Make an API call to a bank's API endpoint"""
+        """Make an API call to a bank's API endpoint through the shared bank API client"""
         
-        url = f"{bank.api_base_url}{endpoint}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": api_key,
-            "X-API-Secret": api_secret
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                if method.upper() == "GET":
-                    async with session.get(url, headers=headers) as response:
-                        response.raise_for_status()
-                        return await response.json()
-                        
-                elif method.upper() == "POST":
-                    async with session.post(url, headers=headers, json=data) as response:
-                        response.raise_for_status()
-                        return await response.json()
-                        
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-                    
-            except ClientError as e:
-                logger.error(f"Bank API error: {str(e)}")
-                raise
-            except Exception as e:
-                logger.error(f"Error calling bank API: {str(e)}")
-                raise 
\ No newline at end of file
+        return await bank_api_client.request(
+            bank=bank,
+            method=method,
+            endpoint=endpoint,
+            api_key=api_key,
+            api_secret=api_secret,
+            data=data
+        )
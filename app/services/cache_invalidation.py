@@ -0,0 +1,177 @@
+import json
+import logging
+import select
+import threading
+from typing import Callable, List, NamedTuple, Optional
+
+from sqlalchemy import func
+from sqlalchemy import select as sql_select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.utils.crypto import invalidate_bank_credentials
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "cache_invalidation"
+
+# NOTIFY payloads are limited to 8000 bytes; larger ID lists are sent as "all"
+MAX_PAYLOAD_BYTES = 7900
+
+# Entity of the event dispatched after (re)connecting, when events may have been missed
+ALL = "*"
+
+
+class InvalidationEvent(NamedTuple):
+    entity: str  # campaign, bank, card, category, merchant, catalog (version bump) or * (everything)
+    ids: Optional[List[int]] = None  # None: every entity of the kind
+    version: Optional[int] = None  # Catalog version, on catalog events
+
+
+def publish_invalidation(db: Session, entity: str, ids: Optional[List[int]] = None) -> None:
+    """
+    Tell every process that entities were written
+
+    Sent with the session's transaction: delivered on commit, dropped on
+    rollback. Catalog version events are sent by the database itself
+    whenever the version is bumped.
+    """
+    payload = json.dumps({"entity": entity, "ids": sorted(set(ids)) if ids is not None else None}, separators=(",", ":"))
+    if len(payload) > MAX_PAYLOAD_BYTES:
+        payload = json.dumps({"entity": entity, "ids": None}, separators=(",", ":"))
+    db.execute(sql_select(func.pg_notify(CHANNEL, payload)))
+
+
+class CacheInvalidationBus:
+    """
+    Per-process subscriber to the cache invalidation channel
+
+    A background thread LISTENs on its own connection and hands every event
+    to the subscribed handlers, which evict what they cache. It also keeps
+    the latest catalog version, so requests don't read it from the database.
+    While disconnected, the version is read from the database again; after
+    (re)connecting, events may have been missed, so handlers get an event
+    for everything.
+    """
+
+    def __init__(self, channel: str = CHANNEL):
+        self.channel = channel
+        self._handlers: List[Callable[[InvalidationEvent], None]] = []
+        self._version: Optional[int] = None
+        self._listening = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def listening(self) -> bool:
+        return self._listening
+
+    def subscribe(self, handler: Callable[[InvalidationEvent], None]) -> Callable[[InvalidationEvent], None]:
+        """Call handler with every event; usable as a decorator"""
+        self._handlers.append(handler)
+        return handler
+
+    def catalog_version(self, load: Callable[[], int]) -> int:
+        """Latest catalog version, from the channel while listening, otherwise from load()"""
+        if self._listening and self._version is not None:
+            return self._version
+        version = load()
+        if self._listening:
+            self._observe_version(version)
+        return version
+
+    def _observe_version(self, version: int) -> None:
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._version = version
+
+    def handle(self, payload: str) -> None:
+        """Dispatch a raw notification payload"""
+        try:
+            data = json.loads(payload)
+            event = InvalidationEvent(entity=data["entity"], ids=data.get("ids"), version=data.get("version"))
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring malformed cache invalidation payload: {payload!r}")
+            return
+        if event.version is not None:
+            self._observe_version(event.version)
+        self.dispatch(event)
+
+    def dispatch(self, event: InvalidationEvent) -> None:
+        for handler in self._handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Error in cache invalidation handler {handler.__name__}: {str(e)}")
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+        self._thread.start()
+        logger.info(f"Listening for cache invalidations on {self.channel}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=settings.CACHE_INVALIDATION_POLL_SECONDS + 1)
+            self._thread = None
+
+    def _connect(self):
+        import psycopg2
+        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+        from app.db.session import engine
+
+        connection = psycopg2.connect(engine.url.set(drivername="postgresql").render_as_string(hide_password=False))
+        connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel}")
+        return connection
+
+    def _resync(self) -> None:
+        with self._lock:
+            self._version = None
+        self._listening = True
+        self.dispatch(InvalidationEvent(entity=ALL))
+
+    def _run(self) -> None:
+        backoff = 1
+        while not self._stop.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                self._resync()
+                backoff = 1
+                while not self._stop.is_set():
+                    if not select.select([connection], [], [], settings.CACHE_INVALIDATION_POLL_SECONDS)[0]:
+                        # Idle: make sure the connection is still alive
+                        with connection.cursor() as cursor:
+                            cursor.execute("SELECT 1")
+                    connection.poll()
+                    while connection.notifies:
+                        self.handle(connection.notifies.pop(0).payload)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener disconnected: {str(e)}")
+            finally:
+                self._listening = False
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 60)
+
+
+invalidation_bus = CacheInvalidationBus()
+
+
+@invalidation_bus.subscribe
+def _evict_bank_credentials(event: InvalidationEvent) -> None:
+    if event.entity == ALL or (event.entity == "bank" and event.ids is None):
+        invalidate_bank_credentials()
+    elif event.entity == "bank":
+        for bank_id in event.ids:
+            invalidate_bank_credentials(bank_id)
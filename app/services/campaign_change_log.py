@@ -0,0 +1,129 @@
+import base64
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, literal, select, tuple_, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.campaign import Campaign, CampaignChange, CatalogState
+
+logger = logging.getLogger(__name__)
+
+
+class ChangesPruned(Exception):
+    """Raised when changes since the requested version are no longer in the log"""
+
+
+class CampaignChangeLogService:
+    """
+    Campaign changes since a catalog version, for clients keeping a local copy
+
+    Every campaign write is logged in campaign_changes by a database trigger,
+    under the catalog version it bumped to. A version is only visible once
+    every lower version has committed, so reading up to the current version
+    never skips a change.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_changes(self, since: int, limit: int = 500, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Campaigns changed after `since`, oldest change first
+
+        Returns the campaigns still listed in the catalog (`changed`), the IDs
+        of deleted or deactivated ones (`deleted`) and the catalog version the
+        changes run up to. While `has_more` is set, call again with the same
+        `since` and `next_cursor`; once done, keep `version` for the next sync.
+
+        Raises:
+        - ChangesPruned: Changes after `since` have been pruned; reload the catalog
+        - ValueError: The cursor is malformed
+        """
+        state = self.db.query(CatalogState.version, CatalogState.pruned_through_version)\
+            .filter(CatalogState.id == 1)\
+            .one()
+        if since < state.pruned_through_version:
+            raise ChangesPruned(f"Changes before version {state.pruned_through_version} are no longer available")
+
+        # Each campaign once, at its latest change
+        latest = select(
+            CampaignChange.campaign_id,
+            func.max(CampaignChange.version).label("version")
+        ).where(
+            CampaignChange.version > since,
+            CampaignChange.version <= state.version
+        ).group_by(CampaignChange.campaign_id).subquery()
+
+        query = self.db.query(latest.c.campaign_id, latest.c.version)
+        if cursor:
+            after_version, after_id = self._decode_cursor(cursor)
+            query = query.filter(
+                tuple_(latest.c.version, latest.c.campaign_id) > tuple_(literal(after_version), literal(after_id))
+            )
+        rows = query.order_by(latest.c.version, latest.c.campaign_id).limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        campaign_ids = [row.campaign_id for row in rows]
+        campaigns = {
+            campaign.id: campaign
+            for campaign in self.db.query(Campaign).filter(Campaign.id.in_(campaign_ids)).all()
+        } if campaign_ids else {}
+
+        changed: List[Campaign] = []
+        deleted: List[int] = []
+        for campaign_id in campaign_ids:
+            campaign = campaigns.get(campaign_id)
+            if campaign is not None and campaign.is_active:
+                changed.append(campaign)
+            else:
+                deleted.append(campaign_id)
+
+        return {
+            "version": state.version,
+            "changed": changed,
+            "deleted": deleted,
+            "has_more": has_more,
+            "next_cursor": self._encode_cursor(rows[-1].version, rows[-1].campaign_id) if has_more else None
+        }
+
+    def prune(self, retention_days: Optional[int] = None) -> int:
+        """Delete changes older than the retention period; returns the number deleted"""
+        retention_days = retention_days or settings.CAMPAIGN_CHANGE_LOG_RETENTION_DAYS
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+
+        pruned_version = self.db.query(func.max(CampaignChange.version))\
+            .filter(CampaignChange.changed_at < cutoff)\
+            .scalar()
+        if pruned_version is None:
+            return 0
+
+        # Whole versions are pruned, so a client is either fully served or told to reload
+        deleted = self.db.query(CampaignChange)\
+            .filter(CampaignChange.version <= pruned_version)\
+            .delete(synchronize_session=False)
+        self.db.execute(
+            update(CatalogState)
+            .where(CatalogState.id == 1)
+            .values(pruned_through_version=func.greatest(CatalogState.pruned_through_version, pruned_version))
+        )
+        self.db.commit()
+
+        logger.info(f"Pruned {deleted} campaign changes up to version {pruned_version}")
+        return deleted
+
+    @staticmethod
+    def _encode_cursor(version: int, campaign_id: int) -> str:
+        return base64.urlsafe_b64encode(json.dumps([version, campaign_id]).encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[int, int]:
+        try:
+            version, campaign_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return int(version), int(campaign_id)
+        except (ValueError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
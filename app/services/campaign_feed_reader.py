@@ -0,0 +1,275 @@
+import asyncio
+import codecs
+import json
+import logging
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, List, Optional
+
+import aiohttp
+from aiohttp import ClientError
+from yarl import URL
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JsonArrayStream:
+    """
+    Incremental parser for a top-level JSON array
+
+    Text is fed in arbitrary pieces and every array element is returned as
+    soon as it is complete, so only the element being parsed is buffered.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._started = False
+        self.done = False
+
+    def feed(self, text: str) -> List[Any]:
+        """Add text and return the elements completed by it"""
+        self._buffer += text
+        items = []
+        pos = 0
+        buffer = self._buffer
+
+        while not self.done:
+            # Skip whitespace and separators between elements
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos == len(buffer):
+                break
+
+            if not self._started:
+                if buffer[pos] != "[":
+                    raise ValueError("Campaign feed is not a JSON array")
+                self._started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == "]":
+                self.done = True
+                pos += 1
+                break
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Element is not complete yet
+                break
+            if end == len(buffer) and not isinstance(item, (dict, list)):
+                # A number may continue in the next piece
+                break
+            items.append(item)
+            pos = end
+
+        self._buffer = buffer[pos:]
+        return items
+
+    def close(self) -> None:
+        """Check that the array was complete"""
+        if not self.done:
+            raise ValueError("Campaign feed ended before the JSON array was closed")
+
+
+class CampaignFeedReader:
+    """
+    Streams a bank's campaign feed in fixed-size chunks
+
+    Handles, per page:
+    - NDJSON (application/x-ndjson), parsed line by line
+    - a top-level JSON array, parsed incrementally
+    - a JSON envelope, {"campaigns": [...], "deleted": [...], "next_cursor": ...,
+      "next": "<url>" or "next_page": <n>}, parsed one page at a time
+
+    Pages are followed through the Link rel="next" header or the envelope's
+    next/next_page. Conditional headers go out with the first request only;
+    a 304 leaves `not_modified` set and yields nothing. Tombstones, the next
+    sync cursor and the validators of the response are collected on the
+    reader while the chunks are consumed.
+
+    `track` guards each call to the bank (e.g. BankApiClient.track): it is
+    entered around every page request, up to its status and headers. The
+    time the consumer spends on a chunk is never tracked; a body that fails
+    mid-stream is reported through a tracked call of its own.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        track: Optional[Callable[[], AsyncContextManager[None]]] = None
+    ):
+        self.url = url
+        self.headers = headers
+        self.params = params
+        self.chunk_size = chunk_size or settings.CAMPAIGN_SYNC_STREAM_CHUNK_SIZE
+        self.session = session
+        self.timeout = timeout
+        self.track = track or nullcontext
+
+        self.not_modified = False
+        self.delta = False
+        self.deleted: List[str] = []
+        self.cursor: Optional[str] = None
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.pages = 0
+        self._next_url: Optional[str] = None
+        self._next_page: Optional[Any] = None
+
+    async def chunks(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield the feed's campaigns in chunks of at most chunk_size"""
+        if self.session is not None:
+            async for chunk in self._read(self.session):
+                yield chunk
+        else:
+            async with aiohttp.ClientSession() as session:
+                async for chunk in self._read(session):
+                    yield chunk
+
+    async def _read(self, session: aiohttp.ClientSession) -> AsyncIterator[List[Dict[str, Any]]]:
+        url = self.url
+        params = self.params
+        headers = self.headers
+        chunk: List[Dict[str, Any]] = []
+
+        while url:
+            if self.pages >= settings.CAMPAIGN_SYNC_MAX_PAGES:
+                raise ValueError(f"Campaign feed exceeded {settings.CAMPAIGN_SYNC_MAX_PAGES} pages")
+
+            request_options = {"timeout": self.timeout} if self.timeout else {}
+            async with self.track():
+                response = await session.get(url, headers=headers, params=params, **request_options)
+                try:
+                    if response.status == 304 and self.pages == 0:
+                        self.not_modified = True
+                    else:
+                        response.raise_for_status()
+                except BaseException:
+                    response.release()
+                    raise
+            if self.not_modified:
+                response.release()
+                return
+
+            try:
+                self.pages += 1
+
+                if self.pages == 1:
+                    self.etag = response.headers.get("ETag")
+                    self.last_modified = response.headers.get("Last-Modified")
+
+                next_url = None
+                next_link = response.links.get("next")
+                if next_link:
+                    next_url = str(response.url.join(next_link["url"]))
+
+                self._next_url = None
+                self._next_page = None
+                async for item in self._items(response):
+                    chunk.append(item)
+                    if len(chunk) >= self.chunk_size:
+                        yield chunk
+                        chunk = []
+
+                if next_url or self._next_url:
+                    # Next links carry their own query string
+                    url = next_url or str(response.url.join(URL(self._next_url)))
+                    params = None
+                elif self._next_page is not None:
+                    url = str(response.url.with_query(None))
+                    params = {**dict(response.url.query), "page": self._next_page}
+                else:
+                    url = None
+            except (ClientError, asyncio.TimeoutError):
+                # The bank dropped the stream: a failed call
+                async with self.track():
+                    raise
+            finally:
+                response.release()
+
+            # Validators only apply to the first page
+            headers = {
+                key: value for key, value in headers.items()
+                if key not in ("If-None-Match", "If-Modified-Since")
+            }
+
+        if chunk:
+            yield chunk
+
+    async def _items(self, response: aiohttp.ClientResponse) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the campaigns of one page"""
+        content_type = response.headers.get("Content-Type", "")
+
+        if "ndjson" in content_type or "jsonl" in content_type:
+            async for line in response.content:
+                line = line.strip()
+                if line:
+                    async for item in self._campaign_items([json.loads(line)]):
+                        yield item
+            return
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        array = None
+        head = ""
+
+        async for data in response.content.iter_chunked(64 * 1024):
+            text = decoder.decode(data)
+            if array is None:
+                head += text
+                stripped = head.lstrip()
+                if not stripped:
+                    continue
+                if stripped[0] != "[":
+                    # Envelope pages are bounded by the page size; read the rest
+                    body = head + decoder.decode(await response.content.read(), final=True)
+                    async for item in self._envelope_items(json.loads(body)):
+                        yield item
+                    return
+                array = JsonArrayStream()
+                text, head = head, ""
+
+            async for item in self._campaign_items(array.feed(text)):
+                yield item
+
+        if array is None:
+            raise ValueError("Empty campaign feed response")
+        array.feed(decoder.decode(b"", final=True))
+        array.close()
+
+    async def _envelope_items(self, payload: Any) -> AsyncIterator[Dict[str, Any]]:
+        if not isinstance(payload, dict):
+            raise ValueError("Invalid campaign data format from bank API")
+
+        self.delta = True
+        items = payload.get("campaigns", payload.get("changes"))
+        if not isinstance(items, list):
+            raise ValueError("Invalid campaign data format from bank API")
+
+        self.deleted.extend(str(external_id) for external_id in payload.get("deleted") or [])
+        self.cursor = payload.get("next_cursor") or payload.get("cursor") or self.cursor
+
+        async for item in self._campaign_items(items):
+            yield item
+
+        self._next_url = payload.get("next")
+        self._next_page = payload.get("next_page")
+
+    async def _campaign_items(self, items: List[Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield campaigns, collecting items flagged as deleted as tombstones"""
+        for item in items:
+            if not isinstance(item, dict):
+                raise ValueError("Invalid campaign data format from bank API")
+            if item.get("deleted"):
+                external_id = item.get("external_id") or item.get("id")
+                if external_id:
+                    self.deleted.append(str(external_id))
+                continue
+            yield item
@@ -0,0 +1,98 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, text, update
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign, CatalogState
+from app.services.cache_invalidation import publish_invalidation
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignLifecycleService:
+    """
+    Moves campaigns through their start and end dates
+
+    Expired campaigns are deactivated, so is_active only covers live and
+    upcoming campaigns. Campaigns reaching their start date are already
+    active; the catalog version is bumped instead, so cached listings that
+    filter on the current time pick them up right away. Both are
+    invalidation events for every catalog cache.
+
+    Start and end dates are stored without a time zone and compared with the
+    app's local time, as the listing endpoints do.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def expire_campaigns(self, now: datetime) -> List[int]:
+        """Deactivate active campaigns whose end date has passed; returns their IDs"""
+        # The catalog version trigger bumps the version and logs the changes
+        result = self.db.execute(
+            update(Campaign)
+            .where(Campaign.is_active == True, Campaign.end_date <= now)
+            .values(is_active=False, updated_at=func.now())
+            .returning(Campaign.id)
+        )
+        expired = [row[0] for row in result]
+        if expired:
+            publish_invalidation(self.db, "campaign", expired)
+        return expired
+
+    def announce_started_campaigns(self, now: datetime) -> bool:
+        """
+        Bump the catalog version if a campaign started since the last bump
+
+        Comparing with the version's own timestamp keeps several processes
+        sweeping the same boundary from each bumping it.
+        """
+        updated_at = self.db.query(CatalogState.updated_at).filter(CatalogState.id == 1).scalar()
+        last_bump = updated_at.astimezone().replace(tzinfo=None) if updated_at else None
+
+        started = self.db.query(Campaign.id).filter(
+            Campaign.is_active == True,
+            Campaign.start_date <= now,
+            Campaign.end_date > now
+        )
+        if last_bump is not None:
+            started = started.filter(Campaign.start_date > last_bump)
+        if not self.db.query(started.exists()).scalar():
+            return False
+
+        self.db.execute(text("SELECT bump_catalog_version()"))
+        return True
+
+    def next_boundary(self, now: datetime) -> Optional[datetime]:
+        """Earliest upcoming start or end date of an active campaign"""
+        return self.db.query(
+            func.least(
+                func.min(Campaign.start_date).filter(Campaign.start_date > now),
+                func.min(Campaign.end_date).filter(Campaign.end_date > now)
+            )
+        ).filter(Campaign.is_active == True).scalar()
+
+    def sweep(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """
+        Apply every boundary up to now
+
+        Returns:
+        - Expired campaign IDs, whether a start was announced and the next boundary
+        """
+        now = now or datetime.now()
+        expired = self.expire_campaigns(now)
+        started = self.announce_started_campaigns(now)
+        next_boundary = self.next_boundary(now)
+        self.db.commit()
+
+        if expired or started:
+            logger.info(f"Campaign lifecycle sweep: expired {len(expired)} campaigns, started campaigns: {started}")
+
+        return {
+            "success": True,
+            "expired_campaign_ids": expired,
+            "started": started,
+            "next_boundary": next_boundary
+        }
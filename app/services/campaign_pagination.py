@@ -0,0 +1,165 @@
+import base64
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, literal, tuple_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.config import settings
+from app.models.campaign import Campaign
+from app.services.cache_invalidation import InvalidationEvent, invalidation_bus
+
+logger = logging.getLogger(__name__)
+
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(campaign: Campaign) -> str:
+    """Opaque cursor pointing just past the given campaign in (created_at, id) order"""
+    payload = json.dumps([campaign.created_at.isoformat(), campaign.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Raises:
+    - ValueError: The cursor is malformed
+    """
+    try:
+        created_at, campaign_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), int(campaign_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def keyset_page(
+    query: Query,
+    limit: int,
+    cursor: Optional[Cursor] = None,
+    skip: int = 0
+) -> Tuple[List[Campaign], Optional[str]]:
+    """
+    One page of campaigns, newest first, and the cursor of the next page
+
+    With a cursor the page continues after it, so it is read straight off a
+    (created_at, id) index however deep it is; without one `skip` is applied
+    for callers that still page by offset. The next cursor is None on the
+    last page.
+    """
+    if cursor is not None:
+        created_at, campaign_id = cursor
+        # Typed binds, so the cursor's UTC offset isn't dropped by a cast to a naive timestamp
+        query = query.filter(
+            tuple_(Campaign.created_at, Campaign.id) <
+            tuple_(literal(created_at, Campaign.created_at.type), literal(campaign_id, Campaign.id.type))
+        )
+    elif skip:
+        query = query.offset(skip)
+
+    campaigns = query\
+        .order_by(Campaign.created_at.desc(), Campaign.id.desc())\
+        .limit(limit + 1)\
+        .all()
+
+    if len(campaigns) > limit:
+        campaigns = campaigns[:limit]
+        return campaigns, encode_cursor(campaigns[-1])
+    return campaigns, None
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, compiled with its bound parameters"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+# Cached counts by query: (expires_at, count, estimated), in order of expiry
+_count_cache: "OrderedDict[str, Tuple[float, int, bool]]" = OrderedDict()
+_count_cache_lock = threading.Lock()
+
+
+def _cache_key(query: Query) -> str:
+    """
+    The query's SQL and bound parameters
+
+    Listings bind the current time; it's rounded down to the count TTL so
+    requests within one TTL share a key instead of each adding its own.
+    """
+    compiled = query.statement.compile()
+    ttl = max(settings.CAMPAIGN_COUNT_CACHE_TTL_SECONDS, 1)
+    params = sorted(
+        (name, ("time-bucket", int(value.timestamp() // ttl)) if isinstance(value, datetime) else value)
+        for name, value in compiled.params.items()
+    )
+    return f"{compiled}|{params!r}"
+
+
+def _store_count(key: str, entry: Tuple[float, int, bool], now: float) -> None:
+    """Cache a count, dropping expired entries and the oldest beyond CAMPAIGN_COUNT_CACHE_SIZE"""
+    with _count_cache_lock:
+        _count_cache.pop(key, None)
+        _count_cache[key] = entry
+        # Entries share one TTL, so the expired ones are at the front
+        while _count_cache:
+            oldest_key, (expires_at, _, _) = next(iter(_count_cache.items()))
+            if expires_at > now and len(_count_cache) <= settings.CAMPAIGN_COUNT_CACHE_SIZE:
+                break
+            del _count_cache[oldest_key]
+
+
+def estimate_count(query: Query) -> int:
+    """Planner's row estimate for the query, without running it"""
+    plan = query.session.execute(_Explain(query.statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_campaigns(query: Query) -> Tuple[int, bool]:
+    """
+    Number of campaigns matching a listing query, and whether it's estimated
+
+    Counts are cached for CAMPAIGN_COUNT_CACHE_TTL_SECONDS. Queries the
+    planner expects to match more than CAMPAIGN_COUNT_EXACT_LIMIT rows get
+    its estimate instead of an exact count, so a count never scans a large
+    part of the table.
+    """
+    key = _cache_key(query)
+    now = time.monotonic()
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1], cached[2]
+
+    count = estimate_count(query)
+    estimated = count > settings.CAMPAIGN_COUNT_EXACT_LIMIT
+    if not estimated:
+        count = query.order_by(None).with_entities(func.count(Campaign.id)).scalar()
+
+    _store_count(key, (now + settings.CAMPAIGN_COUNT_CACHE_TTL_SECONDS, count, estimated), now)
+    return count, estimated
+
+
+def clear_count_cache() -> None:
+    with _count_cache_lock:
+        _count_cache.clear()
+
+
+@invalidation_bus.subscribe
+def _evict_counts(event: InvalidationEvent) -> None:
+    # Counts aren't keyed by catalog version; any catalog write may change them
+    clear_count_cache()
@@ -0,0 +1,64 @@
+import re
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import func, literal
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign
+
+
+class CampaignSearchService:
+    """
+    Ranked full-text search over campaigns
+
+    Campaigns carry a search_vector built by a database trigger from the
+    campaign name, its bank, card and merchant names and the description,
+    Turkish-normalized by campaign_search_normalize() and indexed with GIN.
+    Queries are normalized the same way and every term matches as a prefix,
+    so partially typed words already find results.
+    """
+
+    MAX_TERMS = 10
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @classmethod
+    def build_tsquery(cls, q: str) -> Optional[str]:
+        """Prefix tsquery text ANDing the words of q, or None if q has no words"""
+        terms = [term for term in re.findall(r"\w+", q) if term.strip("_")]
+        if not terms:
+            return None
+        return " & ".join(f"{term}:*" for term in terms[:cls.MAX_TERMS])
+
+    def search(
+        self,
+        q: str,
+        skip: int = 0,
+        limit: int = 100,
+        now: Optional[datetime] = None
+    ) -> List[Campaign]:
+        """Active, running campaigns matching q, best matches first"""
+        tsquery_text = self.build_tsquery(q)
+        if tsquery_text is None:
+            return []
+
+        now = now or datetime.now()
+        tsquery = func.to_tsquery("simple", func.campaign_search_normalize(literal(tsquery_text)))
+
+        return self.db.query(Campaign)\
+            .filter(
+                Campaign.search_vector.op("@@")(tsquery),
+                Campaign.is_active == True,
+                Campaign.start_date <= now,
+                Campaign.end_date > now
+            )\
+            .order_by(
+                func.ts_rank_cd(Campaign.search_vector, tsquery).desc(),
+                Campaign.created_at.desc(),
+                Campaign.id.desc()
+            )\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, distinct, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.campaign import Bank, Campaign, CampaignStatus, CreditCard
+from app.models.user import Recommendation, RecommendationClick
+from app.services.cache_invalidation import ALL, InvalidationEvent, invalidation_bus
+from app.services.catalog_cache import get_catalog_version
+
+logger = logging.getLogger(__name__)
+
+EXPIRING_SOON_DAYS = 7
+
+# (catalog version, time bucket) -> summary
+_summary_cache: Dict[Tuple[int, int], Dict[str, int]] = {}
+_summary_cache_lock = threading.Lock()
+
+
+def clear_summary_cache() -> None:
+    with _summary_cache_lock:
+        _summary_cache.clear()
+
+
+@invalidation_bus.subscribe
+def _evict_summary(event: InvalidationEvent) -> None:
+    # Keyed by catalog version; only a resync can leave an entry stale
+    if event.entity == ALL:
+        clear_summary_cache()
+
+
+class CampaignStatsService:
+    """
+    Campaign counters and performance figures for the stats and admin endpoints
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_summary(self) -> Dict[str, int]:
+        """
+        Campaign counters, cached per catalog version
+
+        Counters that depend on the current time (active, expiring soon,
+        expired) are also reused for at most CATALOG_CACHE_TIME_BUCKET_SECONDS.
+        """
+        key = (get_catalog_version(self.db), int(time.time() // settings.CATALOG_CACHE_TIME_BUCKET_SECONDS))
+        with _summary_cache_lock:
+            summary = _summary_cache.get(key)
+        if summary is not None:
+            return summary
+
+        summary = self.compute_summary()
+        with _summary_cache_lock:
+            # Only the current key is ever read again
+            _summary_cache.clear()
+            _summary_cache[key] = summary
+        return summary
+
+    def compute_summary(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """All campaign counters in one pass over campaigns"""
+        now = now or datetime.now()
+        live = and_(Campaign.is_active == True, Campaign.end_date >= now)
+
+        row = self.db.query(
+            func.count().label("total"),
+            func.count().filter(Campaign.is_active == True).label("active"),
+            func.count().filter(
+                live,
+                Campaign.end_date <= now + timedelta(days=EXPIRING_SOON_DAYS)
+            ).label("expiring_soon"),
+            func.count().filter(live, Campaign.start_date <= now).label("live"),
+            func.count().filter(live, Campaign.start_date > now).label("scheduled"),
+            func.count().filter(Campaign.end_date < now).label("expired"),
+            func.count().filter(Campaign.status == CampaignStatus.PENDING).label("pending"),
+            func.count().filter(Campaign.status == CampaignStatus.REJECTED).label("rejected"),
+        ).one()
+
+        return {key: value or 0 for key, value in row._asdict().items()}
+
+    def get_campaign_performance(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
+        """
+        Impressions, clicks and CTR per recommended campaign, most impressions first
+
+        Counts are aggregated per campaign in a subquery, then joined with
+        the campaign, bank and card names in the same statement.
+        """
+        counts = self.db.query(
+            Recommendation.campaign_id.label("campaign_id"),
+            func.count(distinct(Recommendation.id)).label("impression_count"),
+            func.count(RecommendationClick.id).label("click_count")
+        ).outerjoin(
+            RecommendationClick,
+            Recommendation.id == RecommendationClick.recommendation_id
+        ).filter(
+            Recommendation.created_at >= start_date,
+            Recommendation.created_at <= end_date
+        ).group_by(Recommendation.campaign_id).subquery()
+
+        rows = self.db.query(
+            counts.c.campaign_id,
+            counts.c.impression_count,
+            counts.c.click_count,
+            Campaign.name.label("campaign_name"),
+            Bank.name.label("bank_name"),
+            CreditCard.name.label("card_name")
+        ).join(
+            Campaign, Campaign.id == counts.c.campaign_id
+        ).outerjoin(
+            Bank, Bank.id == Campaign.bank_id
+        ).outerjoin(
+            CreditCard, CreditCard.id == Campaign.card_id
+        ).order_by(counts.c.impression_count.desc(), counts.c.campaign_id).all()
+
+        return [
+            {
+                "campaign_id": row.campaign_id,
+                "campaign_name": row.campaign_name,
+                "bank_name": row.bank_name or "Unknown",
+                "card_name": row.card_name or "Unknown",
+                "impression_count": row.impression_count,
+                "click_count": row.click_count,
+                "ctr": round(row.click_count / row.impression_count * 100, 2) if row.impression_count else 0
+            }
+            for row in rows
+        ]
@@ -0,0 +1,157 @@
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.campaign import CampaignSyncRun, CampaignSyncRunStatus
+
+logger = logging.getLogger(__name__)
+
+
+class CampaignSyncRunService:
+    """
+    Queue and bookkeeping of bank campaign sync runs
+
+    The API and the schedule only enqueue runs; sync workers claim them with
+    FOR UPDATE SKIP LOCKED, so any number of workers can poll the same queue,
+    and report progress back into the run's row.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(
+        self,
+        bank_id: Optional[int] = None,
+        trigger: str = "manual",
+        requested_by: Optional[int] = None
+    ) -> CampaignSyncRun:
+        """
+        Queue a sync of one bank, or of every enabled bank if bank_id is None
+
+        A run already waiting for the same bank(s) is returned instead of
+        queueing a duplicate.
+        """
+        queued = self.db.query(CampaignSyncRun).filter(
+            CampaignSyncRun.status == CampaignSyncRunStatus.QUEUED,
+            CampaignSyncRun.bank_id.is_(None) if bank_id is None else CampaignSyncRun.bank_id == bank_id
+        ).first()
+        if queued:
+            return queued
+
+        run = CampaignSyncRun(
+            bank_id=bank_id,
+            trigger=trigger,
+            requested_by=requested_by,
+            status=CampaignSyncRunStatus.QUEUED,
+            progress=[]
+        )
+        self.db.add(run)
+        self.db.commit()
+        self.db.refresh(run)
+        return run
+
+    def claim_next(self, worker_id: str) -> Optional[CampaignSyncRun]:
+        """Claim the oldest queued run for this worker"""
+        next_run = (
+            select(CampaignSyncRun.id)
+            .where(CampaignSyncRun.status == CampaignSyncRunStatus.QUEUED)
+            .order_by(CampaignSyncRun.created_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        run_id = self.db.execute(
+            update(CampaignSyncRun)
+            .where(CampaignSyncRun.id == next_run.scalar_subquery())
+            .values(
+                status=CampaignSyncRunStatus.RUNNING,
+                worker_id=worker_id,
+                started_at=func.now(),
+                heartbeat_at=func.now()
+            )
+            .returning(CampaignSyncRun.id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        self.db.commit()
+
+        if run_id is None:
+            return None
+        logger.info(f"Worker {worker_id} claimed campaign sync run {run_id}")
+        return self.get(run_id)
+
+    def start(self, run_id: int, total_banks: int) -> None:
+        self._update(run_id, total_banks=total_banks)
+
+    def heartbeat(self, run_id: int) -> None:
+        self._update(run_id, heartbeat_at=func.now())
+
+    def record_bank_result(self, run_id: int, bank_id: int, bank_name: str, result: Dict[str, Any]) -> None:
+        """Append one bank's outcome to the run's progress"""
+        entry = {
+            "bank_id": bank_id,
+            "bank_name": bank_name,
+            "success": bool(result.get("success")),
+            "message": result.get("message"),
+            "imported_campaigns": result.get("imported_campaigns", 0)
+        }
+        self._update(
+            run_id,
+            # Appended in SQL, so concurrent writers can't drop each other's entries
+            progress=CampaignSyncRun.progress.op("||")(literal([entry], JSONB)),
+            completed_banks=CampaignSyncRun.completed_banks + 1,
+            heartbeat_at=func.now()
+        )
+
+    def finish(self, run_id: int, result: Dict[str, Any]) -> None:
+        status = CampaignSyncRunStatus.SUCCEEDED if result.get("success") else CampaignSyncRunStatus.FAILED
+        self._update(
+            run_id,
+            status=status,
+            result=result,
+            error=None if result.get("success") else result.get("message"),
+            finished_at=func.now()
+        )
+
+    def fail(self, run_id: int, error: str) -> None:
+        self._update(run_id, status=CampaignSyncRunStatus.FAILED, error=error, finished_at=func.now())
+
+    def fail_abandoned_runs(self) -> int:
+        """Fail running runs whose worker stopped sending heartbeats"""
+        lease = timedelta(seconds=settings.CAMPAIGN_SYNC_RUN_LEASE_SECONDS)
+        result = self.db.execute(
+            update(CampaignSyncRun)
+            .where(
+                CampaignSyncRun.status == CampaignSyncRunStatus.RUNNING,
+                CampaignSyncRun.heartbeat_at < func.now() - lease
+            )
+            .values(
+                status=CampaignSyncRunStatus.FAILED,
+                error="Sync worker stopped responding",
+                finished_at=func.now()
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return result.rowcount
+
+    def get(self, run_id: int) -> Optional[CampaignSyncRun]:
+        return self.db.query(CampaignSyncRun).filter(CampaignSyncRun.id == run_id).first()
+
+    def list_recent(self, limit: int = 20, bank_id: Optional[int] = None) -> List[CampaignSyncRun]:
+        query = self.db.query(CampaignSyncRun)
+        if bank_id is not None:
+            query = query.filter(CampaignSyncRun.bank_id == bank_id)
+        return query.order_by(CampaignSyncRun.created_at.desc()).limit(limit).all()
+
+    def _update(self, run_id: int, **values: Any) -> None:
+        self.db.execute(
+            update(CampaignSyncRun)
+            .where(CampaignSyncRun.id == run_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
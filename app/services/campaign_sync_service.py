@@ -1,13 +1,23 @@
 import logging
 import asyncio
+import hashlib
+import json
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 import aiohttp
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, case, func, cast, column, true, update, values
+from sqlalchemy.dialects.postgresql import insert
 
-from app.models.campaign import Bank, Campaign, CampaignSource, CampaignStatus
-from app.utils.crypto import decrypt_data
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.campaign import Bank, Campaign, CampaignCategory, CampaignSource, CampaignStatus
+from app.models.enums import DiscountType
+from app.services.bank_api_client import bank_api_client
+from app.services.cache_invalidation import publish_invalidation
+from app.services.campaign_feed_reader import CampaignFeedReader
+from app.services.campaign_pagination import decode_cursor, keyset_page
+from app.utils.crypto import get_bank_credentials
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +25,32 @@ logger = logging.getLogger(__name__)
 class CampaignSyncService:
     """Service for syncing campaigns from bank APIs and managing the approval process"""
     
-    def __init__(self, db: Session):
+    # Columns refreshed from the bank feed when an imported campaign already
+    # exists; a column the feed left out keeps its stored value
+    SYNC_UPDATE_COLUMNS = (
+        "name", "description", "card_id", "category_id", "discount_type",
+        "discount_value", "min_amount", "max_discount", "start_date", "end_date",
+        "merchant_id", "is_active", "requires_enrollment", "enrollment_url"
+    )
+    
+    def __init__(self, db: Session, session_factory: Callable[[], Session] = SessionLocal):
         self.db = db
+        self.session_factory = session_factory
     
-    async def sync_all_banks(self) -> Dict[str, Any]:
-        """Sync campaigns from all banks that have campaign_sync_enabled"""
+    async def sync_all_banks(
+        self,
+        concurrent: bool = True,
+        on_bank_synced: Optional[Callable[[Bank, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Sync campaigns from all banks that have campaign_sync_enabled
+
+        Parameters:
+        - concurrent: Sync banks concurrently, each with its own DB session and
+          timeout, instead of one after another on this service's session
+        - on_bank_synced: Called with each bank and its result as soon as the
+          bank is done, e.g. to report progress
+        """
         
         banks = self.db.query(Bank).filter(Bank.campaign_sync_enabled == True).all()
         if not banks:
@@ -31,27 +62,64 @@ class CampaignSyncService:
             }
         
         total_campaigns = 0
+        unchanged_campaigns = 0
         synced_banks = 0
         failed_banks = []
         
-        for bank in banks:
+        def report(bank: Bank, result: Any) -> None:
+            if on_bank_synced is None:
+                return
+            if isinstance(result, Exception):
+                result = {"success": False, "message": str(result)}
             try:
-                result = await self.sync_bank_campaigns(bank.id)
-                if result["success"]:
-                    total_campaigns += result["imported_campaigns"]
-                    synced_banks += 1
-                else:
-                    failed_banks.append({
-                        "bank_id": bank.id,
-                        "bank_name": bank.name,
-                        "error": result["message"]
-                    })
+                on_bank_synced(bank, result)
             except Exception as e:
-                logger.error(f"Error syncing campaigns for bank {bank.name}: {str(e)}")
+                logger.error(f"Error reporting sync progress for bank {bank.name}: {str(e)}")
+        
+        if concurrent:
+            semaphore = asyncio.Semaphore(settings.CAMPAIGN_SYNC_CONCURRENCY)
+
+            async def sync_bank(bank: Bank) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        result = await self._sync_bank_isolated(bank.id)
+                    except Exception as e:
+                        result = e
+                report(bank, result)
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+            results = await asyncio.gather(
+                *(sync_bank(bank) for bank in banks),
+                return_exceptions=True
+            )
+        else:
+            results = []
+            for bank in banks:
+                try:
+                    results.append(await self.sync_bank_campaigns(bank.id))
+                except Exception as e:
+                    results.append(e)
+                report(bank, results[-1])
+        
+        for bank, result in zip(banks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error syncing campaigns for bank {bank.name}: {str(result)}")
                 failed_banks.append({
                     "bank_id": bank.id,
                     "bank_name": bank.name,
-                    "error": str(e)
+                    "error": str(result)
+                })
+            elif result["success"]:
+                total_campaigns += result["imported_campaigns"]
+                unchanged_campaigns += result.get("unchanged_campaigns", 0)
+                synced_banks += 1
+            else:
+                failed_banks.append({
+                    "bank_id": bank.id,
+                    "bank_name": bank.name,
+                    "error": result["message"]
                 })
         
         return {
@@ -59,9 +127,32 @@ class CampaignSyncService:
             "message": f"Synced campaigns from {synced_banks} banks",
             "synced_banks": synced_banks,
             "failed_banks": failed_banks,
-            "total_campaigns": total_campaigns
+            "total_campaigns": total_campaigns,
+            "unchanged_campaigns": unchanged_campaigns
         }
     
+    async def _sync_bank_isolated(self, bank_id: int) -> Dict[str, Any]:
+        """
+        Sync one bank on its own DB session, bounded by the per-bank timeout
+        
+        A session can't be shared between concurrently running syncs, and a
+        slow bank must not hold up the rest of the run.
+        """
+        db = self.session_factory()
+        try:
+            return await asyncio.wait_for(
+                CampaignSyncService(db, session_factory=self.session_factory).sync_bank_campaigns(bank_id),
+                timeout=settings.CAMPAIGN_SYNC_BANK_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            db.rollback()
+            return {
+                "success": False,
+                "message": f"Sync timed out after {settings.CAMPAIGN_SYNC_BANK_TIMEOUT_SECONDS}s"
+            }
+        finally:
+            db.close()
+    
     async def sync_bank_campaigns(self, bank_id: int) -> Dict[str, Any]:
         """
         Sync campaigns from a specific bank's API
@@ -87,8 +178,7 @@ class CampaignSyncService:
             }
         
         # Decrypt API credentials
-        api_key = decrypt_data(bank.api_key) if bank.api_key else None
-        api_secret = decrypt_data(bank.api_secret) if bank.api_secret else None
+        api_key, api_secret = get_bank_credentials(bank)
         
         if not api_key or not api_secret:
             return {
@@ -96,74 +186,138 @@ class CampaignSyncService:
                 "message": "Bank API credentials not configured"
             }
         
-        # Call bank API to get campaigns
+        # Stream campaigns from the bank API (only the changes, if the bank
+        # supports it) and import them chunk by chunk
         try:
-            campaigns = await self._call_bank_api(
-                bank=bank,
-                endpoint=bank.campaign_sync_endpoint,
-                method="GET",
-                data=None,
-                api_key=api_key,
-                api_secret=api_secret
-            )
+            feed = self._open_campaign_feed(bank, api_key=api_key, api_secret=api_secret)
+            category_ids = self._get_category_ids()
+            totals = {
+                "imported_campaigns": 0,
+                "updated_campaigns": 0,
+                "unchanged_campaigns": 0,
+                "new_campaigns": 0,
+                "pending_approval": 0,
+                "auto_approved": 0
+            }
+            
+            async for campaigns in feed.chunks():
+                import_result = await self._process_imported_campaigns(
+                    bank_id=bank.id,
+                    campaigns=campaigns,
+                    auto_approve=bank.auto_approve_campaigns,
+                    category_ids=category_ids
+                )
+                for key in totals:
+                    totals[key] += import_result[key]
             
-            if not campaigns or not isinstance(campaigns, list):
+            if feed.not_modified:
+                bank.last_campaign_sync_at = datetime.now()
+                self.db.commit()
                 return {
-                    "success": False,
-                    "message": "Invalid campaign data format from bank API"
+                    "success": True,
+                    "message": "Campaigns not modified since last sync",
+                    "not_modified": True,
+                    "deleted_campaigns": 0,
+                    **totals
                 }
             
-            # Process the imported campaigns
-            import_result = await self._process_imported_campaigns(
-                bank_id=bank.id,
-                campaigns=campaigns,
-                auto_approve=bank.auto_approve_campaigns
-            )
+            # Malformed feeds raise while streaming; an empty feed is a valid,
+            # empty catalog, and its validators are stored like any other
+            deleted_campaigns = self._archive_deleted_campaigns(bank.id, feed.deleted)
+            if deleted_campaigns:
+                publish_invalidation(self.db, "campaign")
             
-            # Update the last sync time
+            # Only move the sync position forward once the changes are stored
+            bank.campaign_sync_cursor = feed.cursor or bank.campaign_sync_cursor
+            bank.campaign_sync_etag = feed.etag
+            bank.campaign_sync_last_modified = feed.last_modified
             bank.last_campaign_sync_at = datetime.now()
             self.db.commit()
             
             return {
                 "success": True,
-                "message": f"Successfully synced {import_result['imported_campaigns']} campaigns",
-                "imported_campaigns": import_result["imported_campaigns"],
-                "updated_campaigns": import_result["updated_campaigns"],
-                "new_campaigns": import_result["new_campaigns"],
-                "pending_approval": import_result["pending_approval"],
-                "auto_approved": import_result["auto_approved"]
+                "message": f"Successfully synced {totals['imported_campaigns']} campaigns",
+                "not_modified": False,
+                "deleted_campaigns": deleted_campaigns,
+                **totals
             }
             
         except Exception as e:
+            self.db.rollback()
             logger.error(f"Error syncing campaigns from bank {bank.name}: {str(e)}")
             return {
                 "success": False,
                 "message": f"Sync failed: {str(e)}"
             }
     
+    def reset_sync_state(self, bank_id: int) -> None:
+        """Forget a bank's delta sync position so the next sync downloads the full feed"""
+        bank = self.db.query(Bank).filter(Bank.id == bank_id).first()
+        if bank:
+            bank.campaign_sync_cursor = None
+            bank.campaign_sync_etag = None
+            bank.campaign_sync_last_modified = None
+            self.db.commit()
+    
+    def _archive_deleted_campaigns(self, bank_id: int, external_ids: List[str]) -> int:
+        """
+        Apply tombstones from a delta feed
+        
+        Deleted campaigns are archived and deactivated rather than removed, so
+        reminders and notification history keep pointing at them, and are
+        revived if the bank publishes them again. Campaigns an admin already
+        rejected or archived are left as they are.
+        """
+        if not external_ids:
+            return 0
+        
+        result = self.db.execute(
+            update(Campaign)
+            .where(
+                Campaign.bank_id == bank_id,
+                Campaign.source == CampaignSource.BANK_API,
+                Campaign.external_id.in_(external_ids),
+                Campaign.status.in_([CampaignStatus.PENDING, CampaignStatus.APPROVED])
+            )
+            .values(status=CampaignStatus.ARCHIVED, is_active=False, last_sync_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
     async def _process_imported_campaigns(
         self,
         bank_id: int,
         campaigns: List[Dict[str, Any]],
-        auto_approve: bool = False
+        auto_approve: bool = False,
+        category_ids: Optional[Dict[str, int]] = None
     ) -> Dict[str, int]:
         """
         Process imported campaigns from a bank API
         
+        Campaigns are written in chunks, one INSERT for the new ones and one
+        UPDATE ... FROM (VALUES ...) for the existing ones per chunk, instead
+        of one lookup per campaign. Fields the feed leaves out get defaults on
+        new campaigns and keep their stored values on existing ones, as delta
+        and partial feeds only carry what changed. Campaigns archived by a
+        tombstone come back when the bank publishes them again; campaigns
+        rejected by an admin are left untouched.
+        
         Parameters:
         - bank_id: The bank ID these campaigns belong to
         - campaigns: List of campaign data from the bank API
         - auto_approve: Whether to automatically approve campaigns
+        - category_ids: Category enum to ID map, loaded if not given
         
         Returns:
         - Stats about processed campaigns
         """
-        imported_campaigns = 0
-        updated_campaigns = 0
-        new_campaigns = 0
-        pending_approval = 0
-        auto_approved = 0
+        if category_ids is None:
+            category_ids = self._get_category_ids()
+        status = CampaignStatus.APPROVED if auto_approve else CampaignStatus.PENDING
         
+        # Keyed by external ID: a statement can't touch the same row twice,
+        # and the last entry in the feed wins
+        rows: Dict[str, Dict[str, Any]] = {}
         for campaign_data in campaigns:
             external_id = campaign_data.get("external_id") or campaign_data.get("id")
             
@@ -171,141 +325,209 @@ class CampaignSyncService:
                 logger.warning("Campaign without external ID, skipping")
                 continue
             
-            # Check if this campaign already exists
-            existing_campaign = self.db.query(Campaign).filter(
-                and_(
-                    Campaign.bank_id == bank_id,
-                    Campaign.external_id == str(external_id),
-                    Campaign.source == CampaignSource.BANK_API
-                )
-            ).first()
-            
-            if existing_campaign:
-                # Update existing campaign
-                self._update_campaign_from_data(existing_campaign, campaign_data)
-                updated_campaigns += 1
-            else:
-                # Create new campaign
-                new_campaign = self._create_campaign_from_data(bank_id, campaign_data)
-                
-                if auto_approve:
-                    new_campaign.status = CampaignStatus.APPROVED
-                    auto_approved += 1
-                else:
-                    new_campaign.status = CampaignStatus.PENDING
-                    pending_approval += 1
-                
-                self.db.add(new_campaign)
-                new_campaigns += 1
-            
-            imported_campaigns += 1
+            values = self._campaign_values_from_data(bank_id, campaign_data, category_ids)
+            values["status"] = status
+            rows[str(external_id)] = values
+        
+        # Skip campaigns whose content hasn't changed since the last sync
+        existing_hashes = self._get_content_hashes(bank_id, list(rows))
+        imported_campaigns = len(rows)
+        new_rows = [
+            self._with_insert_defaults(values, category_ids)
+            for external_id, values in rows.items() if external_id not in existing_hashes
+        ]
+        changed_rows = [
+            values for external_id, values in rows.items()
+            if external_id in existing_hashes and existing_hashes[external_id] != values["content_hash"]
+        ]
+        unchanged_campaigns = imported_campaigns - len(new_rows) - len(changed_rows)
         
+        new_campaigns = 0
+        updated_campaigns = 0
+        chunk_size = settings.CAMPAIGN_SYNC_UPSERT_CHUNK_SIZE
+        
+        for start in range(0, len(new_rows), chunk_size):
+            new_campaigns += len(self.db.execute(
+                self._build_insert(new_rows[start:start + chunk_size])
+            ).scalars().all())
+        for start in range(0, len(changed_rows), chunk_size):
+            updated_campaigns += len(self.db.execute(
+                self._build_update(bank_id, changed_rows[start:start + chunk_size], status)
+            ).scalars().all())
+        
+        if new_campaigns or updated_campaigns:
+            # Published for all campaigns, as one small event per sync
+            publish_invalidation(self.db, "campaign")
         self.db.commit()
         
         return {
             "imported_campaigns": imported_campaigns,
             "updated_campaigns": updated_campaigns,
+            "unchanged_campaigns": unchanged_campaigns,
             "new_campaigns": new_campaigns,
-            "pending_approval": pending_approval,
-            "auto_approved": auto_approved
+            "pending_approval": 0 if auto_approve else new_campaigns,
+            "auto_approved": new_campaigns if auto_approve else 0
         }
     
-    def _create_campaign_from_data(
-        self,
-        bank_id: int,
-        campaign_data: Dict[str, Any]
-    ) -> Campaign:
-        """Create a new Campaign object from imported data"""
-        
-        # Map external category to internal category
-        category = self._map_external_category(campaign_data.get("category", "other"))
-        
-        # Map external discount type to internal discount type
-        discount_type = self._map_external_discount_type(campaign_data.get("discount_type", "percentage"))
-        
-        # Create new campaign
-        campaign = Campaign(
-            name=campaign_data.get("name", "Unnamed Campaign"),
-            description=campaign_data.get("description", ""),
-            bank_id=bank_id,
-            card_id=campaign_data.get("card_id"),  # May need to map from external ID
-            category=category,
-            discount_type=discount_type,
-            discount_value=float(campaign_data.get("discount_value", 0)),
-            min_amount=float(campaign_data.get("min_amount", 0)),
-            max_discount=float(campaign_data.get("max_discount")) if campaign_data.get("max_discount") else None,
-            start_date=self._parse_date(campaign_data.get("start_date")),
-            end_date=self._parse_date(campaign_data.get("end_date")),
-            merchant_id=campaign_data.get("merchant_id"),  # May need to map from external ID
-            is_active=campaign_data.get("is_active", True),
-            requires_enrollment=campaign_data.get("requires_enrollment", False),
-            enrollment_url=campaign_data.get("enrollment_url"),
-            source=CampaignSource.BANK_API,
-            external_id=str(campaign_data.get("external_id") or campaign_data.get("id")),
-            last_sync_at=datetime.now()
+    def _build_insert(self, rows: List[Dict[str, Any]]):
+        """
+        Build the insert statement for a chunk of new campaign rows
+        
+        A campaign inserted by a concurrent sync in the meantime is left to
+        that sync; it is compared by content hash again on the next one.
+        """
+        return insert(Campaign).values(rows).on_conflict_do_nothing(
+            index_elements=[Campaign.bank_id, Campaign.external_id, Campaign.source]
+        ).returning(Campaign.id)
+    
+    def _build_update(self, bank_id: int, rows: List[Dict[str, Any]], status: CampaignStatus):
+        """
+        Build the update statement for a chunk of existing campaign rows
+        
+        Each column is set to COALESCE(feed value, stored value), so fields
+        the feed left out (None in the row) are kept. Archived campaigns are
+        revived with the given status and made active again, even if their
+        content is unchanged. Returns the IDs of the updated campaigns; rows
+        skipped by the status or content hash guard are not returned.
+        """
+        table = Campaign.__table__
+        names = ("external_id", "content_hash", *self.SYNC_UPDATE_COLUMNS)
+        feed = values(*[column(name, table.c[name].type) for name in names], name="feed").data(
+            [tuple(row[name] for name in names) for row in rows]
+        )
+        # A VALUES column of NULLs is text to Postgres; cast to the campaigns column type
+        fed = {name: cast(feed.c[name], table.c[name].type) for name in names}
+        archived = Campaign.status == CampaignStatus.ARCHIVED
+        
+        return update(Campaign).where(
+            Campaign.bank_id == bank_id,
+            Campaign.source == CampaignSource.BANK_API,
+            Campaign.external_id == fed["external_id"],
+            Campaign.status.in_([CampaignStatus.PENDING, CampaignStatus.APPROVED, CampaignStatus.ARCHIVED]),
+            or_(archived, Campaign.content_hash.is_distinct_from(fed["content_hash"]))
+        ).values({
+            **{name: func.coalesce(fed[name], table.c[name]) for name in self.SYNC_UPDATE_COLUMNS},
+            "is_active": case(
+                (archived, func.coalesce(fed["is_active"], true())),
+                else_=func.coalesce(fed["is_active"], Campaign.is_active)
+            ),
+            "status": case((archived, status), else_=Campaign.status),
+            "content_hash": fed["content_hash"],
+            "last_sync_at": func.now(),
+            "updated_at": func.now()
+        }).returning(Campaign.id).execution_options(synchronize_session=False)
+    
+    def _get_content_hashes(self, bank_id: int, external_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Map the given external IDs of a bank's imported campaigns to their content hashes
+        
+        Archived campaigns map to None, so a re-published campaign is written
+        back even if its content is unchanged.
+        """
+        if not external_ids:
+            return {}
+        return dict(
+            self.db.query(
+                Campaign.external_id,
+                case((Campaign.status == CampaignStatus.ARCHIVED, None), else_=Campaign.content_hash)
+            ).filter(
+                Campaign.bank_id == bank_id,
+                Campaign.source == CampaignSource.BANK_API,
+                Campaign.external_id.in_(external_ids)
+            ).all()
         )
+    
+    @staticmethod
+    def _content_hash(values: Dict[str, Any]) -> str:
+        """
+        Stable hash of a campaign's normalized feed content
         
-        return campaign
+        Sync bookkeeping (last_sync_at, status) is left out so that a campaign
+        re-sent unchanged hashes the same on every sync.
+        """
+        content = {
+            key: value for key, value in values.items()
+            if key not in ("last_sync_at", "status", "content_hash")
+        }
+        payload = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
     
-    def _update_campaign_from_data(
+    def _get_category_ids(self) -> Dict[str, int]:
+        """Map category enum values to campaign_categories IDs"""
+        return {
+            category_enum.upper(): category_id
+            for category_id, category_enum in self.db.query(CampaignCategory.id, CampaignCategory.enum).all()
+        }
+    
+    def _campaign_values_from_data(
         self,
-        campaign: Campaign,
-        campaign_data: Dict[str, Any]
-    ) -> None:
-        """Update an existing Campaign object from imported data"""
-        
-        # Only update if the campaign is not edited manually
-        # If it's pending or approved, update it
-        if campaign.status in [CampaignStatus.PENDING, CampaignStatus.APPROVED]:
-            campaign.name = campaign_data.get("name", campaign.name)
-            campaign.description = campaign_data.get("description", campaign.description)
-            
-            # Only update card_id if provided and valid
-            if campaign_data.get("card_id"):
-                campaign.card_id = campaign_data.get("card_id")
-            
-            # Map category if provided
-            if campaign_data.get("category"):
-                campaign.category = self._map_external_category(campaign_data.get("category"))
-            
-            # Map discount_type if provided
-            if campaign_data.get("discount_type"):
-                campaign.discount_type = self._map_external_discount_type(campaign_data.get("discount_type"))
-            
-            # Update numeric values if provided
-            if campaign_data.get("discount_value") is not None:
-                campaign.discount_value = float(campaign_data.get("discount_value"))
-            
-            if campaign_data.get("min_amount") is not None:
-                campaign.min_amount = float(campaign_data.get("min_amount"))
-            
-            if campaign_data.get("max_discount") is not None:
-                campaign.max_discount = float(campaign_data.get("max_discount"))
-            
-            # Update dates if provided
-            if campaign_data.get("start_date"):
-                campaign.start_date = self._parse_date(campaign_data.get("start_date"))
-            
-            if campaign_data.get("end_date"):
-                campaign.end_date = self._parse_date(campaign_data.get("end_date"))
-            
-            # Update merchant if provided
-            if campaign_data.get("merchant_id"):
-                campaign.merchant_id = campaign_data.get("merchant_id")
-            
-            # Update boolean flags if provided
-            if campaign_data.get("is_active") is not None:
-                campaign.is_active = campaign_data.get("is_active")
-            
-            if campaign_data.get("requires_enrollment") is not None:
-                campaign.requires_enrollment = campaign_data.get("requires_enrollment")
-            
-            # Update enrollment URL if provided
-            if campaign_data.get("enrollment_url"):
-                campaign.enrollment_url = campaign_data.get("enrollment_url")
-            
-            # Update sync time
-            campaign.last_sync_at = datetime.now()
+        bank_id: int,
+        campaign_data: Dict[str, Any],
+        category_ids: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """
+        Build the campaigns row for an imported campaign
+        
+        Fields the feed left out are None; _with_insert_defaults fills them
+        in for new campaigns.
+        """
+        category = campaign_data.get("category")
+        discount_type = campaign_data.get("discount_type")
+        
+        def number(key):
+            value = campaign_data.get(key)
+            return float(value) if value is not None and value != "" else None
+        
+        def date(key):
+            value = campaign_data.get(key)
+            return self._parse_date(value) if value else None
+        
+        values = {
+            "name": campaign_data.get("name") or None,
+            "description": campaign_data.get("description"),
+            "bank_id": bank_id,
+            "card_id": campaign_data.get("card_id") or None,  # May need to map from external ID
+            # Map external category and discount type to internal ones
+            "category_id": category_ids.get(
+                self._map_external_category(category).upper(), category_ids.get("OTHER")
+            ) if category else None,
+            "discount_type": DiscountType(self._map_external_discount_type(discount_type).upper()) if discount_type else None,
+            "discount_value": number("discount_value"),
+            "min_amount": number("min_amount"),
+            "max_discount": number("max_discount") or None,
+            "start_date": date("start_date"),
+            "end_date": date("end_date"),
+            "merchant_id": campaign_data.get("merchant_id") or None,  # May need to map from external ID
+            "is_active": campaign_data.get("is_active"),
+            "requires_enrollment": campaign_data.get("requires_enrollment"),
+            "enrollment_url": campaign_data.get("enrollment_url") or None,
+            "source": CampaignSource.BANK_API,
+            "external_id": str(campaign_data.get("external_id") or campaign_data.get("id")),
+            "last_sync_at": datetime.now()
+        }
+        values["content_hash"] = self._content_hash(values)
+        return values
+    
+    @staticmethod
+    def _with_insert_defaults(values: Dict[str, Any], category_ids: Dict[str, int]) -> Dict[str, Any]:
+        """A new campaign's row, with defaults for the fields the feed left out"""
+        now = datetime.now()
+        defaults = {
+            "name": "Unnamed Campaign",
+            "description": "",
+            "category_id": category_ids.get("OTHER"),
+            "discount_type": DiscountType.PERCENTAGE,
+            "discount_value": 0.0,
+            "min_amount": 0.0,
+            "start_date": now,
+            "end_date": now,
+            "is_active": True,
+            "requires_enrollment": False
+        }
+        return {
+            **values,
+            **{key: default for key, default in defaults.items() if values.get(key) is None}
+        }
     
     def _map_external_category(self, external_category: str) -> str:
         """Map external category to internal category enum"""
@@ -385,6 +607,44 @@ class CampaignSyncService:
         except Exception:
             return datetime.now()
     
+    def _open_campaign_feed(self, bank: Bank, api_key: str, api_secret: str) -> CampaignFeedReader:
+        """
+        Prepare a streaming read of a bank's campaign feed
+        
+        The stored cursor is sent as `since`, and the stored ETag and
+        Last-Modified as If-None-Match and If-Modified-Since. Banks may answer
+        with a plain list (full feed), NDJSON, or pages of a delta envelope:
+        
+            {"campaigns": [...], "deleted": ["<external_id>", ...], "next_cursor": "...", "next": "<url>"}
+        
+        Campaigns flagged with "deleted": true are treated as tombstones too.
+        """
+        headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": api_key,
+            "X-API-Secret": api_secret
+        }
+        if bank.campaign_sync_etag:
+            headers["If-None-Match"] = bank.campaign_sync_etag
+        if bank.campaign_sync_last_modified:
+            headers["If-Modified-Since"] = bank.campaign_sync_last_modified
+        
+        return CampaignFeedReader(
+            url=f"{bank.api_base_url}{bank.campaign_sync_endpoint}",
+            headers=headers,
+            params={"since": bank.campaign_sync_cursor} if bank.campaign_sync_cursor else None,
+            session=bank_api_client.session_for(bank.id),
+            # Breaker and latency stats cover the bank's responses, not the import
+            track=lambda: bank_api_client.track(bank.id),
+            # A large feed may take longer than a single call is allowed to;
+            # only bound how long the bank may stall
+            timeout=aiohttp.ClientTimeout(
+                total=None,
+                connect=settings.BANK_API_CONNECT_TIMEOUT_SECONDS,
+                sock_read=settings.BANK_API_TIMEOUT_SECONDS
+            )
+        )
+    
     async def _call_bank_api(
         self,
         bank: Bank,
@@ -394,33 +654,16 @@ class CampaignSyncService:
         api_key: str,
         api_secret: str
     ) -> Any:
-        """Make an API call to a bank's API endpoint"""
-        
-        url = f"{bank.api_base_url}{endpoint}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": api_key,
-            "X-API-Secret": api_secret
-        }
-        
-        async with aiohttp.ClientSession() as session:
-            try:
-                if method.upper() == "GET":
-                    async with session.get(url, headers=headers) as response:
-                        response.raise_for_status()
-                        return await response.json()
-                        
-                elif method.upper() == "POST":
-                    async with session.post(url, headers=headers, json=data) as response:
-                        response.raise_for_status()
-                        return await response.json()
-                        
-                else:
-                    raise ValueError(f"Unsupported method: {method}")
-                    
-            except Exception as e:
-                logger.error(f"Error calling bank API: {str(e)}")
-                raise
+        """Make an API call to a bank's API endpoint through the shared bank API client"""
+        
+        return await bank_api_client.request(
+            bank=bank,
+            method=method,
+            endpoint=endpoint,
+            api_key=api_key,
+            api_secret=api_secret,
+            data=data
+        )
     
     # Campaign approval methods
     
@@ -451,6 +694,7 @@ class CampaignSyncService:
         campaign.reviewed_by = admin_id
         campaign.is_active = True
         
+        publish_invalidation(self.db, "campaign", [campaign.id])
         self.db.commit()
         
         return {
@@ -486,6 +730,7 @@ class CampaignSyncService:
         campaign.reviewed_by = admin_id
         campaign.is_active = False
         
+        publish_invalidation(self.db, "campaign", [campaign.id])
         self.db.commit()
         
         return {
@@ -494,6 +739,70 @@ class CampaignSyncService:
             "campaign_id": campaign.id
         }
     
+    def bulk_review_campaigns(
+        self,
+        status: CampaignStatus,
+        admin_id: int,
+        review_notes: Optional[str] = None,
+        campaign_ids: Optional[List[int]] = None,
+        bank_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Approve or reject every pending campaign matching the selection
+
+        Campaigns are selected by ID list and/or filters and updated in one
+        statement; campaigns that are no longer pending are left alone.
+        """
+        if status not in (CampaignStatus.APPROVED, CampaignStatus.REJECTED):
+            raise ValueError(f"Unsupported review status: {status}")
+
+        conditions = [Campaign.status == CampaignStatus.PENDING]
+        if campaign_ids is not None:
+            conditions.append(Campaign.id.in_(campaign_ids))
+        if bank_id is not None:
+            conditions.append(Campaign.bank_id == bank_id)
+        if category_id is not None:
+            conditions.append(Campaign.category_id == category_id)
+        if created_from is not None:
+            conditions.append(Campaign.created_at >= created_from)
+        if created_to is not None:
+            conditions.append(Campaign.created_at < created_to)
+
+        if len(conditions) == 1 or campaign_ids == []:
+            return {
+                "success": False,
+                "message": "Select campaigns by ID or by at least one filter",
+                "updated_campaigns": 0,
+                "campaign_ids": []
+            }
+
+        reviewed_ids = self.db.execute(
+            update(Campaign)
+            .where(and_(*conditions))
+            .values(
+                status=status,
+                review_notes=review_notes,
+                reviewed_by=admin_id,
+                is_active=status == CampaignStatus.APPROVED
+            )
+            .returning(Campaign.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        if reviewed_ids:
+            publish_invalidation(self.db, "campaign", reviewed_ids)
+        self.db.commit()
+
+        action = "approved" if status == CampaignStatus.APPROVED else "rejected"
+        return {
+            "success": True,
+            "message": f"{len(reviewed_ids)} campaigns {action}",
+            "updated_campaigns": len(reviewed_ids),
+            "campaign_ids": reviewed_ids
+        }
+
     def get_pending_campaigns(
         self,
         skip: int = 0,
@@ -501,9 +810,36 @@ class CampaignSyncService:
     ) -> List[Campaign]:
         """Get campaigns that are pending approval"""
         
-        return self.db.query(Campaign)\
-            .filter(Campaign.status == CampaignStatus.PENDING)\
-            .order_by(Campaign.created_at.desc())\
+        return self._pending_campaigns_query()\
+            .order_by(Campaign.created_at.desc(), Campaign.id.desc())\
             .offset(skip)\
             .limit(limit)\
-            .all() 
\ No newline at end of file
+            .all()
+
+    def get_pending_campaigns_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        bank_id: Optional[int] = None,
+        category_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of pending campaigns, newest first
+
+        Pages continue after the (created_at, id) of the previous page's
+        last campaign, so deep pages cost the same as the first one.
+        Returns the campaigns and the cursor of the next page (None on the last one).
+        """
+        query = self._pending_campaigns_query()
+        if bank_id is not None:
+            query = query.filter(Campaign.bank_id == bank_id)
+        if category_id is not None:
+            query = query.filter(Campaign.category_id == category_id)
+        campaigns, next_cursor = keyset_page(query, limit, cursor=decode_cursor(cursor) if cursor else None)
+        return {"items": campaigns, "next_cursor": next_cursor}
+
+    def _pending_campaigns_query(self):
+        # Bank and card names are shown in the review list; load them in the same query
+        return self.db.query(Campaign)\
+            .options(joinedload(Campaign.bank), joinedload(Campaign.credit_card))\
+            .filter(Campaign.status == CampaignStatus.PENDING)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.campaign import CatalogState
+from app.services.cache_invalidation import ALL, InvalidationEvent, invalidation_bus
+
+logger = logging.getLogger(__name__)
+
+
+def get_catalog_version(db: Session) -> int:
+    """Current campaign catalog version, kept up to date by the invalidation bus while it listens"""
+    return invalidation_bus.catalog_version(
+        lambda: db.query(CatalogState.version).filter(CatalogState.id == 1).scalar() or 0
+    )
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+    headers: Dict[str, str]
+
+
+class CatalogResponseCache:
+    """
+    LRU cache of rendered catalog responses
+
+    Keys include the catalog version, so a write makes every older entry
+    unreachable; those entries simply age out of the LRU.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: Hashable, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def evict_before(self, version: int) -> None:
+        """Drop entries of catalog versions older than the given one"""
+        with self._lock:
+            for key in [key for key in self._entries if key[2] < version]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+catalog_response_cache = CatalogResponseCache(settings.CATALOG_RESPONSE_CACHE_SIZE)
+
+
+@invalidation_bus.subscribe
+def _evict_catalog_responses(event: InvalidationEvent) -> None:
+    if event.entity == ALL:
+        catalog_response_cache.clear()
+    elif event.version is not None:
+        # Unreachable once the version moved on; free them now rather than through the LRU
+        catalog_response_cache.evict_before(event.version)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: a W/ prefix added by a proxy still matches
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def catalog_response(
+    request: Request,
+    db: Session,
+    build: Callable[[Response], Any],
+    response_model: Any = None
+) -> Response:
+    """
+    Serve a read-only catalog endpoint from the response cache
+
+    Responses are cached per (path, query parameters, catalog version,
+    time bucket). The time bucket bounds how long listings that filter on
+    the current time (started, not yet expired) are reused. build(response)
+    produces the content on a miss; X- headers it sets on `response` are
+    cached along with the body. The ETag is a hash of the body, so a client
+    revalidating with If-None-Match gets a 304 whenever the content it has
+    is still current, even across catalog versions.
+    """
+    version = get_catalog_version(db)
+    bucket = int(time.time() // settings.CATALOG_CACHE_TIME_BUCKET_SECONDS)
+    key = (request.url.path, tuple(sorted(request.query_params.multi_items())), version, bucket)
+
+    entry = catalog_response_cache.get(key)
+    if entry is None:
+        scratch = Response()
+        content = build(scratch)
+        if response_model is not None:
+            adapter = TypeAdapter(response_model)
+            content = adapter.dump_python(adapter.validate_python(content), mode="json")
+        else:
+            content = jsonable_encoder(content)
+        # Rendered like the app's default JSON response
+        body = json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+        entry = CachedResponse(
+            body=body,
+            etag='"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"',
+            headers={name: value for name, value in scratch.headers.items() if name.lower().startswith("x-")}
+        )
+        catalog_response_cache.set(key, entry)
+
+    headers = {
+        **entry.headers,
+        "ETag": entry.etag,
+        "X-Catalog-Version": str(version),
+        "Cache-Control": "private, no-cache"  # Always revalidate; a 304 is cheap
+    }
+    if _etag_matches(request.headers.get("If-None-Match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json; charset=utf-8", headers=headers)
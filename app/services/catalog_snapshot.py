@@ -0,0 +1,188 @@
+import gzip
+import hashlib
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import msgpack
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.schemas.campaign import CampaignOut
+from app.services.cache_invalidation import ALL, InvalidationEvent, invalidation_bus
+from app.services.catalog_cache import _etag_matches, get_catalog_version
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_MEDIA_TYPE = "application/x-msgpack"
+
+# CampaignOut fields whose values repeat across campaigns; they're stored as
+# indexes into the snapshot's string table
+INTERNED_FIELDS = (
+    "bank_name",
+    "card_name",
+    "merchant_name",
+    "campaign_category_name",
+    "category",
+    "credit_card_application_url",
+    "discount_type",
+    "source",
+    "status",
+)
+
+_campaigns_out = TypeAdapter(List[CampaignOut])
+
+
+class CatalogSnapshot(NamedTuple):
+    version: int
+    body: bytes  # gzip-compressed MessagePack
+    etag: str
+    campaign_count: int
+
+
+def encode_snapshot(version: int, campaigns: List[Dict[str, Any]], generated_at: Optional[datetime] = None) -> bytes:
+    """
+    Encode CampaignOut records as a columnar MessagePack document
+
+    The document is a map:
+    - format: layout version, bumped on incompatible changes
+    - version: catalog version; pass it as `since` to /campaigns/changes
+    - generated_at: ISO timestamp of the build
+    - count: number of campaigns
+    - strings: string table
+    - interned: names of the columns holding string table indexes
+    - columns: field name -> list of values, one per campaign
+
+    Values are rendered as in the JSON API; null values of interned
+    columns stay null rather than being interned.
+    """
+    strings: List[str] = []
+    index: Dict[str, int] = {}
+
+    def intern(value):
+        if value is None:
+            return None
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(strings)
+            strings.append(value)
+        return position
+
+    fields = [name for name, field in CampaignOut.model_fields.items() if not field.exclude]
+    columns = {field: [] for field in fields}
+    for campaign in campaigns:
+        for field in fields:
+            value = campaign.get(field)
+            columns[field].append(intern(value) if field in INTERNED_FIELDS else value)
+
+    return msgpack.packb({
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "generated_at": (generated_at or datetime.now(timezone.utc)).isoformat(),
+        "count": len(campaigns),
+        "strings": strings,
+        "interned": list(INTERNED_FIELDS),
+        "columns": columns,
+    }, use_bin_type=True)
+
+
+def decode_snapshot(body: bytes) -> List[Dict[str, Any]]:
+    """Rows of an encoded (uncompressed) snapshot, with interned strings resolved"""
+    document = msgpack.unpackb(body, raw=False)
+    strings = document["strings"]
+    interned = set(document["interned"])
+    columns = {
+        field: [strings[value] if field in interned and value is not None else value for value in values]
+        for field, values in document["columns"].items()
+    }
+    return [{field: values[row] for field, values in columns.items()} for row in range(document["count"])]
+
+
+def build_catalog_snapshot(db: Session, build: Callable[[], List[Dict[str, Any]]]) -> CatalogSnapshot:
+    """Encode and compress the CampaignOut records produced by build()"""
+    # Read the version first: a write committing in between then makes the
+    # content newer than its label, and replaying that change is harmless
+    version = get_catalog_version(db)
+    records = _campaigns_out.dump_python(_campaigns_out.validate_python(build()), mode="json")
+
+    packed = encode_snapshot(version, records)
+    body = gzip.compress(packed, compresslevel=9, mtime=0)
+    snapshot = CatalogSnapshot(
+        version=version,
+        body=body,
+        etag='"' + hashlib.blake2b(packed, digest_size=16).hexdigest() + '"',
+        campaign_count=len(records)
+    )
+    logger.info(
+        f"Built catalog snapshot for version {version}: "
+        f"{len(records)} campaigns, {len(packed)} bytes packed, {len(body)} bytes gzipped"
+    )
+    return snapshot
+
+
+class CatalogSnapshotCache:
+    """
+    The latest catalog snapshot of this process
+
+    Rebuilt on the first request after the catalog version changes;
+    concurrent requests wait for that one build instead of each building.
+    """
+
+    def __init__(self):
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, build: Callable[[], List[Dict[str, Any]]]) -> CatalogSnapshot:
+        version = get_catalog_version(db)
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version >= version:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.version < version:
+                snapshot = self._snapshot = build_catalog_snapshot(db, build)
+            return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+
+catalog_snapshot_cache = CatalogSnapshotCache()
+
+
+@invalidation_bus.subscribe
+def _evict_snapshot(event: InvalidationEvent) -> None:
+    # Rebuilt once the version moves on; only a resync can leave it stale
+    if event.entity == ALL:
+        catalog_snapshot_cache.clear()
+
+
+def snapshot_response(request: Request, db: Session, build: Callable[[], List[Dict[str, Any]]]) -> Response:
+    """
+    Serve the catalog snapshot, building it first if the catalog changed
+
+    The gzipped body is sent as is with Content-Encoding: gzip, so HTTP
+    clients inflate it transparently; clients that don't accept gzip get
+    it inflated here. If-None-Match revalidation answers 304 while the
+    content is unchanged.
+    """
+    snapshot = catalog_snapshot_cache.get(db, build)
+    headers = {
+        "ETag": snapshot.etag,
+        "X-Catalog-Version": str(snapshot.version),
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding"
+    }
+    if _etag_matches(request.headers.get("If-None-Match"), snapshot.etag):
+        return Response(status_code=304, headers=headers)
+    if "gzip" in request.headers.get("Accept-Encoding", "").lower():
+        return Response(
+            content=snapshot.body,
+            media_type=SNAPSHOT_MEDIA_TYPE,
+            headers={**headers, "Content-Encoding": "gzip"}
+        )
+    return Response(content=gzip.decompress(snapshot.body), media_type=SNAPSHOT_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,155 @@
+import logging
+import re
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "notification_history"
+ROLLUP_TABLE = "notification_history_rollups"
+PARTITION_NAME_PATTERN = re.compile(r"^notification_history_(\d{4})_(\d{2})$")
+
+
+class NotificationRetentionService:
+    """Service for maintaining the monthly notification_history partitions"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def month_start(day: date) -> date:
+        """Return the first day of the month containing the given date"""
+        return date(day.year, day.month, 1)
+
+    @staticmethod
+    def add_months(month: date, months: int) -> date:
+        """Shift a month start date by a (possibly negative) number of months"""
+        index = month.year * 12 + (month.month - 1) + months
+        return date(index // 12, index % 12 + 1, 1)
+
+    @staticmethod
+    def partition_name(month: date) -> str:
+        """Name of the partition holding the given month"""
+        return f"{PARENT_TABLE}_{month.year:04d}_{month.month:02d}"
+
+    @staticmethod
+    def parse_partition_month(name: str) -> Optional[date]:
+        """Return the month a partition holds, or None if the name does not match"""
+        match = PARTITION_NAME_PATTERN.match(name)
+        if not match:
+            return None
+        return date(int(match.group(1)), int(match.group(2)), 1)
+
+    def list_partitions(self) -> List[str]:
+        """List the names of all partitions attached to notification_history"""
+        rows = self.db.execute(
+            text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = :parent
+                ORDER BY child.relname
+            """),
+            {"parent": PARENT_TABLE}
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def ensure_partitions(self, months_ahead: Optional[int] = None, today: Optional[date] = None) -> List[str]:
+        """
+        Create the partitions for the current month and the next months_ahead months
+
+        Returns:
+        - Names of the partitions that were created
+        """
+        if months_ahead is None:
+            months_ahead = settings.NOTIFICATION_HISTORY_PARTITIONS_AHEAD
+        current_month = self.month_start(today or datetime.utcnow().date())
+
+        existing = set(self.list_partitions())
+        created = []
+
+        for offset in range(months_ahead + 1):
+            month = self.add_months(current_month, offset)
+            name = self.partition_name(month)
+            if name in existing:
+                continue
+
+            self.db.execute(text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF {PARENT_TABLE} '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{self.add_months(month, 1).isoformat()}')"
+            ))
+            created.append(name)
+
+        self.db.commit()
+
+        if created:
+            logger.info(f"Created notification history partitions: {', '.join(created)}")
+        return created
+
+    def rollup_expired_partitions(
+        self,
+        retention_months: Optional[int] = None,
+        today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Roll up and drop partitions older than the retention period
+
+        Each expired partition is aggregated into notification_history_rollups
+        and dropped in the same transaction, so a failed run can be retried.
+        """
+        if retention_months is None:
+            retention_months = settings.NOTIFICATION_HISTORY_RETENTION_MONTHS
+        cutoff_month = self.add_months(self.month_start(today or datetime.utcnow().date()), -retention_months)
+
+        dropped_partitions = []
+        rolled_up_rows = 0
+
+        for name in self.list_partitions():
+            month = self.parse_partition_month(name)
+            if month is None or month >= cutoff_month:
+                continue
+
+            try:
+                result = self.db.execute(text(f"""
+                    INSERT INTO {ROLLUP_TABLE} (
+                        user_id, campaign_id, period_month, notification_count,
+                        read_count, first_sent_at, last_sent_at
+                    )
+                    SELECT
+                        user_id,
+                        campaign_id,
+                        :period_month,
+                        COUNT(*),
+                        COUNT(*) FILTER (WHERE is_read),
+                        MIN(sent_at),
+                        MAX(sent_at)
+                    FROM "{name}"
+                    GROUP BY user_id, campaign_id
+                    ON CONFLICT (user_id, campaign_id, period_month) DO UPDATE SET
+                        notification_count = {ROLLUP_TABLE}.notification_count + EXCLUDED.notification_count,
+                        read_count = {ROLLUP_TABLE}.read_count + EXCLUDED.read_count,
+                        first_sent_at = LEAST({ROLLUP_TABLE}.first_sent_at, EXCLUDED.first_sent_at),
+                        last_sent_at = GREATEST({ROLLUP_TABLE}.last_sent_at, EXCLUDED.last_sent_at)
+                """), {"period_month": month})
+                self.db.execute(text(f'DROP TABLE "{name}"'))
+                self.db.commit()
+
+                rolled_up_rows += result.rowcount or 0
+                dropped_partitions.append(name)
+                logger.info(f"Rolled up and dropped notification history partition {name}")
+            except Exception as e:
+                self.db.rollback()
+                logger.error(f"Error rolling up notification history partition {name}: {str(e)}")
+
+        return {
+            "success": True,
+            "dropped_partitions": dropped_partitions,
+            "rollup_rows": rolled_up_rows,
+            "cutoff_month": cutoff_month.isoformat()
+        }
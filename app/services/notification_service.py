@@ -1,13 +1,17 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import asyncio
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import firebase_admin
 from firebase_admin import credentials, messaging
 from sqlalchemy.orm import Session
 from app.models.notification import NotificationHistory
-from app.db.base import get_db
+from app.db.base import get_db, SessionLocal
+from app.core.config import settings
 import os
 import json
 import hashlib
-from datetime import datetime
+from datetime import datetime, timedelta
 import pytz
 from app.models.campaign_reminder import CampaignReminder
 from app.models.auth import UserAuth
@@ -30,6 +34,167 @@ ch.setFormatter(formatter)
 # Add ch to logger
 logger.addHandler(ch)
 
+# Blocking FCM sends run here rather than on the loop's shared default executor,
+# so REMINDER_DELIVERY_CONCURRENCY is the real bound on sends in flight
+fcm_executor = ThreadPoolExecutor(
+    max_workers=settings.REMINDER_DELIVERY_CONCURRENCY,
+    thread_name_prefix="fcm-send"
+)
+
+def generate_location_hash(latitude: float, longitude: float) -> str:
+    """Konum bilgisinden hash oluştur"""
+    location_str = f"{latitude},{longitude}"
+    return hashlib.md5(location_str.encode()).hexdigest()[:50]
+
+class NotificationDigest:
+    """
+    Per-user notification digest and rate caps.
+
+    Notifications submitted for a user within the digest window are coalesced
+    into a single push, and pushes are capped per user per hour and per day.
+    Counters are kept in memory, per process.
+    """
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        hourly_cap: Optional[int] = None,
+        daily_cap: Optional[int] = None
+    ):
+        self.window_seconds = window_seconds if window_seconds is not None else settings.NOTIFICATION_DIGEST_WINDOW_SECONDS
+        self.hourly_cap = hourly_cap if hourly_cap is not None else settings.NOTIFICATION_HOURLY_CAP
+        self.daily_cap = daily_cap if daily_cap is not None else settings.NOTIFICATION_DAILY_CAP
+        self._pending: Dict[int, List[Dict[str, Any]]] = {}
+        self._flush_tasks: Dict[int, asyncio.Task] = {}
+        self._sent: Dict[int, deque] = defaultdict(deque)
+
+    def allow(self, user_id: int, now: Optional[datetime] = None) -> bool:
+        """Check whether the user is below both the hourly and the daily cap"""
+        now = now or datetime.utcnow()
+        sent = self._sent[user_id]
+        # Forget pushes older than a day
+        while sent and sent[0] <= now - timedelta(days=1):
+            sent.popleft()
+
+        last_hour = sum(1 for sent_at in sent if sent_at > now - timedelta(hours=1))
+        return len(sent) < self.daily_cap and last_hour < self.hourly_cap
+
+    def record(self, user_id: int, now: Optional[datetime] = None) -> None:
+        """Count a push towards the user's caps"""
+        self._sent[user_id].append(now or datetime.utcnow())
+
+    @staticmethod
+    def build_digest(notifications: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge several notifications for the same user into one"""
+        if len(notifications) == 1:
+            return notifications[0]
+
+        first = notifications[0]
+        bodies = [notification['body'] for notification in notifications[:3]]
+        if len(notifications) > 3:
+            bodies.append(f"+{len(notifications) - 3} fırsat daha")
+
+        # Kept for the history row only, so each campaign is matched at the
+        # location it was sent for
+        campaign_locations = [
+            {
+                'campaignId': notification['campaign_id'],
+                'locationHash': generate_location_hash(notification['latitude'], notification['longitude'])
+            }
+            for notification in notifications
+            if notification.get('latitude') and notification.get('longitude')
+        ]
+
+        return {
+            'title': f"{len(notifications)} yeni fırsat seni bekliyor! 🎉",
+            'body': "\n".join(bodies),
+            'user_id': first['user_id'],
+            'campaign_id': first['campaign_id'],
+            'merchant_id': first.get('merchant_id'),
+            'category_id': first.get('category_id'),
+            'latitude': first.get('latitude'),
+            'longitude': first.get('longitude'),
+            'fcm_token': first.get('fcm_token'),
+            'campaign_locations': campaign_locations,
+            'data': {
+                'type': 'DIGEST',
+                'campaignIds': [notification['campaign_id'] for notification in notifications],
+                'count': len(notifications)
+            }
+        }
+
+    async def submit(self, notification: Dict[str, Any], service: "NotificationService") -> Dict[str, Any]:
+        """Queue a notification for the user's next digest push"""
+        user_id = notification['user_id']
+        if not self.allow(user_id):
+            logger.info(f"Notification rate limit reached for user {user_id}")
+            return {
+                "success": False,
+                "rate_limited": True,
+                "message": "Notification rate limit reached"
+            }
+
+        pending = self._pending.setdefault(user_id, [])
+        if not any(item['campaign_id'] == notification['campaign_id'] for item in pending):
+            pending.append(notification)
+
+        if user_id not in self._flush_tasks:
+            self._flush_tasks[user_id] = asyncio.create_task(self._flush_later(user_id, service))
+
+        return {
+            "success": True,
+            "queued": True,
+            "message": "Notification queued"
+        }
+
+    async def _flush_later(self, user_id: int, service: "NotificationService") -> None:
+        await asyncio.sleep(self.window_seconds)
+        try:
+            await self.flush(user_id, service)
+        except Exception as e:
+            logger.error(f"Error flushing notification digest for user {user_id}: {str(e)}")
+
+    async def flush(self, user_id: int, service: "NotificationService") -> Optional[Dict[str, Any]]:
+        """Send the user's pending notifications as one push and record one history row"""
+        self._flush_tasks.pop(user_id, None)
+        pending = self._pending.pop(user_id, [])
+        if not pending:
+            return None
+        if not self.allow(user_id):
+            logger.info(f"Dropping {len(pending)} notifications for user {user_id}: rate limit reached")
+            return None
+
+        notification = self.build_digest(pending)
+        # Deliver once to every device that submitted a notification
+        tokens = list(dict.fromkeys(item['fcm_token'] for item in pending if item.get('fcm_token')))
+
+        delivered = 0
+        for fcm_token in tokens:
+            try:
+                await service.deliver({**notification, 'fcm_token': fcm_token})
+                delivered += 1
+            except Exception as e:
+                logger.error(f"Error sending digest to token {fcm_token}: {str(e)}")
+
+        if not delivered:
+            return None
+
+        self.record(user_id)
+        db = SessionLocal()
+        try:
+            db.add(service.build_history(notification))
+            db.commit()
+        finally:
+            db.close()
+
+        logger.info(f"Sent digest of {len(pending)} notifications to user {user_id}")
+        return notification
+
+
+# Shared digest, so notifications from every request and task are coalesced together
+notification_digest = NotificationDigest()
+
+
 class NotificationService:
     def __init__(self):
         if not firebase_admin._apps:
@@ -38,50 +203,74 @@ class NotificationService:
     
     def _generate_location_hash(self, latitude: float, longitude: float) -> str:
         """Konum bilgisinden hash oluştur"""
-        location_str = f"{latitude},{longitude}"
-        return hashlib.md5(location_str.encode()).hexdigest()[:50]
+        return generate_location_hash(latitude, longitude)
     
+    def _build_message(self, notification: Dict[str, Any]) -> messaging.Message:
+        """Build the FCM message for a notification payload"""
+        # Get FCM token from notification data
+        fcm_token = notification.get('fcm_token')
+        if not fcm_token:
+            raise ValueError("FCM token not found")
+
+        # Convert all data values to strings for FCM
+        data = {}
+        for key, value in notification.get('data', {}).items():
+            data[str(key)] = str(value)
+
+        return messaging.Message(
+            notification=messaging.Notification(
+                title=notification.get('title'),
+                body=notification.get('body'),
+            ),
+            data=data,
+            token=fcm_token
+        )
+
+    async def deliver(self, notification: Dict[str, Any]) -> str:
+        """
+        Send a notification via FCM without recording it
+        The blocking FCM call runs on fcm_executor so deliveries can overlap
+        """
+        message = self._build_message(notification)
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(fcm_executor, messaging.send, message)
+        logger.info(f"✅ FCM message sent successfully: {response}")
+        return response
+
+    def build_history(self, notification: Dict[str, Any]) -> NotificationHistory:
+        """Create the (unsaved) notification history record for a sent notification"""
+        data = notification.get('data')
+        if notification.get('campaign_locations'):
+            data = {**(data or {}), 'campaignLocations': notification['campaign_locations']}
+        return NotificationHistory(
+            user_id=notification['user_id'],
+            merchant_id=notification.get('merchant_id'),
+            campaign_id=notification['campaign_id'],
+            latitude=notification.get('latitude'),
+            longitude=notification.get('longitude'),
+            location_hash=self._generate_location_hash(notification['latitude'], notification['longitude']) if notification.get('latitude') and notification.get('longitude') else None,
+            category_id=notification.get('category_id'),
+            title=notification['title'],
+            body=notification['body'],
+            is_read=False,
+            data=data
+        )
+
+    async def queue_notification(self, notification: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a notification through the per-user digest
+        It is pushed together with the user's other pending notifications
+        once the digest window ends, subject to the per-user rate caps
+        """
+        return await notification_digest.submit(notification, self)
+
     async def send_notification(self, notification: Dict[str, Any], db: Session = None) -> Dict[str, Any]:
         """Send a notification via FCM"""
         try:
-            # Get FCM token from notification data
-            fcm_token = notification.get('fcm_token')
-            if not fcm_token:
-                raise ValueError("FCM token not found")
-
-            # Convert all data values to strings for FCM
-            data = {}
-            for key, value in notification.get('data', {}).items():
-                data[str(key)] = str(value)
-
-            # Prepare notification message
-            message = messaging.Message(
-                notification=messaging.Notification(
-                    title=notification.get('title'),
-                    body=notification.get('body'),
-                ),
-                data=data,
-                token=fcm_token
-            )
-
-            # Send message
-            response = messaging.send(message)
-            logger.info(f"✅ FCM message sent successfully: {response}")
+            response = await self.deliver(notification)
 
             # Create notification history record
-            notification_history = NotificationHistory(
-                user_id=notification['user_id'],
-                merchant_id=notification.get('merchant_id'),
-                campaign_id=notification['campaign_id'],
-                latitude=notification.get('latitude'),
-                longitude=notification.get('longitude'),
-                location_hash=self._generate_location_hash(notification['latitude'], notification['longitude']) if notification.get('latitude') and notification.get('longitude') else None,
-                category_id=notification.get('category_id'),
-                title=notification['title'],
-                body=notification['body'],
-                is_read=False,
-                data=notification.get('data')
-            )
+            notification_history = self.build_history(notification)
 
             if db:
                 db.add(notification_history)
@@ -95,4 +284,4 @@ class NotificationService:
 
         except Exception as e:
             logger.error(f"Error sending notification: {str(e)}")
-            raise e 
\ No newline at end of file
+            raise e
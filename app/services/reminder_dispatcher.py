@@ -0,0 +1,100 @@
+import logging
+import os
+import socket
+from datetime import timedelta
+from typing import List, Optional
+
+from sqlalchemy import select, update, or_, func
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.campaign_reminder import CampaignReminder
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """Identify this worker process across hosts"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class ReminderDispatcher:
+    """
+    Claims due reminders so that each one is dispatched by a single worker.
+
+    Claims are taken with UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP
+    LOCKED) RETURNING, so concurrent workers never block on or claim the
+    same rows. A claim is a lease: if the claiming worker crashes before the
+    reminder is marked sent, the claim expires and another worker picks it up.
+    """
+
+    def __init__(self, db: Session, worker_id: Optional[str] = None, lease_seconds: Optional[int] = None):
+        self.db = db
+        self.worker_id = worker_id or default_worker_id()
+        self.lease = timedelta(
+            seconds=lease_seconds if lease_seconds is not None else settings.REMINDER_CLAIM_LEASE_SECONDS
+        )
+
+    def claim_due(self, reminder_ids: Optional[List[int]] = None, limit: Optional[int] = None) -> List[int]:
+        """
+        Claim unsent, active reminders that are due and not held by a live lease
+
+        Parameters:
+        - reminder_ids: Restrict the claim to these reminders (scheduler dispatch)
+        - limit: Max number of reminders to claim
+
+        Returns:
+        - IDs of the reminders claimed by this worker
+        """
+        now = func.now()
+        due = (
+            select(CampaignReminder.id)
+            .where(
+                CampaignReminder.is_sent == False,
+                CampaignReminder.is_active == True,
+                or_(
+                    CampaignReminder.claimed_at.is_(None),
+                    CampaignReminder.claimed_at < now - self.lease
+                )
+            )
+            .order_by(CampaignReminder.remind_at)
+            .limit(limit or settings.REMINDER_CLAIM_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        if reminder_ids is not None:
+            if not reminder_ids:
+                return []
+            # The scheduler already decided these are due; don't second-guess
+            # it against the database clock
+            due = due.where(CampaignReminder.id.in_(reminder_ids))
+        else:
+            due = due.where(CampaignReminder.remind_at <= now)
+
+        claimed = self.db.execute(
+            update(CampaignReminder)
+            .where(CampaignReminder.id.in_(due.scalar_subquery()))
+            .values(claimed_by=self.worker_id, claimed_at=now)
+            .returning(CampaignReminder.id)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        self.db.commit()
+
+        if claimed:
+            logger.info(f"Worker {self.worker_id} claimed {len(claimed)} reminders")
+        return list(claimed)
+
+    def release(self, reminder_ids: List[int]) -> None:
+        """Release this worker's claims so the reminders can be retried"""
+        if not reminder_ids:
+            return
+        self.db.execute(
+            update(CampaignReminder)
+            .where(
+                CampaignReminder.id.in_(reminder_ids),
+                CampaignReminder.claimed_by == self.worker_id,
+                CampaignReminder.is_sent == False
+            )
+            .values(claimed_by=None, claimed_at=None)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
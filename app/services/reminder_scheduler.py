@@ -0,0 +1,188 @@
+import asyncio
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import pytz
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.campaign_reminder import CampaignReminder
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for a single sleep, so a stopped or empty scheduler still wakes up
+MAX_SLEEP_SECONDS = 60.0
+
+
+class ReminderScheduler:
+    """
+    In-memory min-heap of upcoming campaign reminders.
+
+    Only reminders due within the horizon window are kept in memory. The heap
+    is fed by reminder create/delete calls and rebuilt from the database by a
+    periodic refresh, which also picks up anything that was missed. The run
+    loop sleeps until the earliest reminder is due and then dispatches only
+    the due reminder IDs.
+    """
+
+    def __init__(self, horizon: Optional[timedelta] = None):
+        self.horizon = horizon or timedelta(minutes=settings.REMINDER_SCHEDULER_HORIZON_MINUTES)
+        self._heap: List[Tuple[datetime, int]] = []
+        self._scheduled: Dict[int, datetime] = {}
+        self._in_flight: set = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._dispatch: Optional[Callable[[List[int]], Awaitable[None]]] = None
+
+    @staticmethod
+    def _utcnow() -> datetime:
+        return datetime.now(pytz.UTC)
+
+    @staticmethod
+    def _to_utc(dt: datetime) -> datetime:
+        """Normalize a reminder time to an aware UTC datetime"""
+        if dt.tzinfo is None:
+            return pytz.UTC.localize(dt)
+        return dt.astimezone(pytz.UTC)
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+    def add(self, reminder_id: int, remind_at: datetime, now: Optional[datetime] = None) -> bool:
+        """
+        Schedule a reminder if it falls inside the horizon window
+
+        Returns:
+        - True if the reminder was added to the in-memory schedule
+        """
+        remind_at = self._to_utc(remind_at)
+        if remind_at > (now or self._utcnow()) + self.horizon:
+            # Picked up by a later refresh once it enters the window
+            return False
+
+        with self._lock:
+            self._scheduled[reminder_id] = remind_at
+            heapq.heappush(self._heap, (remind_at, reminder_id))
+            is_earliest = self._heap[0] == (remind_at, reminder_id)
+
+        if is_earliest:
+            self._wake()
+        return True
+
+    def remove(self, reminder_id: int) -> None:
+        """Unschedule a reminder. Heap entries are discarded lazily when popped."""
+        with self._lock:
+            self._scheduled.pop(reminder_id, None)
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[int]:
+        """Remove and return the IDs of all reminders that are due"""
+        now = now or self._utcnow()
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                remind_at, reminder_id = heapq.heappop(self._heap)
+                # Skip entries that were removed or rescheduled since they were pushed
+                if self._scheduled.get(reminder_id) != remind_at:
+                    continue
+                del self._scheduled[reminder_id]
+                due.append(reminder_id)
+        return due
+
+    def seconds_until_next(self, now: Optional[datetime] = None) -> Optional[float]:
+        """Seconds until the earliest scheduled reminder, or None if nothing is scheduled"""
+        with self._lock:
+            while self._heap and self._scheduled.get(self._heap[0][1]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return None
+            next_at = self._heap[0][0]
+        return max((next_at - (now or self._utcnow())).total_seconds(), 0.0)
+
+    def refresh(self, db: Session, now: Optional[datetime] = None) -> int:
+        """
+        Rebuild the schedule from the database
+
+        Loads the unsent, active reminders due before the end of the horizon
+        window, including overdue ones. Returns the number of scheduled reminders.
+        """
+        now = now or self._utcnow()
+        rows = (
+            db.query(CampaignReminder.id, CampaignReminder.remind_at)
+            .filter(
+                CampaignReminder.is_sent == False,
+                CampaignReminder.is_active == True,
+                CampaignReminder.remind_at <= now + self.horizon
+            )
+            .all()
+        )
+
+        with self._lock:
+            self._scheduled = {
+                reminder_id: self._to_utc(remind_at)
+                for reminder_id, remind_at in rows
+                if reminder_id not in self._in_flight
+            }
+            self._heap = [(remind_at, reminder_id) for reminder_id, remind_at in self._scheduled.items()]
+            heapq.heapify(self._heap)
+            count = len(self._scheduled)
+
+        logger.info(f"Reminder schedule refreshed: {count} reminders within the next {self.horizon}")
+        self._wake()
+        return count
+
+    def _wake(self) -> None:
+        """Wake the run loop; safe to call from request threads"""
+        if self._loop is not None and self._wakeup is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def start(self, dispatch: Callable[[List[int]], Awaitable[None]]) -> None:
+        """Start the run loop on the current event loop"""
+        if self._task is not None and not self._task.done():
+            return
+        self._dispatch = dispatch
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._task = self._loop.create_task(self._run())
+        logger.info("Reminder scheduler started")
+
+    def stop(self) -> None:
+        """Stop the run loop"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        logger.info("Reminder scheduler stopped")
+
+    async def _run(self) -> None:
+        while True:
+            # Clear before checking the heap so a concurrent add is never missed
+            self._wakeup.clear()
+
+            due = self.pop_due()
+            if due:
+                with self._lock:
+                    self._in_flight.update(due)
+                try:
+                    await self._dispatch(due)
+                except Exception as e:
+                    logger.error(f"Error dispatching reminders {due}: {str(e)}")
+                finally:
+                    with self._lock:
+                        self._in_flight.difference_update(due)
+                continue
+
+            timeout = self.seconds_until_next()
+            if timeout is None or timeout > MAX_SLEEP_SECONDS:
+                timeout = MAX_SLEEP_SECONDS
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+# Shared scheduler instance, fed by ReminderService and the reminder endpoints
+reminder_scheduler = ReminderScheduler()
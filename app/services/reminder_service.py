@@ -3,6 +3,7 @@ import pytz
 from sqlalchemy.orm import Session
 from app.models.campaign_reminder import CampaignReminder
 from app.db.base import get_db
+from app.services.reminder_scheduler import reminder_scheduler
 
 class ReminderService:
     @staticmethod
@@ -31,6 +32,9 @@ class ReminderService:
             db.commit()
             db.refresh(reminder)
 
+            # Fire on time if it is due within the scheduler's horizon
+            reminder_scheduler.add(reminder.id, reminder.remind_at)
+
             return reminder
         except Exception as e:
             if 'db' in locals() and db is not None:
@@ -55,6 +59,7 @@ class ReminderService:
             if reminder:
                 db.delete(reminder)
                 db.commit()
+                reminder_scheduler.remove(reminder_id)
                 return True
             return False
         except Exception as e:
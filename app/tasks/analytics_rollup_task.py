@@ -0,0 +1,62 @@
+import logging
+import traceback
+from datetime import datetime
+from typing import Dict, Any
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.services.analytics_rollup_service import AnalyticsRollupService
+
+logger = logging.getLogger(__name__)
+
+async def roll_up_analytics() -> Dict[str, Any]:
+    """
+    Task to bring the analytics rollup tables up to date
+    """
+    logger.info("Starting analytics rollup")
+
+    db = SessionLocal()
+    try:
+        result = AnalyticsRollupService(db).roll_up()
+        logger.info(
+            f"Analytics rollup completed. "
+            f"Wrote {result['event_rows']} event rows and {result['campaign_rows']} campaign rows, "
+            f"pruned {result['pruned_rows']} hourly rows"
+        )
+        return result
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in analytics rollup: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {
+            "success": False,
+            "message": f"Error in analytics rollup: {str(e)}"
+        }
+    finally:
+        db.close()
+
+def schedule_analytics_rollup(scheduler):
+    """
+    Schedule the analytics rollup
+
+    Parameters:
+    - scheduler: APScheduler instance
+    """
+    scheduler.add_job(
+        roll_up_analytics,
+        'interval',
+        minutes=settings.ANALYTICS_ROLLUP_INTERVAL_MINUTES,
+        id='roll_up_analytics',
+        replace_existing=True
+    )
+
+    # Also run on startup so the dashboard isn't empty until the first interval
+    scheduler.add_job(
+        roll_up_analytics,
+        'date',
+        run_date=datetime.utcnow(),
+        id='roll_up_analytics_startup',
+    )
+
+    logger.info(f"Analytics rollup scheduled every {settings.ANALYTICS_ROLLUP_INTERVAL_MINUTES} minutes")
@@ -0,0 +1,50 @@
+import logging
+import traceback
+from typing import Dict, Any
+
+from app.db.base import SessionLocal
+from app.services.campaign_change_log import CampaignChangeLogService
+
+logger = logging.getLogger(__name__)
+
+async def prune_campaign_changes() -> Dict[str, Any]:
+    """
+    Task to delete campaign change log entries older than the retention period
+    """
+    logger.info("Starting campaign change log pruning")
+
+    db = SessionLocal()
+    try:
+        deleted = CampaignChangeLogService(db).prune()
+        logger.info(f"Campaign change log pruning completed. Deleted {deleted} entries")
+        return {"success": True, "deleted": deleted}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in campaign change log pruning: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {
+            "success": False,
+            "message": f"Error in campaign change log pruning: {str(e)}"
+        }
+    finally:
+        db.close()
+
+def schedule_campaign_change_log_retention(scheduler):
+    """
+    Schedule the campaign change log pruning
+
+    Parameters:
+    - scheduler: APScheduler instance
+    """
+    # Run every day at 3:30 AM, after the notification partition maintenance
+    scheduler.add_job(
+        prune_campaign_changes,
+        'cron',
+        hour=3,
+        minute=30,
+        id='prune_campaign_changes',
+        replace_existing=True
+    )
+
+    logger.info("Campaign change log pruning scheduled to run daily at 3:30 AM")
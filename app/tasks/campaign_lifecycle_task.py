@@ -0,0 +1,77 @@
+import logging
+import traceback
+from datetime import datetime
+from typing import Dict, Any
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.services.campaign_lifecycle_service import CampaignLifecycleService
+
+logger = logging.getLogger(__name__)
+
+# Scheduler the next boundary sweep is added to; set by schedule_campaign_lifecycle
+_scheduler = None
+
+async def sweep_campaign_lifecycle() -> Dict[str, Any]:
+    """
+    Task to apply campaign start and end dates that have passed,
+    then schedule itself for the next one
+    """
+    db = SessionLocal()
+    try:
+        result = CampaignLifecycleService(db).sweep()
+
+        next_boundary = result["next_boundary"]
+        if _scheduler is not None and next_boundary is not None:
+            # Campaign dates are local times without a zone
+            _scheduler.add_job(
+                sweep_campaign_lifecycle,
+                'date',
+                run_date=next_boundary.astimezone(),
+                id='sweep_campaign_lifecycle_boundary',
+                replace_existing=True
+            )
+        return result
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in campaign lifecycle sweep: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {
+            "success": False,
+            "message": f"Error in campaign lifecycle sweep: {str(e)}"
+        }
+    finally:
+        db.close()
+
+def schedule_campaign_lifecycle(scheduler):
+    """
+    Schedule the campaign lifecycle sweeper
+
+    Each sweep schedules the next one at the earliest upcoming start or end
+    date. A periodic sweep also picks up campaigns created or rescheduled
+    with an earlier boundary since then.
+
+    Parameters:
+    - scheduler: APScheduler instance
+    """
+    global _scheduler
+    _scheduler = scheduler
+
+    scheduler.add_job(
+        sweep_campaign_lifecycle,
+        'interval',
+        minutes=settings.CAMPAIGN_LIFECYCLE_SWEEP_MINUTES,
+        id='sweep_campaign_lifecycle',
+        replace_existing=True
+    )
+
+    # Deactivate anything that expired while the app was down
+    scheduler.add_job(
+        sweep_campaign_lifecycle,
+        'date',
+        run_date=datetime.utcnow(),
+        id='sweep_campaign_lifecycle_startup',
+    )
+
+    logger.info(f"Campaign lifecycle sweep scheduled at each boundary and every {settings.CAMPAIGN_LIFECYCLE_SWEEP_MINUTES} minutes")
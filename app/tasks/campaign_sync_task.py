@@ -5,7 +5,9 @@ from typing import Dict, Any
 import time
 import traceback
 
+from app.core.config import settings
 from app.db.base import SessionLocal
+from app.services.campaign_sync_run_service import CampaignSyncRunService
 from app.services.campaign_sync_service import CampaignSyncService
 
 logger = logging.getLogger(__name__)
@@ -53,29 +55,58 @@ async def sync_campaigns() -> Dict[str, Any]:
     finally:
         db.close()
 
+def enqueue_campaign_sync(trigger: str = "schedule") -> None:
+    """
+    Queue a sync of all banks for the sync worker
+    A run that is already waiting is reused, so workers sharing the schedule
+    don't pile up duplicate runs
+    """
+    db = SessionLocal()
+    try:
+        run = CampaignSyncRunService(db).enqueue(trigger=trigger)
+        logger.info(f"Campaign sync run {run.id} queued ({trigger})")
+    except Exception as e:
+        logger.error(f"Error queueing campaign sync: {str(e)}")
+    finally:
+        db.close()
+
 def schedule_campaign_sync(scheduler):
     """
-    Schedule the campaign sync task to run periodically
+    Schedule the campaign sync to be queued periodically
+    Runs in the sync worker process (app.tasks.campaign_sync_worker), never
+    in the API process
     
     Parameters:
     - scheduler: APScheduler instance
     """
-    # Schedule to run every day at 2:00 AM
-    scheduler.add_job(
-        sync_campaigns,
-        'cron',
-        hour=2,
-        minute=0,
-        id='sync_campaigns',
-        replace_existing=True
-    )
-    
-    logger.info("Campaign sync task scheduled to run daily at 2:00 AM")
+    if settings.CAMPAIGN_SYNC_INTERVAL_MINUTES:
+        # Delta sync makes frequent runs cheap for banks that support it
+        scheduler.add_job(
+            enqueue_campaign_sync,
+            'interval',
+            minutes=settings.CAMPAIGN_SYNC_INTERVAL_MINUTES,
+            id='sync_campaigns',
+            replace_existing=True
+        )
+        
+        logger.info(f"Campaign sync task scheduled to run every {settings.CAMPAIGN_SYNC_INTERVAL_MINUTES} minutes")
+    else:
+        # Schedule to run every day at 2:00 AM
+        scheduler.add_job(
+            enqueue_campaign_sync,
+            'cron',
+            hour=2,
+            minute=0,
+            id='sync_campaigns',
+            replace_existing=True
+        )
+        
+        logger.info("Campaign sync task scheduled to run daily at 2:00 AM")
     
     # Run the job immediately as well, but don't use a persistent job ID 
     # to avoid issues when shutting down
     scheduler.add_job(
-        sync_campaigns,
+        enqueue_campaign_sync,
         'date',
         run_date=datetime.now(),
         id='sync_campaigns_startup',
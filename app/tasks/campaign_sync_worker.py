@@ -0,0 +1,167 @@
+"""
+Standalone bank campaign sync worker
+
+Bank syncs do their ORM work on synchronous sessions, which would block the
+API's event loop for the length of an import. They run here instead, in a
+separate process:
+
+    python -m app.tasks.campaign_sync_worker            # poll for runs and keep the sync schedule
+    python -m app.tasks.campaign_sync_worker --once     # sync all banks once and exit
+
+The API only queues runs (campaign_sync_runs) and reads their status. Any
+number of workers can run side by side; each run is claimed by one of them.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import signal
+import time
+import traceback
+from typing import Any, Dict, Optional
+
+import pytz
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.campaign import Bank
+from app.services.bank_api_client import bank_api_client
+from app.services.campaign_sync_run_service import CampaignSyncRunService
+from app.services.campaign_sync_service import CampaignSyncService
+from app.services.reminder_dispatcher import default_worker_id
+from app.tasks.campaign_sync_task import schedule_campaign_sync, sync_campaigns
+
+logger = logging.getLogger(__name__)
+
+
+async def execute_sync_run(run_id: int) -> Dict[str, Any]:
+    """
+    Execute a claimed sync run, reporting progress into its row
+
+    Progress is written on its own session, so it is committed as each bank
+    finishes, independently of the sync's own transactions.
+    """
+    start_time = time.time()
+    status_db = SessionLocal()
+    sync_db = SessionLocal()
+    runs = CampaignSyncRunService(status_db)
+
+    async def heartbeat():
+        while True:
+            await asyncio.sleep(settings.CAMPAIGN_SYNC_RUN_HEARTBEAT_SECONDS)
+            runs.heartbeat(run_id)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    try:
+        run = runs.get(run_id)
+        campaign_sync_service = CampaignSyncService(sync_db)
+
+        if run.bank_id is not None:
+            runs.start(run_id, total_banks=1)
+            result = await campaign_sync_service.sync_bank_campaigns(run.bank_id)
+            bank_name = run.bank.name if run.bank else None
+            runs.record_bank_result(run_id, run.bank_id, bank_name, result)
+        else:
+            total_banks = sync_db.query(Bank).filter(Bank.campaign_sync_enabled == True).count()
+            runs.start(run_id, total_banks=total_banks)
+            result = await campaign_sync_service.sync_all_banks(
+                on_bank_synced=lambda bank, bank_result: runs.record_bank_result(
+                    run_id, bank.id, bank.name, bank_result
+                )
+            )
+
+        runs.finish(run_id, result)
+        logger.info(f"Campaign sync run {run_id} finished in {time.time() - start_time:.2f}s: {result.get('message')}")
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in campaign sync run {run_id}: {str(e)}")
+        logger.error(traceback.format_exc())
+        status_db.rollback()
+        runs.fail(run_id, str(e))
+        return {
+            "success": False,
+            "message": f"Error in campaign sync run: {str(e)}"
+        }
+    finally:
+        heartbeat_task.cancel()
+        sync_db.close()
+        status_db.close()
+
+
+def claim_next_run(worker_id: str) -> Optional[int]:
+    """Fail runs abandoned by dead workers, then claim the next queued one"""
+    db = SessionLocal()
+    try:
+        runs = CampaignSyncRunService(db)
+        abandoned = runs.fail_abandoned_runs()
+        if abandoned:
+            logger.warning(f"Marked {abandoned} abandoned campaign sync runs as failed")
+        run = runs.claim_next(worker_id)
+        return run.id if run else None
+    finally:
+        db.close()
+
+
+async def run_worker(schedule: bool = True) -> None:
+    """Poll for queued sync runs until the process is asked to stop"""
+    worker_id = default_worker_id()
+    stop = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Signal handlers aren't available on every platform
+            pass
+
+    scheduler = None
+    if schedule:
+        scheduler = AsyncIOScheduler()
+        scheduler.configure(timezone=pytz.UTC)
+        schedule_campaign_sync(scheduler)
+        scheduler.start()
+
+    logger.info(f"Campaign sync worker {worker_id} started")
+    try:
+        while not stop.is_set():
+            try:
+                run_id = claim_next_run(worker_id)
+            except Exception as e:
+                logger.error(f"Error claiming campaign sync run: {str(e)}")
+                run_id = None
+
+            if run_id is not None:
+                await execute_sync_run(run_id)
+                continue
+
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.CAMPAIGN_SYNC_WORKER_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if scheduler:
+            scheduler.shutdown(wait=False)
+        await bank_api_client.close()
+        logger.info(f"Campaign sync worker {worker_id} stopped")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PayViya bank campaign sync worker")
+    parser.add_argument("--once", action="store_true", help="Sync all banks once and exit")
+    parser.add_argument("--no-schedule", action="store_true", help="Only execute queued runs; don't queue scheduled ones")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    if args.once:
+        result = asyncio.run(sync_campaigns())
+        print(json.dumps(result, indent=2, default=str))
+    else:
+        asyncio.run(run_worker(schedule=not args.no_schedule))
+
+
+if __name__ == "__main__":
+    main()
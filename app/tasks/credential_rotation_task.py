@@ -0,0 +1,82 @@
+import logging
+import traceback
+from datetime import datetime
+from typing import Dict, Any
+
+from sqlalchemy import or_
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.campaign import Bank
+from app.utils.crypto import needs_rotation, rotate_data
+
+logger = logging.getLogger(__name__)
+
+def rotate_bank_credentials() -> Dict[str, Any]:
+    """
+    Task to re-encrypt stored bank API credentials with the current secret key
+
+    Once no credential needs rotation any more, the keys in
+    PREVIOUS_SECRET_KEYS can be retired. Cached credentials are keyed by
+    their ciphertext, so they're decrypted again on next use.
+    """
+    logger.info("Starting bank credential rotation")
+
+    db = SessionLocal()
+    try:
+        banks = db.query(Bank).filter(
+            or_(Bank.api_key.isnot(None), Bank.api_secret.isnot(None))
+        ).with_for_update().all()
+
+        rotated = 0
+        for bank in banks:
+            if not (needs_rotation(bank.api_key) or needs_rotation(bank.api_secret)):
+                continue
+            bank.api_key = rotate_data(bank.api_key)
+            bank.api_secret = rotate_data(bank.api_secret)
+            rotated += 1
+        db.commit()
+
+        logger.info(f"Bank credential rotation completed. Re-encrypted credentials of {rotated} banks")
+        return {"success": True, "rotated": rotated}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error in bank credential rotation: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {
+            "success": False,
+            "message": f"Error in bank credential rotation: {str(e)}"
+        }
+    finally:
+        db.close()
+
+def schedule_credential_rotation(scheduler):
+    """
+    Schedule the bank credential rotation, while previous secret keys are configured
+
+    Parameters:
+    - scheduler: APScheduler instance
+    """
+    if not settings.PREVIOUS_SECRET_KEYS:
+        return
+
+    # Rotate right after a key change is deployed, then daily for credentials
+    # written by processes still running with the old key
+    scheduler.add_job(
+        rotate_bank_credentials,
+        'date',
+        run_date=datetime.utcnow(),
+        id='rotate_bank_credentials_startup',
+        replace_existing=True
+    )
+    scheduler.add_job(
+        rotate_bank_credentials,
+        'cron',
+        hour=4,
+        minute=0,
+        id='rotate_bank_credentials',
+        replace_existing=True
+    )
+
+    logger.info("Bank credential rotation scheduled on startup and daily at 4:00 AM")
@@ -0,0 +1,68 @@
+import logging
+import traceback
+from datetime import datetime
+from typing import Dict, Any
+
+from app.db.base import SessionLocal
+from app.services.notification_retention_service import NotificationRetentionService
+
+logger = logging.getLogger(__name__)
+
+async def maintain_notification_partitions() -> Dict[str, Any]:
+    """
+    Task to keep the notification_history partitions in shape:
+    creates upcoming monthly partitions, then rolls up and drops expired ones
+    """
+    logger.info("Starting notification history partition maintenance")
+
+    db = SessionLocal()
+    try:
+        retention_service = NotificationRetentionService(db)
+
+        created = retention_service.ensure_partitions()
+        result = retention_service.rollup_expired_partitions()
+        result["created_partitions"] = created
+
+        logger.info(
+            f"Notification partition maintenance completed. "
+            f"Created {len(created)} partitions, "
+            f"dropped {len(result['dropped_partitions'])} expired partitions"
+        )
+        return result
+
+    except Exception as e:
+        logger.error(f"Error in notification partition maintenance: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {
+            "success": False,
+            "message": f"Error in notification partition maintenance: {str(e)}"
+        }
+    finally:
+        db.close()
+
+def schedule_notification_retention(scheduler):
+    """
+    Schedule the notification history partition maintenance
+
+    Parameters:
+    - scheduler: APScheduler instance
+    """
+    # Run every day at 3:00 AM, after the campaign sync
+    scheduler.add_job(
+        maintain_notification_partitions,
+        'cron',
+        hour=3,
+        minute=0,
+        id='maintain_notification_partitions',
+        replace_existing=True
+    )
+
+    # Also run on startup so the current month's partition always exists
+    scheduler.add_job(
+        maintain_notification_partitions,
+        'date',
+        run_date=datetime.utcnow(),
+        id='maintain_notification_partitions_startup',
+    )
+
+    logger.info("Notification partition maintenance scheduled to run daily at 3:00 AM")
@@ -1,16 +1,21 @@
+from collections import defaultdict
 from datetime import datetime, timedelta
+from typing import Any, Dict, List, Set
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.models.campaign_reminder import CampaignReminder
 from app.models.campaign import Campaign
 from app.models.user import User
 from app.models.auth import UserAuth
-from app.services.notification_service import NotificationService
+from app.services.notification_service import NotificationService, notification_digest
+from app.services.reminder_scheduler import reminder_scheduler
+from app.services.reminder_dispatcher import ReminderDispatcher
 from app.models.notification import NotificationHistory
 import asyncio
 import logging
 from sqlalchemy.orm import joinedload
-from sqlalchemy import func, text
+from sqlalchemy import func, text, update
 import pytz
 
 # Configure logging
@@ -30,133 +35,237 @@ ch.setFormatter(formatter)
 # Add ch to logger
 logger.addHandler(ch)
 
-async def send_single_reminder(reminder: CampaignReminder, notification_service: NotificationService, db: Session):
-    """Send a single reminder notification"""
-    try:
-        campaign = reminder.campaign
-        if not campaign:
-            logger.warning(f"Campaign not found for reminder {reminder.id}")
-            return
+def _build_reminder_notification(reminder: CampaignReminder, campaign: Campaign) -> Dict[str, Any]:
+    """Build the notification payload for one reminder; the device token is added per delivery"""
+    return {
+        'title': f"{campaign.name} - Hatırlatma",
+        'body': f"'{campaign.name}' kampanyası için hatırlatma zamanı geldi!",
+        'data': {
+            "type": "REMINDER_CAMPAIGN",
+            "campaignId": campaign.id,
+            "reminderId": reminder.id
+        },
+        'user_id': reminder.user_id,
+        'campaign_id': campaign.id  # Add campaign_id for notification history
+    }
+
+async def send_reminder_batch(reminder_ids: List[int], notification_service: NotificationService, db: Session) -> Set[int]:
+    """
+    Send a batch of reminders
 
-        logger.info("=== REMINDER DEBUG INFO ===")
-        logger.info(f"Reminder ID: {reminder.id}")
-        logger.info(f"Reminder Time: {reminder.remind_at}")
-        logger.info(f"Current Time (Local): {datetime.now(pytz.timezone('Europe/Istanbul'))}")
-        logger.info("========================")
+    Loads the reminders with their campaigns and the active FCM tokens of
+    every affected user in two queries. A user's due reminders are coalesced
+    into one digest push, delivered to all of the user's devices concurrently
+    (bounded by REMINDER_DELIVERY_CONCURRENCY). History rows and the is_sent
+    flags are then written back in a single commit.
 
-        # Get user's active FCM tokens
-        user_auth_tokens = db.query(UserAuth).filter(
-            UserAuth.user_id == int(reminder.user_id),
+    Reminders were explicitly requested, so they count towards the per-user
+    caps but are never dropped by them.
+
+    Returns:
+    - IDs of the reminders delivered to at least one device
+    """
+    reminders = (
+        db.query(CampaignReminder)
+        .options(joinedload(CampaignReminder.campaign))
+        .filter(CampaignReminder.id.in_(reminder_ids))
+        .all()
+    )
+
+    # Reminder user IDs are stored as strings
+    reminder_users = {}
+    for reminder in reminders:
+        try:
+            reminder_users[reminder.id] = int(reminder.user_id)
+        except (TypeError, ValueError):
+            logger.warning(f"Reminder {reminder.id} has an invalid user ID: {reminder.user_id}")
+
+    tokens_by_user = defaultdict(list)
+    if reminder_users:
+        token_rows = db.query(UserAuth.user_id, UserAuth.fcm_token).filter(
+            UserAuth.user_id.in_(set(reminder_users.values())),
             UserAuth.is_active == True,
             UserAuth.fcm_token.isnot(None)
         ).all()
+        for user_id, fcm_token in token_rows:
+            tokens_by_user[user_id].append(fcm_token)
 
-        if not user_auth_tokens:
+    # Group each user's deliverable reminders
+    reminders_by_user = defaultdict(list)
+    for reminder in reminders:
+        campaign = reminder.campaign
+        if not campaign:
+            logger.warning(f"Campaign not found for reminder {reminder.id}")
+            continue
+
+        user_id = reminder_users.get(reminder.id)
+        if not tokens_by_user.get(user_id):
             logger.warning(f"User {reminder.user_id} has no active FCM tokens")
-            return
+            continue
 
-        logger.info(f"Sending reminder notification for campaign {campaign.name} (ID: {campaign.id}) to user {reminder.user_id}")
+        reminders_by_user[user_id].append((reminder.id, _build_reminder_notification(reminder, campaign)))
 
-        success_count = 0
-        for user_auth in user_auth_tokens:
+    semaphore = asyncio.Semaphore(settings.REMINDER_DELIVERY_CONCURRENCY)
+
+    async def deliver(user_id: int, notification: Dict[str, Any]):
+        async with semaphore:
             try:
-                # Prepare notification data
-                notification_data = {
-                    'title': f"{campaign.name} - Hatırlatma",
-                    'body': f"'{campaign.name}' kampanyası için hatırlatma zamanı geldi!",
-                    'data': {
-                        "type": "REMINDER_CAMPAIGN",
-                        "campaignId": campaign.id,
-                        "reminderId": reminder.id
-                    },
-                    'fcm_token': user_auth.fcm_token,
-                    'user_id': reminder.user_id,
-                    'campaign_id': campaign.id  # Add campaign_id for notification history
-                }
-                
-                # Send FCM notification directly
-                await notification_service.send_notification(notification_data, db)
-                success_count += 1
-                
+                await notification_service.deliver(notification)
+                return user_id, True
             except Exception as e:
-                logger.error(f"Error sending notification to token {user_auth.fcm_token}: {str(e)}")
-                continue
+                logger.error(f"Error sending notification to token {notification['fcm_token']}: {str(e)}")
+                return user_id, False
 
-        if success_count > 0:
-            # Mark reminder as sent if at least one notification was successful
-            reminder.is_sent = True
-            db.commit()
-            logger.info(f"Successfully sent {success_count} notifications for reminder {reminder.id}")
-        else:
-            logger.warning(f"Failed to send any notifications for reminder {reminder.id}")
+    deliveries = []
+    user_notifications = {}
+    for user_id, items in reminders_by_user.items():
+        notification = notification_digest.build_digest([item for _, item in items])
+        user_notifications[user_id] = notification
+        for fcm_token in tokens_by_user[user_id]:
+            deliveries.append(deliver(user_id, {**notification, 'fcm_token': fcm_token}))
 
-    except Exception as e:
-        logger.error(f"Error processing reminder {reminder.id}: {str(e)}")
-        raise e
+    results = await asyncio.gather(*deliveries)
+    delivered_users = {user_id for user_id, delivered in results if delivered}
+
+    sent_ids = set()
+    history = []
+    for user_id in delivered_users:
+        sent_ids.update(reminder_id for reminder_id, _ in reminders_by_user[user_id])
+        history.append(notification_service.build_history(user_notifications[user_id]))
+        notification_digest.record(user_id)
+
+    if history:
+        db.add_all(history)
+    if sent_ids:
+        # Mark reminders as sent if at least one notification was successful
+        db.execute(
+            update(CampaignReminder)
+            .where(CampaignReminder.id.in_(sent_ids))
+            .values(is_sent=True)
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+
+    logger.info(
+        f"Reminder batch: {len(sent_ids)} of {len(reminders)} reminders sent "
+        f"to {len(delivered_users)} users"
+    )
+    return sent_ids
 
 async def send_reminder_notifications():
     """
     Check for due reminders and send notifications
-    This function should be scheduled to run every 5 minutes
+    Fallback sweep; the reminder scheduler normally dispatches due reminders.
+    It picks up reminders whose delivery failed or whose claim lease expired,
+    which the scheduler only sees again after its next refresh.
     """
     logger.info("Starting reminder notification check...")
     
     db = SessionLocal()
-    notification_service = NotificationService()
     try:
-        # Get current time in local timezone
-        local_tz = pytz.timezone('Europe/Istanbul')
-        local_now = datetime.now(local_tz)
-        logger.info(f"Current local time: {local_now}")
-
-        # Debug için tüm aktif hatırlatmaları kontrol et
-        all_reminders = (
-            db.query(CampaignReminder)
-            .filter(
-                CampaignReminder.is_sent == False,
-                CampaignReminder.is_active == True
-            )
-            .all()
-        )
+        dispatcher = ReminderDispatcher(db)
+        notification_service = NotificationService()
+        failed_ids = set()
+        total = 0
 
-        logger.info(f"Total active reminders found: {len(all_reminders)}")
-        for reminder in all_reminders:
-            logger.info(f"Checking reminder ID: {reminder.id}")
-            logger.info(f"Reminder time: {reminder.remind_at} ({type(reminder.remind_at)})")
-            logger.info(f"Current time: {local_now} ({type(local_now)})")
-            logger.info(f"Is reminder due? {reminder.remind_at <= local_now}")
-            logger.info("---")
-
-        # Get all unsent and active reminders that are due
-        # Veritabanındaki değerler zaten yerel saat olduğu için direkt karşılaştır
-        due_reminders = (
-            db.query(CampaignReminder)
-            .options(
-                joinedload(CampaignReminder.campaign).joinedload(Campaign.merchant)
-            )
-            .filter(
-                CampaignReminder.is_sent == False,
-                CampaignReminder.is_active == True,
-                CampaignReminder.remind_at <= local_now
-            )
-            .all()
-        )
+        # Claim and send due reminders batch by batch until none are left.
+        # Failed claims are held until the end so the loop doesn't retry them.
+        while True:
+            claimed_ids = dispatcher.claim_due()
+            if not claimed_ids:
+                break
+            total += len(claimed_ids)
+            sent_ids = await send_reminder_batch(claimed_ids, notification_service, db)
+            failed_ids.update(set(claimed_ids) - sent_ids)
 
-        if not due_reminders:
+        if not total:
             logger.info("No due reminders found")
             return
 
-        logger.info(f"Found {len(due_reminders)} due reminders")
-        
-        for reminder in due_reminders:
-            try:
-                await send_single_reminder(reminder, notification_service, db)
-            except Exception as e:
-                logger.error(f"Failed to process reminder {reminder.id}: {str(e)}")
-                continue
+        logger.info(f"Processed {total} due reminders, {len(failed_ids)} failed")
+        # Unsent reminders go back to the pool to be retried on a later pass
+        dispatcher.release(list(failed_ids))
 
     except Exception as e:
         logger.error(f"Error in reminder notification job: {str(e)}")
         raise e
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def send_due_reminders(reminder_ids: List[int]):
+    """
+    Send the reminders the reminder scheduler found due
+    Only reminders this worker manages to claim are sent, so every worker
+    can run its own scheduler without sending duplicates
+    """
+    db = SessionLocal()
+    try:
+        dispatcher = ReminderDispatcher(db)
+        claimed_ids = dispatcher.claim_due(reminder_ids=reminder_ids)
+
+        logger.info(f"Dispatching {len(claimed_ids)} of {len(reminder_ids)} due reminders")
+        if not claimed_ids:
+            return
+
+        try:
+            sent_ids = await send_reminder_batch(claimed_ids, NotificationService(), db)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error sending reminder batch: {str(e)}")
+            sent_ids = set()
+
+        # Unsent reminders go back to the pool to be retried on a later pass
+        dispatcher.release([reminder_id for reminder_id in claimed_ids if reminder_id not in sent_ids])
+    finally:
+        db.close()
+
+async def refresh_reminder_schedule():
+    """Rebuild the in-memory reminder schedule from the database"""
+    db = SessionLocal()
+    try:
+        reminder_scheduler.refresh(db)
+    except Exception as e:
+        logger.error(f"Error refreshing reminder schedule: {str(e)}")
+    finally:
+        db.close()
+
+def schedule_reminder_notifications(scheduler):
+    """
+    Start the reminder scheduler and schedule its periodic refresh and the
+    fallback sweep for due reminders
+    Must be called from a running event loop
+
+    Parameters:
+    - scheduler: APScheduler instance
+    """
+    reminder_scheduler.start(dispatch=send_due_reminders)
+
+    scheduler.add_job(
+        refresh_reminder_schedule,
+        'interval',
+        minutes=settings.REMINDER_SCHEDULER_REFRESH_MINUTES,
+        id='refresh_reminder_schedule',
+        replace_existing=True
+    )
+
+    # Claims make the sweep safe to run next to the scheduler on every worker
+    scheduler.add_job(
+        send_reminder_notifications,
+        'interval',
+        minutes=settings.REMINDER_SWEEP_MINUTES,
+        id='reminder_notifications_sweep',
+        replace_existing=True
+    )
+
+    # Load the schedule immediately on startup
+    scheduler.add_job(
+        refresh_reminder_schedule,
+        'date',
+        run_date=datetime.utcnow(),
+        id='refresh_reminder_schedule_startup',
+    )
+
+    logger.info(
+        f"Reminder schedule refresh scheduled every {settings.REMINDER_SCHEDULER_REFRESH_MINUTES} minutes, "
+        f"due reminder sweep every {settings.REMINDER_SWEEP_MINUTES} minutes"
+    )
@@ -0,0 +1,83 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from app.services.analytics_rollup_service import AnalyticsRollupService, EVENT_SOURCES
+
+
+class TestAnalyticsRollup(unittest.TestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.db.execute.return_value.rowcount = 1
+        self.service = AnalyticsRollupService(self.db)
+        self.now = datetime(2025, 5, 31, 10, 20, tzinfo=timezone.utc)
+
+    def statements(self):
+        return [(str(call[0][0]), call[0][1] if len(call[0]) > 1 else {}) for call in self.db.execute.call_args_list]
+
+    def test_first_run_rolls_up_all_history(self):
+        self.db.execute.return_value.scalar.return_value = None
+
+        result = self.service.roll_up(now=self.now)
+
+        self.assertIsNone(result["since"])
+        inserts = [sql for sql, _ in self.statements() if "INSERT INTO analytics_event_rollups" in sql]
+        self.assertEqual(len(inserts), len(EVENT_SOURCES) + 1)
+        self.assertNotIn(":since", inserts[0])
+        self.db.commit.assert_called_once()
+
+    def test_incremental_run_recounts_from_last_run_minus_lag(self):
+        self.db.execute.return_value.scalar.return_value = datetime(2025, 5, 31, 10, 5, tzinfo=timezone.utc)
+
+        result = self.service.roll_up(now=self.now)
+
+        self.assertEqual(result["since"], "2025-05-31T09:00:00+00:00")
+        statements = self.statements()
+        notifications = next(
+            (sql, params) for sql, params in statements
+            if "FROM notification_history" in sql
+        )
+        self.assertIn("sent_at >= :since AND sent_date >= CAST(:since AS date) - 1", notifications[0])
+        self.assertEqual(notifications[1]["since"], datetime(2025, 5, 31, 9, 0, tzinfo=timezone.utc))
+        self.assertEqual(notifications[1]["until"], self.now)
+        # Campaign counts are replaced in the current hour and day buckets
+        snapshots = [params["granularity"] for sql, params in statements if "INSERT INTO campaign_count_rollups" in sql]
+        self.assertEqual(snapshots, ["hour", "day"])
+        self.assertIn("rolled_up_through = :now", statements[-1][0])
+
+    def test_event_series_has_every_metric_per_bucket(self):
+        hour = datetime(2025, 5, 31, 9, tzinfo=timezone.utc)
+        self.db.execute.return_value.fetchall.return_value = [(hour, "clicks", 4), (hour, "registrations", 2)]
+
+        series = self.service.get_event_series("hour", datetime(2025, 5, 30, tzinfo=timezone.utc))
+
+        self.assertEqual(series, [{
+            "bucket_start": hour,
+            "registrations": 2,
+            "card_additions": 0,
+            "recommendations": 0,
+            "clicks": 4,
+            "notifications": 0
+        }])
+
+    def test_campaign_counts_are_grouped_by_dimension(self):
+        hour = datetime(2025, 5, 31, 10, tzinfo=timezone.utc)
+        self.db.execute.return_value.fetchall.return_value = [
+            (hour, "bank", "Akbank", 3),
+            (hour, "category", "Market", 2),
+            (hour, "status", "active", 3),
+        ]
+
+        counts = self.service.get_campaign_counts()
+
+        self.assertEqual(counts, [{
+            "bucket_start": hour,
+            "by_category": {"Market": 2},
+            "by_bank": {"Akbank": 3},
+            "by_status": {"active": 3}
+        }])
+        self.assertIn("SELECT MAX(bucket_start)", str(self.db.execute.call_args[0][0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.core.config import settings
+from app.services.bank_api_client import BankApiClient, BankApiUnavailable, CircuitBreaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_threshold_and_allows_one_trial(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+
+        # reset_seconds=0: the circuit is immediately half-open
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+
+    def test_open_circuit_rejects_calls(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, "open")
+        self.assertFalse(breaker.allow())
+
+
+class TestBankApiClient(unittest.TestCase):
+    def run_against(self, handler, call):
+        async def run():
+            app = web.Application()
+            app.router.add_route("*", "/{name}", handler)
+            server = TestServer(app)
+            await server.start_server()
+            client = BankApiClient()
+            bank = Mock(id=1, api_base_url=str(server.make_url("")).rstrip("/"))
+            try:
+                return client, await call(client, bank)
+            finally:
+                await client.close()
+                await server.close()
+
+        with patch.object(settings, 'BANK_API_RETRY_BACKOFF_SECONDS', 0), \
+                patch.object(settings, 'BANK_API_MAX_RETRIES', 2), \
+                patch.object(settings, 'BANK_API_CIRCUIT_FAILURE_THRESHOLD', 3), \
+                patch.object(settings, 'BANK_API_CIRCUIT_RESET_SECONDS', 60):
+            return asyncio.run(run())
+
+    def test_idempotent_calls_are_retried(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            if len(calls) < 3:
+                return web.Response(status=503)
+            return web.json_response({"status": "ACTIVE"})
+
+        async def call(client, bank):
+            return await client.request(bank, "GET", "/status", "key", "secret")
+
+        client, result = self.run_against(handler, call)
+
+        self.assertEqual(result, {"status": "ACTIVE"})
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(client.get_stats()[1]["calls"], 3)
+        self.assertEqual(client.get_stats()[1]["errors"], 2)
+
+    def test_post_is_not_retried_and_circuit_opens(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            return web.Response(status=500)
+
+        async def call(client, bank):
+            for _ in range(3):
+                with self.assertRaises(aiohttp.ClientResponseError):
+                    await client.request(bank, "POST", "/enroll", "key", "secret", data={})
+            # The bank is no longer called once the circuit is open
+            with self.assertRaises(BankApiUnavailable):
+                await client.request(bank, "POST", "/enroll", "key", "secret", data={})
+
+        client, _ = self.run_against(handler, call)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(client.get_stats()[1]["circuit"], "open")
+
+    def test_client_errors_do_not_open_the_circuit(self):
+        async def handler(request):
+            return web.Response(status=404)
+
+        async def call(client, bank):
+            for _ in range(5):
+                with self.assertRaises(aiohttp.ClientResponseError):
+                    await client.request(bank, "GET", "/missing", "key", "secret")
+
+        client, _ = self.run_against(handler, call)
+
+        self.assertEqual(client.get_stats()[1]["circuit"], "closed")
+        self.assertEqual(client.get_stats()[1]["calls"], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
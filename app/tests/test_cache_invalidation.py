@@ -0,0 +1,88 @@
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.services import cache_invalidation
+from app.services.cache_invalidation import ALL, CacheInvalidationBus, InvalidationEvent, publish_invalidation
+from app.services.catalog_cache import CachedResponse, catalog_response_cache
+
+
+class TestPublishInvalidation(unittest.TestCase):
+    def published(self, db):
+        statement = db.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        self.assertIn("pg_notify", str(statement))
+        channel, payload = statement.params.values()
+        self.assertEqual(channel, "cache_invalidation")
+        return json.loads(payload)
+
+    def test_ids_are_sent_with_the_transaction(self):
+        db = Mock()
+        publish_invalidation(db, "campaign", [7, 3, 7])
+        self.assertEqual(self.published(db), {"entity": "campaign", "ids": [3, 7]})
+        db.commit.assert_not_called()
+
+    def test_oversized_id_lists_become_all(self):
+        db = Mock()
+        publish_invalidation(db, "campaign", list(range(5000)))
+        self.assertEqual(self.published(db), {"entity": "campaign", "ids": None})
+
+
+class TestCacheInvalidationBus(unittest.TestCase):
+    def setUp(self):
+        self.bus = CacheInvalidationBus()
+        self.events = []
+        self.bus.subscribe(self.events.append)
+        self.load = Mock(return_value=4)
+
+    def test_version_is_read_from_the_database_while_not_listening(self):
+        self.bus.handle('{"entity": "catalog", "version": 9}')
+        self.assertEqual(self.bus.catalog_version(self.load), 4)
+        self.assertEqual(self.bus.catalog_version(self.load), 4)
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_version_follows_notifications_while_listening(self):
+        self.bus._resync()
+        self.assertEqual(self.events, [InvalidationEvent(entity=ALL)])
+
+        self.assertEqual(self.bus.catalog_version(self.load), 4)
+        self.assertEqual(self.bus.catalog_version(self.load), 4)
+        self.load.assert_called_once()
+
+        self.bus.handle('{"entity": "catalog", "version": 6}')
+        self.bus.handle('{"entity": "catalog", "version": 5}')
+        self.assertEqual(self.bus.catalog_version(self.load), 6)
+        self.assertEqual(self.events[-1], InvalidationEvent(entity="catalog", version=5))
+
+    def test_failing_handlers_and_bad_payloads_are_contained(self):
+        self.bus.subscribe(Mock(side_effect=RuntimeError("boom"), __name__="broken"))
+        self.bus.handle("not json")
+        self.bus.handle('{"entity": "bank", "ids": [2]}')
+        self.assertEqual(self.events, [InvalidationEvent(entity="bank", ids=[2])])
+
+    def test_bank_events_evict_cached_credentials(self):
+        with patch.object(cache_invalidation, "invalidate_bank_credentials") as invalidate:
+            cache_invalidation._evict_bank_credentials(InvalidationEvent(entity="bank", ids=[2, 5]))
+            cache_invalidation._evict_bank_credentials(InvalidationEvent(entity="campaign", ids=[2]))
+        self.assertEqual([call.args for call in invalidate.call_args_list], [(2,), (5,)])
+
+
+class TestCatalogCacheEviction(unittest.TestCase):
+    def setUp(self):
+        catalog_response_cache.clear()
+        self.addCleanup(catalog_response_cache.clear)
+
+    def test_version_events_drop_older_responses(self):
+        entry = CachedResponse(b"[]", '"x"', {})
+        catalog_response_cache.set(("/campaigns/", (), 4, 0), entry)
+        catalog_response_cache.set(("/campaigns/", (), 5, 0), entry)
+
+        cache_invalidation.invalidation_bus.dispatch(InvalidationEvent(entity="catalog", version=5))
+
+        self.assertIsNone(catalog_response_cache.get(("/campaigns/", (), 4, 0)))
+        self.assertIsNotNone(catalog_response_cache.get(("/campaigns/", (), 5, 0)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import Mock
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.campaign_change_log import CampaignChangeLogService, ChangesPruned
+
+
+class TestCampaignChangeLog(unittest.TestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.service = CampaignChangeLogService(self.db)
+        self.state = Mock(version=12, pruned_through_version=3)
+        self.db.query.return_value.filter.return_value.one.return_value = self.state
+
+    def change_query(self):
+        return self.db.query.return_value
+
+    def test_pruned_history_is_reported(self):
+        with self.assertRaises(ChangesPruned):
+            self.service.get_changes(since=2)
+
+    def test_missing_and_inactive_campaigns_are_tombstones(self):
+        rows = [Mock(campaign_id=i, version=v) for i, v in ((5, 8), (6, 9), (7, 10))]
+        self.change_query().order_by.return_value.limit.return_value.all.return_value = rows
+        active, inactive = Mock(id=5, is_active=True), Mock(id=6, is_active=False)
+        self.change_query().filter.return_value.all.return_value = [active, inactive]
+
+        changes = self.service.get_changes(since=7, limit=10)
+
+        self.assertEqual(changes["version"], 12)
+        self.assertEqual(changes["changed"], [active])
+        self.assertEqual(changes["deleted"], [6, 7])
+        self.assertFalse(changes["has_more"])
+        self.assertIsNone(changes["next_cursor"])
+
+    def test_next_cursor_continues_after_last_change(self):
+        rows = [Mock(campaign_id=i, version=i) for i in (4, 5, 6)]
+        self.change_query().order_by.return_value.limit.return_value.all.return_value = rows
+        filtered = self.change_query().filter.return_value
+        filtered.order_by.return_value.limit.return_value.all.return_value = rows[2:]
+        filtered.all.return_value = []
+
+        first = self.service.get_changes(since=3, limit=2)
+        self.assertTrue(first["has_more"])
+        self.assertEqual(first["deleted"], [4, 5])
+
+        self.service.get_changes(since=3, limit=2, cursor=first["next_cursor"])
+        condition = self.change_query().filter.call_args_list[-2][0][0]
+        sql = str(condition.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+        self.assertIn("> (5, 5)", sql)
+
+    def test_malformed_cursor_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.get_changes(since=5, cursor="garbage")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import asyncio
+import json
+import unittest
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.services.campaign_feed_reader import CampaignFeedReader, JsonArrayStream
+
+
+class TestJsonArrayStream(unittest.TestCase):
+    def test_elements_are_returned_as_they_complete(self):
+        text = json.dumps([{"id": i, "name": f"Campaign {i}"} for i in range(5)])
+        stream = JsonArrayStream()
+
+        items = []
+        for start in range(0, len(text), 7):
+            items.extend(stream.feed(text[start:start + 7]))
+        stream.close()
+
+        self.assertEqual([item["id"] for item in items], [0, 1, 2, 3, 4])
+
+    def test_truncated_array_is_rejected(self):
+        stream = JsonArrayStream()
+        stream.feed('[{"id": 1}, {"id"')
+
+        with self.assertRaises(ValueError):
+            stream.close()
+
+
+class TestCampaignFeedReader(unittest.TestCase):
+    def read(self, handler, path="/campaigns", headers=None, chunk_size=2, track=None, consume=None):
+        async def run():
+            app = web.Application()
+            app.router.add_get("/{name}", handler)
+            server = TestServer(app)
+            await server.start_server()
+            try:
+                reader = CampaignFeedReader(
+                    url=str(server.make_url(path)),
+                    headers=headers or {},
+                    chunk_size=chunk_size,
+                    track=track
+                )
+                chunks = []
+                async for chunk in reader.chunks():
+                    if consume:
+                        consume(chunk)
+                    chunks.append(chunk)
+                return reader, chunks
+            finally:
+                await server.close()
+
+        return asyncio.run(run())
+
+    def test_json_array_is_chunked(self):
+        async def handler(request):
+            return web.json_response([{"id": i} for i in range(5)], headers={"ETag": '"v1"'})
+
+        reader, chunks = self.read(handler)
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertFalse(reader.delta)
+        self.assertEqual(reader.etag, '"v1"')
+
+    def test_ndjson_with_link_pagination(self):
+        async def handler(request):
+            page = int(request.query.get("page", 1))
+            lines = "\n".join(json.dumps({"id": f"{page}-{i}"}) for i in range(3))
+            headers = {"Content-Type": "application/x-ndjson"}
+            if page < 2:
+                headers["Link"] = '</campaigns?page=2>; rel="next"'
+            return web.Response(text=lines, headers=headers)
+
+        reader, chunks = self.read(handler)
+
+        ids = [item["id"] for chunk in chunks for item in chunk]
+        self.assertEqual(ids, ["1-0", "1-1", "1-2", "2-0", "2-1", "2-2"])
+        self.assertEqual(reader.pages, 2)
+
+    def test_delta_envelope_pages_collect_tombstones_and_cursor(self):
+        async def handler(request):
+            page = int(request.query.get("page", 1))
+            body = {
+                "campaigns": [{"id": f"{page}-a"}, {"id": f"{page}-b", "deleted": True}],
+                "deleted": [f"{page}-c"],
+                "next_cursor": f"cursor-{page}"
+            }
+            if page < 3:
+                body["next_page"] = page + 1
+            return web.json_response(body)
+
+        reader, chunks = self.read(handler, path="/campaigns?since=cursor-0")
+
+        ids = [item["id"] for chunk in chunks for item in chunk]
+        self.assertEqual(ids, ["1-a", "2-a", "3-a"])
+        self.assertTrue(reader.delta)
+        self.assertEqual(sorted(reader.deleted), ["1-b", "1-c", "2-b", "2-c", "3-b", "3-c"])
+        self.assertEqual(reader.cursor, "cursor-3")
+
+    def test_not_modified_yields_nothing(self):
+        async def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return web.json_response([{"id": 1}])
+
+        reader, chunks = self.read(handler, headers={"If-None-Match": '"v1"'})
+
+        self.assertTrue(reader.not_modified)
+        self.assertEqual(chunks, [])
+
+    def test_track_covers_requests_but_not_consumers(self):
+        calls = []
+        in_call = []
+
+        @asynccontextmanager
+        async def track():
+            in_call.append(True)
+            try:
+                yield
+                calls.append("ok")
+            except Exception:
+                calls.append("failed")
+                raise
+            finally:
+                in_call.pop()
+
+        async def handler(request):
+            page = int(request.query.get("page", 1))
+            body = {"campaigns": [{"id": f"{page}-{i}"} for i in range(3)]}
+            if page < 2:
+                body["next_page"] = page + 1
+            return web.json_response(body)
+
+        def consume(chunk):
+            self.assertEqual(in_call, [])
+
+        reader, chunks = self.read(handler, track=track, consume=consume)
+
+        self.assertEqual(len(chunks), 3)
+        # One tracked call per page
+        self.assertEqual(calls, ["ok", "ok"])
+
+    def test_failed_request_is_tracked_as_failure(self):
+        calls = []
+
+        @asynccontextmanager
+        async def track():
+            try:
+                yield
+                calls.append("ok")
+            except Exception:
+                calls.append("failed")
+                raise
+
+        async def handler(request):
+            return web.Response(status=503)
+
+        with self.assertRaises(Exception):
+            self.read(handler, track=track)
+        self.assertEqual(calls, ["failed"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.services.campaign_lifecycle_service import CampaignLifecycleService
+
+
+def compile_sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestCampaignLifecycle(unittest.TestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.service = CampaignLifecycleService(self.db)
+        self.now = datetime(2025, 5, 31, 12, 0)
+
+    def test_expired_campaigns_are_deactivated_in_one_statement(self):
+        self.db.execute.return_value = [(3,), (8,)]
+
+        with patch('app.services.campaign_lifecycle_service.publish_invalidation') as publish:
+            self.assertEqual(self.service.expire_campaigns(self.now), [3, 8])
+        publish.assert_called_once_with(self.db, "campaign", [3, 8])
+
+        sql = compile_sql(self.db.execute.call_args[0][0])
+        self.assertIn("SET is_active=%(is_active)s, updated_at=now()", sql)
+        self.assertIn("WHERE campaigns.is_active = true AND campaigns.end_date <= %(end_date_1)s", sql)
+        self.assertIn("RETURNING campaigns.id", sql)
+
+    def test_start_is_announced_once(self):
+        self.db.query.return_value.filter.return_value.scalar.return_value = datetime(2025, 5, 31, 11, 0, tzinfo=timezone.utc)
+        self.db.query.return_value.scalar.return_value = True
+
+        self.assertTrue(self.service.announce_started_campaigns(self.now))
+        self.assertEqual(str(self.db.execute.call_args[0][0]), "SELECT bump_catalog_version()")
+
+        self.db.execute.reset_mock()
+        self.db.query.return_value.scalar.return_value = False
+        self.assertFalse(self.service.announce_started_campaigns(self.now))
+        self.db.execute.assert_not_called()
+
+    def test_next_boundary_is_the_earliest_start_or_end(self):
+        db = Mock()
+        db.query.side_effect = lambda *columns: Session().query(*columns)
+        query = CampaignLifecycleService(db).next_boundary
+        with patch("sqlalchemy.orm.Query.scalar", autospec=True) as scalar:
+            scalar.return_value = datetime(2025, 6, 1)
+            self.assertEqual(query(self.now), datetime(2025, 6, 1))
+
+        sql = compile_sql(scalar.call_args[0][0].statement)
+        self.assertIn("least(min(campaigns.start_date) FILTER (WHERE campaigns.start_date > ", sql)
+        self.assertIn("min(campaigns.end_date) FILTER (WHERE campaigns.end_date > ", sql)
+        self.assertIn("WHERE campaigns.is_active = true", sql)
+
+    def test_sweep_commits_and_reports_next_boundary(self):
+        self.service.expire_campaigns = Mock(return_value=[4])
+        self.service.announce_started_campaigns = Mock(return_value=False)
+        self.service.next_boundary = Mock(return_value=datetime(2025, 6, 1))
+
+        result = self.service.sweep(now=self.now)
+
+        self.assertEqual(result["expired_campaign_ids"], [4])
+        self.assertEqual(result["next_boundary"], datetime(2025, 6, 1))
+        self.db.commit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from collections import namedtuple
+from datetime import datetime
+from unittest.mock import Mock
+
+from app.api.v1.endpoints.campaigns import campaigns_to_campaign_out
+from app.models.campaign import Bank, Campaign, CampaignCategory, CampaignSource, CampaignStatus, CreditCard, Merchant
+from app.models.enums import CategoryEnum, DiscountType
+from app.schemas.campaign import CampaignOut
+
+BankRow = namedtuple("BankRow", "id name")
+CardRow = namedtuple("CardRow", "id name application_url")
+MerchantRow = namedtuple("MerchantRow", "id name")
+CategoryRow = namedtuple("CategoryRow", "id enum name")
+
+
+def make_campaign(campaign_id, bank_id=1, card_id=10, merchant_id=None, category_id=100):
+    return Campaign(
+        id=campaign_id,
+        name=f"Campaign {campaign_id}",
+        bank_id=bank_id,
+        card_id=card_id,
+        merchant_id=merchant_id,
+        category_id=category_id,
+        discount_type=DiscountType.CASHBACK,
+        discount_value=10,
+        min_amount=None,
+        is_active=True,
+        requires_enrollment=False,
+        priority=0,
+        start_date=datetime(2025, 5, 1),
+        end_date=datetime(2025, 6, 1),
+        source=CampaignSource.BANK_API,
+        status=CampaignStatus.APPROVED,
+        created_at=datetime(2025, 5, 1)
+    )
+
+
+class TestCampaignsToCampaignOut(unittest.TestCase):
+    def setUp(self):
+        rows = {
+            Bank: [BankRow(1, "Akbank"), BankRow(2, "Garanti")],
+            CreditCard: [CardRow(10, "Axess", "https://example.com/axess")],
+            Merchant: [MerchantRow(50, "Migros")],
+            CampaignCategory: [CategoryRow(100, "GROCERY", "Market")],
+        }
+        self.db = Mock()
+
+        def query(*columns):
+            result = Mock()
+            result.filter.return_value.all.return_value = rows[columns[0].class_]
+            return result
+
+        self.db.query.side_effect = query
+
+    def test_related_entities_are_loaded_once_per_page(self):
+        campaigns = [
+            make_campaign(1, merchant_id=50),
+            make_campaign(2, bank_id=2),
+            make_campaign(3, card_id=None),
+        ]
+
+        results = campaigns_to_campaign_out(campaigns, self.db)
+
+        self.assertEqual(self.db.query.call_count, 4)
+        self.assertEqual([r["bank_name"] for r in results], ["Akbank", "Garanti", "Akbank"])
+        self.assertEqual(results[0]["merchant_name"], "Migros")
+        self.assertIsNone(results[1]["merchant_name"])
+        self.assertIsNone(results[2]["card_name"])
+        self.assertEqual(results[0]["category"], CategoryEnum.GROCERY)
+        self.assertEqual(results[0]["campaign_category_name"], "Market")
+        self.assertEqual(results[0]["min_amount"], 0.0)
+        # Output validates against the response schema and carries only its fields
+        CampaignOut(**results[0])
+        self.assertLessEqual(set(results[0]), set(CampaignOut.model_fields))
+        self.assertNotIn("content_hash", results[0])
+        self.assertNotIn("external_id", results[0])
+        self.assertNotIn("review_notes", results[0])
+        self.assertNotIn("external_id", CampaignOut(**results[0]).model_dump())
+
+    def test_empty_page_makes_no_queries(self):
+        self.assertEqual(campaigns_to_campaign_out([], self.db), [])
+        self.db.query.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
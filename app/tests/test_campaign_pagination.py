@@ -0,0 +1,99 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign
+from app.services import campaign_pagination
+from app.services.campaign_pagination import _Explain, count_campaigns, decode_cursor, encode_cursor, keyset_page
+
+
+class TestCursor(unittest.TestCase):
+    def test_cursor_round_trip(self):
+        created_at = datetime(2025, 5, 29, 9, 30, tzinfo=timezone.utc)
+        cursor = encode_cursor(Mock(created_at=created_at, id=42))
+        self.assertEqual(decode_cursor(cursor), (created_at, 42))
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in ("garbage", "W10=", "WyJub3QtYS1kYXRlIiwgMV0="):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+class TestKeysetPage(unittest.TestCase):
+    def setUp(self):
+        self.query = Mock()
+        self.campaigns = [Mock(id=i, created_at=datetime(2025, 5, i, tzinfo=timezone.utc)) for i in (9, 8, 7)]
+
+    def rows(self, query):
+        return query.order_by.return_value.limit.return_value.all
+
+    def test_page_continues_after_cursor_without_offset(self):
+        filtered = self.query.filter.return_value
+        self.rows(filtered).return_value = self.campaigns[:2]
+
+        campaigns, next_cursor = keyset_page(self.query, 2, cursor=(datetime(2025, 5, 10), 100), skip=50)
+
+        self.assertEqual(campaigns, self.campaigns[:2])
+        self.assertIsNone(next_cursor)
+        self.query.offset.assert_not_called()
+        condition = str(self.query.filter.call_args[0][0].compile(dialect=postgresql.dialect()))
+        self.assertEqual(
+            condition,
+            "(campaigns.created_at, campaigns.id) < (%(param_1)s::TIMESTAMP WITH TIME ZONE, %(param_2)s::INTEGER)"
+        )
+
+    def test_next_cursor_points_at_last_returned_campaign(self):
+        self.rows(self.query).return_value = self.campaigns
+
+        campaigns, next_cursor = keyset_page(self.query, 2)
+
+        self.assertEqual(campaigns, self.campaigns[:2])
+        self.assertEqual(decode_cursor(next_cursor), (self.campaigns[1].created_at, 8))
+        self.query.order_by.return_value.limit.assert_called_once_with(3)
+
+
+class TestCountCampaigns(unittest.TestCase):
+    def setUp(self):
+        campaign_pagination.clear_count_cache()
+        self.query = Session().query(Campaign).filter(Campaign.bank_id == 3)
+
+    def test_explain_compiles_with_bound_parameters(self):
+        sql = str(_Explain(self.query.statement).compile(dialect=postgresql.dialect()))
+        self.assertTrue(sql.startswith("EXPLAIN (FORMAT JSON) SELECT"))
+        self.assertIn("campaigns.bank_id = %(bank_id_1)s", sql)
+
+    def test_large_counts_are_estimated_and_cached(self):
+        with patch.object(campaign_pagination, "estimate_count", return_value=250000) as estimate:
+            self.assertEqual(count_campaigns(self.query), (250000, True))
+            self.assertEqual(count_campaigns(self.query), (250000, True))
+        estimate.assert_called_once()
+
+    def test_current_time_binds_share_a_key_within_the_ttl(self):
+        def listing(now):
+            return Session().query(Campaign).filter(Campaign.end_date > now)
+
+        with patch.object(campaign_pagination.settings, "CAMPAIGN_COUNT_CACHE_TTL_SECONDS", 60), \
+                patch.object(campaign_pagination, "estimate_count", return_value=250000) as estimate:
+            count_campaigns(listing(datetime(2025, 5, 29, 9, 30, 1)))
+            count_campaigns(listing(datetime(2025, 5, 29, 9, 30, 59)))
+            count_campaigns(listing(datetime(2025, 5, 29, 9, 31, 0)))
+
+        self.assertEqual(estimate.call_count, 2)
+
+    def test_expired_and_oldest_entries_are_dropped(self):
+        with patch.object(campaign_pagination.settings, "CAMPAIGN_COUNT_CACHE_SIZE", 2), \
+                patch.object(campaign_pagination, "estimate_count", return_value=250000), \
+                patch.object(campaign_pagination.time, "monotonic", side_effect=[0, 1, 2, 1000]):
+            for bank_id in (1, 2, 3):
+                count_campaigns(Session().query(Campaign).filter(Campaign.bank_id == bank_id))
+            self.assertEqual(len(campaign_pagination._count_cache), 2)
+
+            count_campaigns(self.query)
+            self.assertEqual(len(campaign_pagination._count_cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import Mock
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.campaign_search import CampaignSearchService
+
+
+class TestCampaignSearchService(unittest.TestCase):
+    def test_build_tsquery_prefix_matches_every_word(self):
+        self.assertEqual(CampaignSearchService.build_tsquery("Migros indir"), "Migros:* & indir:*")
+
+    def test_build_tsquery_strips_tsquery_syntax(self):
+        self.assertEqual(CampaignSearchService.build_tsquery("akbank & (!x) | 'y':*"), "akbank:* & x:* & y:*")
+        self.assertIsNone(CampaignSearchService.build_tsquery(" &|! "))
+
+    def test_build_tsquery_keeps_turkish_letters(self):
+        # Folding happens in the database, the same way the documents were indexed
+        self.assertEqual(CampaignSearchService.build_tsquery("İndirim şahane"), "İndirim:* & şahane:*")
+
+    def test_empty_query_skips_database(self):
+        db = Mock()
+        self.assertEqual(CampaignSearchService(db).search("  "), [])
+        db.query.assert_not_called()
+
+    def test_search_uses_index_and_ranks(self):
+        db = Mock()
+        query = db.query.return_value
+        query.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = []
+
+        CampaignSearchService(db).search("migros", limit=5)
+
+        where = str(query.filter.call_args[0][0].compile(dialect=postgresql.dialect()))
+        self.assertIn("campaigns.search_vector @@ to_tsquery(", where)
+        self.assertIn("campaign_search_normalize(", where)
+        order = str(query.filter.return_value.order_by.call_args[0][0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ts_rank_cd(campaigns.search_vector", order)
+
+
+if __name__ == "__main__":
+    unittest.main()
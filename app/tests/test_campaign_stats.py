@@ -0,0 +1,71 @@
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.services import campaign_stats
+from app.services.campaign_stats import CampaignStatsService
+
+
+class TestCampaignSummary(unittest.TestCase):
+    def setUp(self):
+        campaign_stats.clear_summary_cache()
+        self.version = 1
+        patcher = patch.object(campaign_stats, "get_catalog_version", side_effect=lambda db: self.version)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_counters_come_from_one_filtered_aggregate(self):
+        query = Session().query
+        db = Mock()
+        db.query.side_effect = lambda *columns: query(*columns)
+        with patch("sqlalchemy.orm.Query.one", autospec=True) as one:
+            one.return_value = Mock(_asdict=lambda: {"total": 9, "pending": None})
+            summary = CampaignStatsService(db).compute_summary(now=datetime(2025, 5, 30))
+
+        self.assertEqual(summary, {"total": 9, "pending": 0})
+        db.query.assert_called_once()
+        sql = str(one.call_args[0][0].statement.compile(dialect=postgresql.dialect()))
+        self.assertIn("count(*) FILTER (WHERE campaigns.status = %(status_1)s) AS pending", sql)
+        self.assertEqual(sql.count("FILTER"), 7)
+        self.assertEqual(sql.count("FROM campaigns"), 1)
+
+    def test_summary_is_cached_per_catalog_version(self):
+        service = CampaignStatsService(Mock())
+        with patch.object(service, "compute_summary", return_value={"total": 3}) as compute:
+            service.get_summary()
+            service.get_summary()
+            self.assertEqual(compute.call_count, 1)
+
+            self.version = 2
+            service.get_summary()
+            self.assertEqual(compute.call_count, 2)
+
+
+class TestCampaignPerformance(unittest.TestCase):
+    def test_rows_are_enriched_without_per_campaign_queries(self):
+        db = Mock()
+        rows = db.query.return_value.join.return_value.outerjoin.return_value.outerjoin.return_value\
+            .order_by.return_value.all
+        rows.return_value = [
+            Mock(campaign_id=4, impression_count=8, click_count=2, campaign_name="Market", bank_name="Akbank", card_name=None),
+        ]
+
+        performance = CampaignStatsService(db).get_campaign_performance(datetime(2025, 5, 1), datetime(2025, 5, 30))
+
+        self.assertEqual(performance, [{
+            "campaign_id": 4,
+            "campaign_name": "Market",
+            "bank_name": "Akbank",
+            "card_name": "Unknown",
+            "impression_count": 8,
+            "click_count": 2,
+            "ctr": 25.0
+        }])
+        self.assertEqual(db.query.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,328 @@
+import asyncio
+import time
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.models.campaign import CampaignStatus
+from app.services.campaign_pagination import decode_cursor
+from app.services.campaign_sync_service import CampaignSyncService
+
+
+class TestSyncAllBanks(unittest.TestCase):
+    def setUp(self):
+        self.banks = []
+        for bank_id in range(1, 5):
+            bank = Mock(id=bank_id)
+            bank.name = f"Bank {bank_id}"
+            self.banks.append(bank)
+
+        self.db = Mock()
+        self.db.query.return_value.filter.return_value.all.return_value = self.banks
+        self.sessions = []
+
+    def session_factory(self):
+        session = Mock()
+        self.sessions.append(session)
+        return session
+
+    async def fake_sync_bank_campaigns(self, service, bank_id):
+        if bank_id == 3:
+            return {"success": False, "message": "Bank API credentials not configured"}
+        if bank_id == 4:
+            await asyncio.sleep(1)
+        else:
+            await asyncio.sleep(0.1)
+        return {"success": True, "imported_campaigns": 10}
+
+    def run_sync(self):
+        service = CampaignSyncService(self.db, session_factory=self.session_factory)
+        fake = self.fake_sync_bank_campaigns
+
+        async def sync_bank_campaigns(instance, bank_id):
+            return await fake(instance, bank_id)
+
+        with patch.object(CampaignSyncService, 'sync_bank_campaigns', sync_bank_campaigns), \
+                patch.object(settings, 'CAMPAIGN_SYNC_CONCURRENCY', 4), \
+                patch.object(settings, 'CAMPAIGN_SYNC_BANK_TIMEOUT_SECONDS', 0.5):
+            return asyncio.run(service.sync_all_banks())
+
+    def test_banks_are_synced_concurrently_and_merged(self):
+        start = time.monotonic()
+        result = self.run_sync()
+        elapsed = time.monotonic() - start
+
+        # Banks 1 and 2 run side by side; bank 4 is cut off by the timeout
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(result["synced_banks"], 2)
+        self.assertEqual(result["total_campaigns"], 20)
+        failed = {bank["bank_id"]: bank["error"] for bank in result["failed_banks"]}
+        self.assertEqual(set(failed), {3, 4})
+        self.assertIn("timed out", failed[4])
+
+    def test_each_bank_gets_its_own_session(self):
+        self.run_sync()
+
+        self.assertEqual(len(self.sessions), len(self.banks))
+        for session in self.sessions:
+            session.close.assert_called_once()
+
+
+class TestProcessImportedCampaigns(unittest.TestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.db.query.return_value.all.return_value = [(1, "ELECTRONICS"), (2, "OTHER")]
+        self.db.query.return_value.filter.return_value.all.return_value = []
+        self.db.execute.return_value.scalars.return_value.all.side_effect = [[11, 12], [13]]
+        self.service = CampaignSyncService(self.db)
+        patcher = patch('app.services.campaign_sync_service.publish_invalidation')
+        self.publish = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_campaigns_are_inserted_in_chunks(self):
+        campaigns = [
+            {"id": "a", "name": "A", "category": "tech"},
+            {"id": "b", "name": "B", "category": "unknown"},
+            {"id": "c", "name": "C"},
+            {"id": "a", "name": "A (updated)"},
+            {"name": "No external ID"},
+        ]
+
+        with patch.object(settings, 'CAMPAIGN_SYNC_UPSERT_CHUNK_SIZE', 2):
+            result = asyncio.run(self.service._process_imported_campaigns(1, campaigns))
+
+        self.assertEqual(self.db.execute.call_count, 2)
+        self.db.commit.assert_called_once()
+        self.assertEqual(result["imported_campaigns"], 3)
+        self.assertEqual(result["new_campaigns"], 3)
+        self.assertEqual(result["updated_campaigns"], 0)
+        self.assertEqual(result["pending_approval"], 3)
+        # New campaigns get defaults for what the feed left out
+        params = self.db.execute.call_args_list[0][0][0].compile().params
+        self.assertEqual(params["description_m0"], "")
+        self.assertEqual(params["category_id_m0"], 2)
+
+    def test_statements_target_unique_index_and_keep_omitted_fields(self):
+        row = self.service._campaign_values_from_data(1, {"id": "a", "category": "tech"}, {"ELECTRONICS": 1})
+        self.assertEqual(row["category_id"], 1)
+
+        insert_sql = str(self.service._build_insert([row]).compile(dialect=postgresql.dialect()))
+        update_sql = str(self.service._build_update(1, [row], CampaignStatus.PENDING).compile(dialect=postgresql.dialect()))
+
+        self.assertIn("ON CONFLICT (bank_id, external_id, source) DO NOTHING", insert_sql)
+        self.assertIn("end_date=coalesce(CAST(feed.end_date AS TIMESTAMP WITHOUT TIME ZONE), campaigns.end_date)", update_sql)
+        self.assertIn("IS DISTINCT FROM CAST(feed.content_hash AS VARCHAR(64))", update_sql)
+        self.assertIn("RETURNING campaigns.id", update_sql)
+
+    def test_reimport_without_fields_keeps_stored_values(self):
+        self.db.query.return_value.filter.return_value.all.return_value = [("a", "stale")]
+        self.db.execute.return_value.scalars.return_value.all.side_effect = [[11]]
+
+        result = asyncio.run(self.service._process_imported_campaigns(1, [{"id": "a", "name": "A2"}]))
+
+        self.assertEqual(result["updated_campaigns"], 1)
+        self.assertEqual(result["new_campaigns"], 0)
+        statement = self.db.execute.call_args[0][0]
+        self.assertTrue(str(statement).startswith("UPDATE campaigns"))
+        # Omitted fields go out as NULL and are coalesced with the stored values
+        params = statement.compile().params
+        self.assertIn("A2", params.values())
+        sent = [value for value in params.values() if isinstance(value, datetime)]
+        self.assertEqual(sent, [])
+        feed_row = self.service._campaign_values_from_data(1, {"id": "a", "name": "A2"}, {"OTHER": 2})
+        for field in ("end_date", "start_date", "card_id", "merchant_id", "description",
+                      "discount_value", "min_amount", "is_active"):
+            self.assertIsNone(feed_row[field], field)
+
+    def test_republished_archived_campaign_is_revived(self):
+        category_ids = {"OTHER": 2}
+        republished = {"id": "a", "name": "A"}
+        # Archived campaigns come back from the hash lookup without a hash
+        self.db.query.return_value.filter.return_value.all.return_value = [("a", None)]
+        self.db.execute.return_value.scalars.return_value.all.side_effect = [[11]]
+
+        result = asyncio.run(self.service._process_imported_campaigns(1, [republished], category_ids=category_ids))
+
+        self.assertEqual(result["updated_campaigns"], 1)
+        self.assertEqual(result["unchanged_campaigns"], 0)
+        compiled = self.db.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        # Archived rows pass the guard whatever their hash, and get a status and is_active again
+        self.assertIn("(campaigns.status = %(status_1)s OR campaigns.content_hash IS DISTINCT FROM", sql)
+        self.assertIn("status=CASE WHEN (campaigns.status = %(status_1)s) THEN %(param_1)s ELSE campaigns.status END", sql)
+        self.assertIn("is_active=CASE WHEN (campaigns.status = %(status_1)s) THEN coalesce(", sql)
+        self.assertEqual(compiled.params["status_1"], CampaignStatus.ARCHIVED)
+        self.assertEqual(compiled.params["param_1"], CampaignStatus.PENDING)
+        self.assertIn(CampaignStatus.ARCHIVED, compiled.params["status_2"])
+        self.assertNotIn(CampaignStatus.REJECTED, compiled.params["status_2"])
+
+        lookup = self.db.query.call_args[0]
+        self.assertIn("CASE WHEN", str(lookup[1]))
+
+    def test_unchanged_campaigns_are_not_written(self):
+        category_ids = {"OTHER": 2}
+        unchanged = {"id": "a", "name": "A"}
+        existing_hash = self.service._campaign_values_from_data(1, unchanged, category_ids)["content_hash"]
+        self.db.query.return_value.all.return_value = [(2, "OTHER")]
+        self.db.query.return_value.filter.return_value.all.return_value = [("a", existing_hash), ("b", "stale")]
+        self.db.execute.return_value.scalars.return_value.all.side_effect = [[12]]
+
+        result = asyncio.run(self.service._process_imported_campaigns(1, [unchanged, {"id": "b", "name": "B"}]))
+
+        self.assertEqual(result["unchanged_campaigns"], 1)
+        self.assertEqual(result["updated_campaigns"], 1)
+        rows = self.db.execute.call_args[0][0].compile().params
+        self.assertIn("B", rows.values())
+        self.assertNotIn("A", rows.values())
+        self.publish.assert_called_once_with(self.db, "campaign")
+
+    def test_content_hash_ignores_sync_bookkeeping(self):
+        first = self.service._campaign_values_from_data(1, {"id": "a", "name": "A"}, {"OTHER": 2})
+        time.sleep(0.01)
+        second = self.service._campaign_values_from_data(1, {"id": "a", "name": "A"}, {"OTHER": 2})
+        changed = self.service._campaign_values_from_data(1, {"id": "a", "name": "A2"}, {"OTHER": 2})
+
+        self.assertEqual(first["content_hash"], second["content_hash"])
+        self.assertNotEqual(first["content_hash"], changed["content_hash"])
+
+
+class FakeFeed:
+    def __init__(self, chunks, not_modified=False, delta=False, deleted=None, cursor=None, etag=None):
+        self._chunks = chunks
+        self.not_modified = not_modified
+        self.delta = delta
+        self.deleted = deleted or []
+        self.cursor = cursor
+        self.etag = etag
+        self.last_modified = None
+
+    async def chunks(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class TestDeltaSync(unittest.TestCase):
+    def setUp(self):
+        self.bank = Mock(
+            id=1,
+            campaign_sync_enabled=True,
+            campaign_sync_endpoint="/campaigns",
+            api_key="key",
+            api_secret="secret",
+            auto_approve_campaigns=False,
+            campaign_sync_cursor="cursor-1",
+            campaign_sync_etag='"v1"',
+            campaign_sync_last_modified=None
+        )
+        self.db = Mock()
+        self.db.query.return_value.filter.return_value.first.return_value = self.bank
+        self.db.query.return_value.all.return_value = [(2, "OTHER")]
+        self.service = CampaignSyncService(self.db)
+        patcher = patch('app.services.campaign_sync_service.publish_invalidation')
+        self.publish = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sync(self, feed):
+        with patch('app.services.campaign_sync_service.get_bank_credentials', return_value=("key", "secret")), \
+                patch.object(self.service, '_open_campaign_feed', return_value=feed), \
+                patch.object(self.service, '_process_imported_campaigns') as process:
+            process.return_value = {
+                "imported_campaigns": 1, "updated_campaigns": 1, "unchanged_campaigns": 0,
+                "new_campaigns": 0, "pending_approval": 0, "auto_approved": 0
+            }
+            return asyncio.run(self.service.sync_bank_campaigns(1)), process
+
+    def test_not_modified_skips_import(self):
+        result, process = self.sync(FakeFeed([], not_modified=True))
+
+        self.assertTrue(result["success"])
+        self.assertTrue(result["not_modified"])
+        process.assert_not_called()
+        self.assertEqual(self.bank.campaign_sync_cursor, "cursor-1")
+
+    def test_delta_applies_tombstones_and_advances_cursor(self):
+        self.db.execute.return_value.rowcount = 2
+        feed = FakeFeed(
+            [[{"id": "c"}], [{"id": "d"}]],
+            delta=True, deleted=["a", "b"], cursor="cursor-2", etag='"v2"'
+        )
+
+        result, process = self.sync(feed)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["deleted_campaigns"], 2)
+        # Each streamed chunk goes through the import pipeline
+        self.assertEqual(process.call_count, 2)
+        self.assertEqual(result["imported_campaigns"], 2)
+        self.assertEqual(self.bank.campaign_sync_cursor, "cursor-2")
+        self.assertEqual(self.bank.campaign_sync_etag, '"v2"')
+        archive_sql = str(self.db.execute.call_args[0][0])
+        self.assertIn("UPDATE campaigns", archive_sql)
+        self.publish.assert_called_once_with(self.db, "campaign")
+
+    def test_empty_full_feed_is_a_successful_sync(self):
+        feed = FakeFeed([], etag='"v2"')
+
+        result, process = self.sync(feed)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["imported_campaigns"], 0)
+        process.assert_not_called()
+        self.assertEqual(self.bank.campaign_sync_etag, '"v2"')
+        self.db.commit.assert_called()
+
+
+class TestBulkReview(unittest.TestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.service = CampaignSyncService(self.db)
+        patcher = patch('app.services.campaign_sync_service.publish_invalidation')
+        self.publish = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_bulk_approve_is_a_single_update(self):
+        self.db.execute.return_value.scalars.return_value.all.return_value = [1, 2]
+
+        result = self.service.bulk_review_campaigns(
+            CampaignStatus.APPROVED, admin_id=9, bank_id=3,
+            created_from=datetime(2025, 5, 1, tzinfo=timezone.utc)
+        )
+
+        self.assertEqual(result["updated_campaigns"], 2)
+        self.db.execute.assert_called_once()
+        self.db.commit.assert_called_once()
+        self.publish.assert_called_once_with(self.db, "campaign", [1, 2])
+        sql = str(self.db.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        self.assertIn("UPDATE campaigns SET", sql)
+        self.assertIn("campaigns.status = %(status_1)s", sql)
+        self.assertIn("campaigns.bank_id = %(bank_id_1)s", sql)
+        self.assertIn("RETURNING campaigns.id", sql)
+
+    def test_bulk_review_requires_a_selection(self):
+        result = self.service.bulk_review_campaigns(CampaignStatus.REJECTED, admin_id=9)
+        self.assertFalse(result["success"])
+        result = self.service.bulk_review_campaigns(CampaignStatus.REJECTED, admin_id=9, campaign_ids=[])
+        self.assertFalse(result["success"])
+        self.db.execute.assert_not_called()
+
+    def test_pending_page_returns_next_cursor(self):
+        created_at = datetime(2025, 5, 28, 10, 0, tzinfo=timezone.utc)
+        campaigns = [Mock(id=campaign_id, created_at=created_at) for campaign_id in (5, 4, 3)]
+        query = self.db.query.return_value.options.return_value.filter.return_value
+        query.order_by.return_value.limit.return_value.all.return_value = campaigns
+
+        page = self.service.get_pending_campaigns_page(limit=2)
+
+        self.assertEqual(page["items"], campaigns[:2])
+        self.assertEqual(decode_cursor(page["next_cursor"]), (created_at, 4))
+
+    def test_invalid_cursor_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.get_pending_campaigns_page(cursor="not-a-cursor")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from app.models.campaign import CampaignSyncRunStatus
+from app.services.campaign_sync_run_service import CampaignSyncRunService
+from app.tasks import campaign_sync_worker
+
+
+class TestCampaignSyncRunService(unittest.TestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.service = CampaignSyncRunService(self.db)
+
+    def test_enqueue_reuses_queued_run(self):
+        queued = Mock(id=7)
+        self.db.query.return_value.filter.return_value.first.return_value = queued
+
+        self.assertIs(self.service.enqueue(), queued)
+        self.db.add.assert_not_called()
+
+    def test_enqueue_creates_run(self):
+        self.db.query.return_value.filter.return_value.first.return_value = None
+
+        run = self.service.enqueue(bank_id=3, requested_by=1)
+
+        self.db.add.assert_called_once_with(run)
+        self.assertEqual(run.bank_id, 3)
+        self.assertEqual(run.status, CampaignSyncRunStatus.QUEUED)
+
+    def test_claim_next_skips_locked_runs(self):
+        self.db.execute.return_value.scalar.return_value = None
+
+        self.assertIsNone(self.service.claim_next("worker-1"))
+
+        statement = self.db.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.assertIn("FOR UPDATE SKIP LOCKED", sql)
+        self.assertIn("RETURNING campaign_sync_runs.id", sql)
+
+    def test_record_bank_result_appends_progress_in_sql(self):
+        self.service.record_bank_result(5, 2, "Bank", {"success": True, "message": "ok", "imported_campaigns": 4})
+
+        statement = self.db.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.assertIn("progress=(campaign_sync_runs.progress ||", sql)
+        self.assertIn("completed_banks=(campaign_sync_runs.completed_banks +", sql)
+        self.db.commit.assert_called_once()
+
+
+class TestExecuteSyncRun(unittest.TestCase):
+    def run_sync(self, run, sync_service):
+        runs = Mock()
+        runs.get.return_value = run
+        with patch.object(campaign_sync_worker, "SessionLocal", Mock()), \
+                patch.object(campaign_sync_worker, "CampaignSyncRunService", return_value=runs), \
+                patch.object(campaign_sync_worker, "CampaignSyncService", return_value=sync_service):
+            result = asyncio.run(campaign_sync_worker.execute_sync_run(run.id))
+        return result, runs
+
+    def test_all_banks_run_records_each_bank(self):
+        bank = Mock(id=2)
+        bank.name = "Bank"
+        bank_result = {"success": True}
+        result = {"success": True, "message": "done"}
+
+        async def sync_all_banks(on_bank_synced=None):
+            on_bank_synced(bank, bank_result)
+            return result
+
+        sync_service = Mock()
+        sync_service.sync_all_banks = sync_all_banks
+        result_out, runs = self.run_sync(Mock(id=1, bank_id=None), sync_service)
+
+        self.assertEqual(result_out, result)
+        runs.record_bank_result.assert_called_once_with(1, 2, "Bank", bank_result)
+        runs.finish.assert_called_once_with(1, result)
+
+    def test_failed_sync_fails_run(self):
+        sync_service = Mock()
+        sync_service.sync_bank_campaigns = AsyncMock(side_effect=RuntimeError("boom"))
+
+        result, runs = self.run_sync(Mock(id=1, bank_id=3), sync_service)
+
+        self.assertFalse(result["success"])
+        runs.fail.assert_called_once_with(1, "boom")
+        runs.finish.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+from datetime import datetime
+from typing import List
+from unittest.mock import Mock, patch
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.schemas.campaign import CampaignCategory
+from app.services import catalog_cache
+from app.services.catalog_cache import CachedResponse, CatalogResponseCache, catalog_response
+
+
+class TestCatalogResponseCache(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = CatalogResponseCache(max_entries=2)
+        entry = CachedResponse(b"[]", '"x"', {})
+        cache.set("a", entry)
+        cache.set("b", entry)
+        cache.get("a")
+        cache.set("c", entry)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 2)
+
+
+class TestCatalogResponse(unittest.TestCase):
+    def setUp(self):
+        catalog_cache.catalog_response_cache.clear()
+        self.version = 1
+        self.builds = 0
+        app = FastAPI()
+
+        @app.get("/items")
+        def items(request: Request, page: int = 0):
+            def build(response: Response):
+                self.builds += 1
+                response.headers["X-Next-Cursor"] = "next"
+                return [{"id": page, "version": self.version}]
+            return catalog_response(request, Mock(), build)
+
+        @app.get("/categories")
+        def categories(request: Request):
+            def build(response: Response):
+                return [{"id": 1, "name": "Market", "slug": "market", "created_at": datetime(2025, 5, 1), "extra": 1}]
+            return catalog_response(request, Mock(), build, response_model=List[CampaignCategory])
+
+        patcher = patch.object(catalog_cache, "get_catalog_version", side_effect=lambda db: self.version)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(app)
+
+    def test_responses_are_cached_per_version_and_params(self):
+        first = self.client.get("/items")
+        self.client.get("/items")
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(first.headers["X-Next-Cursor"], "next")
+        self.assertEqual(first.headers["X-Catalog-Version"], "1")
+
+        self.client.get("/items?page=2")
+        self.assertEqual(self.builds, 2)
+
+        self.version = 2
+        self.assertEqual(self.client.get("/items").json(), [{"id": 0, "version": 2}])
+        self.assertEqual(self.builds, 3)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get("/items").headers["ETag"]
+
+        not_modified = self.client.get("/items", headers={"If-None-Match": etag})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+        self.version = 2
+        self.assertEqual(self.client.get("/items", headers={"If-None-Match": etag}).status_code, 200)
+
+    def test_response_model_is_applied(self):
+        body = self.client.get("/categories").json()
+        self.assertNotIn("extra", body[0])
+        self.assertEqual(body[0]["created_at"], "2025-05-01T00:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
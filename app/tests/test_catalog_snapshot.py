@@ -0,0 +1,107 @@
+import gzip
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import msgpack
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.services import catalog_snapshot
+from app.services.catalog_snapshot import decode_snapshot, encode_snapshot, snapshot_response
+
+
+def campaign_out(campaign_id, bank_name="Garanti BBVA"):
+    return {
+        "id": campaign_id,
+        "name": f"Campaign {campaign_id}",
+        "bank_id": 1,
+        "card_id": 2,
+        "category_id": 3,
+        "discount_type": "percentage",
+        "discount_value": 10.0,
+        "start_date": datetime(2025, 5, 1),
+        "end_date": datetime(2025, 6, 1),
+        "is_active": True,
+        "requires_enrollment": False,
+        "priority": 0,
+        "created_at": datetime(2025, 5, 1),
+        "bank_name": bank_name,
+        "card_name": "Bonus",
+        "category": "GROCERY",
+        "campaign_category_name": "Market",
+    }
+
+
+class TestSnapshotEncoding(unittest.TestCase):
+    def test_columns_round_trip_with_interned_strings(self):
+        records = [
+            {"id": 1, "bank_name": "Akbank", "card_name": None, "discount_value": 5.0},
+            {"id": 2, "bank_name": "Akbank", "card_name": "Axess", "discount_value": 7.5},
+        ]
+
+        body = encode_snapshot(4, records)
+        document = msgpack.unpackb(body)
+
+        self.assertEqual(document["version"], 4)
+        self.assertEqual(document["strings"], ["Akbank", "Axess"])
+        self.assertEqual(document["columns"]["bank_name"], [0, 0])
+        self.assertEqual(document["columns"]["card_name"], [None, 1])
+        rows = decode_snapshot(body)
+        self.assertEqual(rows[1]["bank_name"], "Akbank")
+        self.assertEqual(rows[1]["card_name"], "Axess")
+        self.assertEqual(rows[0]["discount_value"], 5.0)
+        self.assertIsNone(rows[0]["merchant_name"])
+
+
+class TestSnapshotResponse(unittest.TestCase):
+    def setUp(self):
+        catalog_snapshot.catalog_snapshot_cache.clear()
+        self.version = 1
+        self.builds = 0
+        app = FastAPI()
+
+        @app.get("/snapshot")
+        def snapshot(request: Request):
+            def build():
+                self.builds += 1
+                return [campaign_out(1), campaign_out(2, bank_name="Akbank")]
+            return snapshot_response(request, Mock(), build)
+
+        patcher = patch.object(catalog_snapshot, "get_catalog_version", side_effect=lambda db: self.version)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(app)
+
+    def test_snapshot_is_built_once_per_version(self):
+        first = self.client.get("/snapshot")
+        self.client.get("/snapshot")
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(first.headers["X-Catalog-Version"], "1")
+        self.assertEqual(first.headers["Content-Encoding"], "gzip")
+
+        rows = decode_snapshot(first.content)
+        self.assertEqual([row["bank_name"] for row in rows], ["Garanti BBVA", "Akbank"])
+        self.assertEqual(rows[0]["start_date"], "2025-05-01T00:00:00")
+        self.assertEqual(rows[0]["min_amount"], 0.0)
+
+        self.version = 2
+        self.client.get("/snapshot")
+        self.assertEqual(self.builds, 2)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get("/snapshot").headers["ETag"]
+        self.assertEqual(self.client.get("/snapshot", headers={"If-None-Match": etag}).status_code, 304)
+
+    def test_clients_without_gzip_get_the_inflated_body(self):
+        response = self.client.get("/snapshot", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(len(decode_snapshot(response.content)), 2)
+        self.assertEqual(
+            gzip.decompress(catalog_snapshot.catalog_snapshot_cache.get(Mock(), None).body),
+            response.content
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
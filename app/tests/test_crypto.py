@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from app.core.config import settings
+from app.tasks import credential_rotation_task
+from app.utils import crypto
+
+
+class TestCrypto(unittest.TestCase):
+    def setUp(self):
+        crypto.invalidate_bank_credentials()
+
+    def test_key_is_derived_once(self):
+        crypto.derive_key.cache_clear()
+        crypto._build_fernet.cache_clear()
+        crypto.encrypt_data("a")
+        crypto.encrypt_data("b")
+
+        self.assertEqual(crypto.derive_key.cache_info().misses, 1)
+
+    def test_rotation_keeps_old_data_readable(self):
+        with patch.object(settings, 'SECRET_KEY', 'old-secret'):
+            token = crypto.encrypt_data("api-key")
+
+        with patch.object(settings, 'SECRET_KEY', 'new-secret'), \
+                patch.object(settings, 'PREVIOUS_SECRET_KEYS', ['old-secret']):
+            self.assertEqual(crypto.decrypt_data(token), "api-key")
+            rotated = crypto.rotate_data(token)
+
+        with patch.object(settings, 'SECRET_KEY', 'new-secret'):
+            self.assertEqual(crypto.decrypt_data(rotated), "api-key")
+
+    def test_bank_credentials_are_cached_until_changed(self):
+        bank = Mock(id=1, api_key=crypto.encrypt_data("key"), api_secret=crypto.encrypt_data("secret"))
+
+        with patch.object(crypto, 'decrypt_data', wraps=crypto.decrypt_data) as decrypt:
+            self.assertEqual(crypto.get_bank_credentials(bank), ("key", "secret"))
+            self.assertEqual(crypto.get_bank_credentials(bank), ("key", "secret"))
+            self.assertEqual(decrypt.call_count, 2)
+
+            bank.api_key = crypto.encrypt_data("new-key")
+            self.assertEqual(crypto.get_bank_credentials(bank), ("new-key", "secret"))
+
+            crypto.invalidate_bank_credentials(1)
+            crypto.get_bank_credentials(bank)
+            self.assertEqual(decrypt.call_count, 6)
+
+
+class TestRotateBankCredentials(unittest.TestCase):
+    def test_only_credentials_under_previous_keys_are_rotated(self):
+        with patch.object(settings, 'SECRET_KEY', 'old-secret'):
+            old_bank = Mock(id=1, api_key=crypto.encrypt_data("key-1"), api_secret=crypto.encrypt_data("secret-1"))
+        with patch.object(settings, 'SECRET_KEY', 'new-secret'):
+            current_key = crypto.encrypt_data("key-2")
+            current_bank = Mock(id=2, api_key=current_key, api_secret=None)
+
+        db = Mock()
+        db.query.return_value.filter.return_value.with_for_update.return_value.all.return_value = [old_bank, current_bank]
+
+        with patch.object(settings, 'SECRET_KEY', 'new-secret'), \
+                patch.object(settings, 'PREVIOUS_SECRET_KEYS', ['old-secret']), \
+                patch.object(credential_rotation_task, 'SessionLocal', return_value=db):
+            result = credential_rotation_task.rotate_bank_credentials()
+
+            self.assertEqual(result, {"success": True, "rotated": 1})
+            self.assertFalse(crypto.needs_rotation(old_bank.api_key))
+            self.assertEqual(crypto.decrypt_data(old_bank.api_secret), "secret-1")
+            self.assertEqual(current_bank.api_key, current_key)
+        db.commit.assert_called_once()
+
+        with patch.object(settings, 'SECRET_KEY', 'new-secret'):
+            self.assertEqual(crypto.decrypt_data(old_bank.api_key), "key-1")
+
+    def test_not_scheduled_without_previous_keys(self):
+        scheduler = Mock()
+
+        with patch.object(settings, 'PREVIOUS_SECRET_KEYS', []):
+            credential_rotation_task.schedule_credential_rotation(scheduler)
+
+        scheduler.add_job.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
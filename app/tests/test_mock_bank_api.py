@@ -0,0 +1,132 @@
+import asyncio
+import socket
+import unittest
+
+import uvicorn
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import mock_bank_api
+from app.api.v1.endpoints.mock_bank_api import BankSimulatorConfig, MockBankFeed, create_mock_bank_app
+from app.services.campaign_feed_reader import CampaignFeedReader
+
+
+def make_config(**overrides):
+    values = dict(seed=7, campaign_count=300, page_size=50, day=10,
+                  daily_change_rate=0.1, daily_delete_rate=0.02, daily_new_rate=0.02)
+    values.update(overrides)
+    return BankSimulatorConfig(**values)
+
+
+def full_catalog(feed, day):
+    return {campaign["external_id"]: campaign for campaign in feed.iter_all(day)}
+
+
+class TestMockBankFeed(unittest.TestCase):
+    def test_feed_is_deterministic(self):
+        first = full_catalog(MockBankFeed(make_config()), 10)
+        second = full_catalog(MockBankFeed(make_config()), 10)
+
+        self.assertEqual(first, second)
+        self.assertGreater(len(first), 250)
+
+    def test_delta_applied_to_yesterday_gives_today(self):
+        feed = MockBankFeed(make_config())
+        catalog = full_catalog(feed, 9)
+
+        start, changed = 0, 0
+        while start is not None:
+            campaigns, deleted, start = feed.page(10, start, since=9)
+            changed += len(campaigns)
+            catalog.update((campaign["external_id"], campaign) for campaign in campaigns)
+            for external_id in deleted:
+                del catalog[external_id]
+
+        self.assertEqual(catalog, full_catalog(feed, 10))
+        # Roughly the daily change rate, plus new campaigns
+        self.assertLess(changed, len(catalog) * 0.25)
+
+
+class TestMockBankEndpoints(unittest.TestCase):
+    def setUp(self):
+        self.original_config = mock_bank_api.simulator_config
+        self.client = TestClient(create_mock_bank_app(make_config()))
+
+    def tearDown(self):
+        mock_bank_api.simulator_config = self.original_config
+
+    def test_pages_and_not_modified(self):
+        response = self.client.get("/campaigns/feed")
+        body = response.json()
+
+        self.assertEqual(len(body["campaigns"]), 50)
+        # Deleted campaigns are skipped, so the next page may start further on
+        self.assertGreaterEqual(body["next_page"], 50)
+        self.assertEqual(body["next_cursor"], "d10")
+
+        etag = response.headers["ETag"]
+        self.assertEqual(self.client.get("/campaigns/feed", headers={"If-None-Match": etag}).status_code, 304)
+
+    def test_etag_follows_feed_settings(self):
+        etag = self.client.get("/campaigns/feed").headers["ETag"]
+
+        self.client.put("/simulator/config", json=make_config(latency_ms=1).model_dump(mode="json"))
+        self.assertEqual(self.client.get("/campaigns/feed").headers["ETag"], etag)
+
+        self.client.put("/simulator/config", json=make_config(daily_delete_rate=0.05).model_dump(mode="json"))
+        self.assertNotEqual(self.client.get("/campaigns/feed").headers["ETag"], etag)
+
+    def test_simulator_routes_not_on_api_router(self):
+        # The API router is mounted by the main app, without authentication
+        paths = {route.path for route in mock_bank_api.router.routes}
+
+        self.assertNotIn("/simulator/config", paths)
+        self.assertNotIn("/campaigns/feed", paths)
+
+    def test_error_profile(self):
+        self.client.put("/simulator/config", json=make_config(error_rate=1).model_dump(mode="json"))
+
+        self.assertEqual(self.client.post("/campaigns/enroll", json={}).status_code, 503)
+
+
+class TestMockBankEndToEnd(unittest.TestCase):
+    def setUp(self):
+        self.original_config = mock_bank_api.simulator_config
+
+    def tearDown(self):
+        mock_bank_api.simulator_config = self.original_config
+
+    def test_feed_reader_streams_simulated_feed(self):
+        app = create_mock_bank_app(make_config(campaign_count=1000, page_size=100))
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        async def run():
+            server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+            task = asyncio.create_task(server.serve())
+            while not server.started:
+                await asyncio.sleep(0.01)
+            try:
+                results = {}
+                for fmt in ("envelope", "ndjson", "array"):
+                    reader = CampaignFeedReader(
+                        url=f"http://127.0.0.1:{port}/campaigns/feed",
+                        headers={},
+                        params={"format": fmt},
+                        chunk_size=128
+                    )
+                    results[fmt] = [item["external_id"] async for chunk in reader.chunks() for item in chunk]
+                return results
+            finally:
+                server.should_exit = True
+                await task
+
+        results = asyncio.run(run())
+
+        expected = list(full_catalog(MockBankFeed(make_config(campaign_count=1000)), 10))
+        for fmt, external_ids in results.items():
+            self.assertEqual(external_ids, expected, fmt)
+
+
+if __name__ == '__main__':
+    unittest.main()
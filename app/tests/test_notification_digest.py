@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from app.core.config import settings
+from app.services.notification_service import NotificationDigest, NotificationService, fcm_executor, generate_location_hash
+
+
+def make_notification(campaign_id, fcm_token="token-a"):
+    return {
+        'title': f"Campaign {campaign_id}",
+        'body': f"Body {campaign_id}",
+        'user_id': 1,
+        'campaign_id': campaign_id,
+        'fcm_token': fcm_token,
+        'data': {'type': 'NEARBY_CAMPAIGN', 'campaignId': campaign_id}
+    }
+
+
+class FakeNotificationService:
+    def __init__(self):
+        self.delivered = []
+
+    async def deliver(self, notification):
+        self.delivered.append(notification)
+        return "message-id"
+
+    def build_history(self, notification):
+        return notification
+
+
+class TestNotificationDigest(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2025, 5, 26, 12, 0)
+        self.digest = NotificationDigest(window_seconds=0, hourly_cap=2, daily_cap=3)
+
+    def test_hourly_and_daily_caps(self):
+        self.digest.record(1, self.now - timedelta(minutes=10))
+        self.digest.record(1, self.now - timedelta(minutes=5))
+        self.assertFalse(self.digest.allow(1, self.now))
+
+        # An hour later only the daily cap applies
+        self.assertTrue(self.digest.allow(1, self.now + timedelta(hours=1)))
+        self.digest.record(1, self.now + timedelta(hours=1))
+        self.assertFalse(self.digest.allow(1, self.now + timedelta(hours=3)))
+
+        # Pushes older than a day are forgotten
+        self.assertTrue(self.digest.allow(1, self.now + timedelta(days=1)))
+
+    def test_build_digest_merges_notifications(self):
+        digest = NotificationDigest.build_digest([make_notification(i) for i in range(5)])
+
+        self.assertEqual(digest['data']['type'], 'DIGEST')
+        self.assertEqual(digest['data']['campaignIds'], [0, 1, 2, 3, 4])
+        self.assertIn("+2", digest['body'])
+        self.assertEqual(digest['campaign_id'], 0)
+
+    def test_digest_keeps_each_campaign_location(self):
+        notifications = [
+            {**make_notification(1), 'latitude': 41.0, 'longitude': 29.0},
+            {**make_notification(2), 'latitude': 40.9, 'longitude': 29.1},
+        ]
+
+        digest = NotificationDigest.build_digest(notifications)
+
+        self.assertEqual(digest['campaign_locations'], [
+            {'campaignId': 1, 'locationHash': generate_location_hash(41.0, 29.0)},
+            {'campaignId': 2, 'locationHash': generate_location_hash(40.9, 29.1)},
+        ])
+        # Only the history row carries them, not the push
+        self.assertNotIn('campaignLocations', digest['data'])
+
+    def test_submitted_notifications_are_sent_as_one_push(self):
+        service = FakeNotificationService()
+        db = Mock()
+
+        async def run():
+            await self.digest.submit(make_notification(1), service)
+            await self.digest.submit(make_notification(2, "token-b"), service)
+            # Duplicate campaigns are dropped from the digest
+            await self.digest.submit(make_notification(2), service)
+            await asyncio.sleep(0.01)
+
+        with patch('app.services.notification_service.SessionLocal', return_value=db):
+            asyncio.run(run())
+
+        self.assertEqual(len(service.delivered), 2)
+        self.assertEqual({n['fcm_token'] for n in service.delivered}, {"token-a", "token-b"})
+        self.assertEqual(service.delivered[0]['data']['campaignIds'], [1, 2])
+        db.add.assert_called_once()
+        db.commit.assert_called_once()
+
+    def test_submit_is_rejected_when_capped(self):
+        self.digest.record(1)
+        self.digest.record(1)
+
+        result = asyncio.run(self.digest.submit(make_notification(1), FakeNotificationService()))
+
+        self.assertTrue(result['rate_limited'])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class TestNotificationDelivery(unittest.TestCase):
+    def test_deliver_sends_on_fcm_executor(self):
+        # Skip __init__, which initialises the Firebase app from a credentials file
+        service = NotificationService.__new__(NotificationService)
+        threads = []
+
+        def send(message):
+            threads.append(threading.current_thread().name)
+            return "message-id"
+
+        with patch("app.services.notification_service.messaging.send", side_effect=send):
+            response = asyncio.run(service.deliver(make_notification(1)))
+
+        self.assertEqual(response, "message-id")
+        self.assertTrue(threads[0].startswith("fcm-send"))
+        self.assertEqual(fcm_executor._max_workers, settings.REMINDER_DELIVERY_CONCURRENCY)
@@ -0,0 +1,47 @@
+import unittest
+from datetime import date
+from unittest.mock import Mock, patch
+
+from app.services.notification_retention_service import NotificationRetentionService
+
+
+class TestNotificationRetentionService(unittest.TestCase):
+    def setUp(self):
+        self.db = Mock()
+        self.service = NotificationRetentionService(self.db)
+
+    def test_add_months_across_year_boundary(self):
+        self.assertEqual(NotificationRetentionService.add_months(date(2025, 11, 1), 3), date(2026, 2, 1))
+        self.assertEqual(NotificationRetentionService.add_months(date(2025, 2, 1), -6), date(2024, 8, 1))
+
+    def test_partition_name_round_trip(self):
+        name = NotificationRetentionService.partition_name(date(2025, 5, 1))
+        self.assertEqual(name, "notification_history_2025_05")
+        self.assertEqual(NotificationRetentionService.parse_partition_month(name), date(2025, 5, 1))
+        self.assertIsNone(NotificationRetentionService.parse_partition_month("notification_history_default"))
+
+    def test_ensure_partitions_creates_only_missing_months(self):
+        with patch.object(self.service, "list_partitions", return_value=["notification_history_2025_05"]):
+            created = self.service.ensure_partitions(months_ahead=2, today=date(2025, 5, 20))
+
+        self.assertEqual(created, ["notification_history_2025_06", "notification_history_2025_07"])
+        self.db.commit.assert_called_once()
+
+    def test_rollup_only_drops_partitions_past_retention(self):
+        partitions = [
+            "notification_history_2024_10",
+            "notification_history_2024_11",
+            "notification_history_2025_05",
+        ]
+        self.db.execute.return_value = Mock(rowcount=4)
+
+        with patch.object(self.service, "list_partitions", return_value=partitions):
+            result = self.service.rollup_expired_partitions(retention_months=6, today=date(2025, 5, 20))
+
+        self.assertEqual(result["cutoff_month"], "2024-11-01")
+        self.assertEqual(result["dropped_partitions"], ["notification_history_2024_10"])
+        self.assertEqual(result["rollup_rows"], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
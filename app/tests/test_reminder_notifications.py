@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+from app.tasks import reminder_notifications
+from app.tasks.reminder_notifications import schedule_reminder_notifications, send_reminder_batch
+
+
+class FakeNotificationService:
+    """Records deliveries and fails for tokens starting with 'bad'"""
+
+    def __init__(self):
+        self.delivered = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def deliver(self, notification):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if notification['fcm_token'].startswith('bad'):
+            raise RuntimeError("FCM error")
+        self.delivered.append(notification['fcm_token'])
+        return "message-id"
+
+    def build_history(self, notification):
+        return notification
+
+
+class TestSendReminderBatch(unittest.TestCase):
+    def setUp(self):
+        self.campaign = Mock(id=10)
+        self.campaign.name = "Test Campaign"
+        self.reminders = [
+            Mock(id=1, user_id="100", campaign=self.campaign),
+            Mock(id=2, user_id="200", campaign=self.campaign),
+            Mock(id=3, user_id="300", campaign=self.campaign),
+        ]
+        token_rows = [(100, "token-a"), (100, "token-b"), (200, "bad-token")]
+
+        reminder_query = Mock()
+        reminder_query.options.return_value.filter.return_value.all.return_value = self.reminders
+        token_query = Mock()
+        token_query.filter.return_value.all.return_value = token_rows
+
+        self.db = Mock()
+        self.db.query.side_effect = [reminder_query, token_query]
+
+    def test_batch_uses_two_queries_and_marks_only_delivered_reminders(self):
+        service = FakeNotificationService()
+
+        sent_ids = asyncio.run(send_reminder_batch([1, 2, 3], service, self.db))
+
+        self.assertEqual(sent_ids, {1})
+        self.assertEqual(self.db.query.call_count, 2)
+        self.assertEqual(sorted(service.delivered), ["token-a", "token-b"])
+        self.assertGreater(service.max_in_flight, 1)
+
+        # One history row per user push, written with the bulk is_sent
+        # update in one commit
+        self.assertEqual(len(self.db.add_all.call_args[0][0]), 1)
+        self.db.execute.assert_called_once()
+        self.db.commit.assert_called_once()
+
+
+class TestScheduleReminderNotifications(unittest.TestCase):
+    def test_due_reminder_sweep_is_scheduled_as_fallback(self):
+        scheduler = Mock()
+
+        with patch.object(reminder_notifications, "reminder_scheduler") as reminder_scheduler:
+            schedule_reminder_notifications(scheduler)
+
+        reminder_scheduler.start.assert_called_once()
+        jobs = {call.kwargs["id"]: call.args[0] for call in scheduler.add_job.call_args_list}
+        self.assertIs(jobs["reminder_notifications_sweep"], reminder_notifications.send_reminder_notifications)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytz
+
+from app.services.reminder_scheduler import ReminderScheduler
+
+
+class TestReminderScheduler(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime(2025, 5, 26, 12, 0, tzinfo=pytz.UTC)
+        self.scheduler = ReminderScheduler(horizon=timedelta(minutes=60))
+
+    def test_add_ignores_reminders_beyond_horizon(self):
+        self.assertTrue(self.scheduler.add(1, self.now + timedelta(minutes=30), now=self.now))
+        self.assertFalse(self.scheduler.add(2, self.now + timedelta(hours=2), now=self.now))
+        self.assertEqual(len(self.scheduler), 1)
+
+    def test_pop_due_returns_only_due_reminders_in_order(self):
+        self.scheduler.add(1, self.now + timedelta(minutes=10), now=self.now)
+        self.scheduler.add(2, self.now - timedelta(minutes=1), now=self.now)
+        self.scheduler.add(3, self.now, now=self.now)
+
+        self.assertEqual(self.scheduler.pop_due(self.now), [2, 3])
+        self.assertEqual(self.scheduler.seconds_until_next(self.now), 600.0)
+
+    def test_removed_and_rescheduled_reminders_are_skipped(self):
+        self.scheduler.add(1, self.now - timedelta(minutes=5), now=self.now)
+        self.scheduler.add(2, self.now - timedelta(minutes=5), now=self.now)
+        self.scheduler.remove(1)
+        # Rescheduling replaces the earlier entry
+        self.scheduler.add(2, self.now + timedelta(minutes=5), now=self.now)
+
+        self.assertEqual(self.scheduler.pop_due(self.now), [])
+        self.assertEqual(self.scheduler.pop_due(self.now + timedelta(minutes=5)), [2])
+
+    def test_naive_times_are_treated_as_utc(self):
+        self.scheduler.add(1, datetime(2025, 5, 26, 11, 59), now=self.now)
+        self.assertEqual(self.scheduler.pop_due(self.now), [1])
+
+    def test_refresh_rebuilds_schedule_from_database(self):
+        self.scheduler.add(99, self.now, now=self.now)
+        db = Mock()
+        db.query.return_value.filter.return_value.all.return_value = [
+            (1, self.now - timedelta(minutes=1)),
+            (2, self.now + timedelta(minutes=20)),
+        ]
+
+        self.assertEqual(self.scheduler.refresh(db, now=self.now), 2)
+        self.assertEqual(self.scheduler.pop_due(self.now), [1])
+
+    def test_run_loop_dispatches_due_reminders(self):
+        dispatched = []
+
+        async def dispatch(reminder_ids):
+            dispatched.extend(reminder_ids)
+
+        async def run():
+            self.scheduler.start(dispatch=dispatch)
+            self.scheduler.add(7, datetime.now(pytz.UTC))
+            for _ in range(50):
+                if dispatched:
+                    break
+                await asyncio.sleep(0.01)
+            self.scheduler.stop()
+
+        asyncio.run(run())
+        self.assertEqual(dispatched, [7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,24 @@
 import base64
 import os
-from cryptography.fernet import Fernet
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken, MultiFernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from app.core.config import settings
 
 # Create a key from the secret key
-def get_encryption_key():
-    """Generate an encryption key from the app secret key"""
+@lru_cache(maxsize=8)
+def derive_key(secret: str) -> bytes:
+    """
+    Derive a Fernet key from a secret
+    PBKDF2 with 100,000 iterations is deliberately slow, so each secret is
+    only derived once per process
+    """
     salt = b'payviya_salt'  # This would ideally be stored securely
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
@@ -16,17 +26,31 @@ def get_encryption_key():
         salt=salt,
         iterations=100000,
     )
-    key = base64.urlsafe_b64encode(kdf.derive(settings.SECRET_KEY.encode()))
-    return key
+    return base64.urlsafe_b64encode(kdf.derive(secret.encode()))
+
+def get_encryption_key():
+    """Generate an encryption key from the app secret key"""
+    return derive_key(settings.SECRET_KEY)
+
+@lru_cache(maxsize=8)
+def _build_fernet(secret_key: str, previous_keys: Tuple[str, ...]) -> MultiFernet:
+    return MultiFernet([Fernet(derive_key(secret)) for secret in (secret_key, *previous_keys)])
+
+def get_fernet() -> MultiFernet:
+    """
+    Fernet for the current and previous secret keys
+    Data is encrypted with SECRET_KEY; anything encrypted with a key listed in
+    PREVIOUS_SECRET_KEYS can still be decrypted, and re-encrypted with
+    rotate_data (bank credentials: app.tasks.credential_rotation_task)
+    """
+    return _build_fernet(settings.SECRET_KEY, tuple(settings.PREVIOUS_SECRET_KEYS))
 
 def encrypt_data(data: str) -> str:
     """Encrypt sensitive data"""
     if not data:
         return None
         
-    key = get_encryption_key()
-    f = Fernet(key)
-    encrypted_data = f.encrypt(data.encode())
+    encrypted_data = get_fernet().encrypt(data.encode())
     return base64.urlsafe_b64encode(encrypted_data).decode()
 
 def decrypt_data(data: str) -> str:
@@ -34,7 +58,60 @@ def decrypt_data(data: str) -> str:
     if not data:
         return None
         
-    key = get_encryption_key()
-    f = Fernet(key)
     encrypted_data = base64.urlsafe_b64decode(data.encode())
-    return f.decrypt(encrypted_data).decode() 
\ No newline at end of file
+    return get_fernet().decrypt(encrypted_data).decode()
+
+def rotate_data(data: str) -> str:
+    """Re-encrypt data with the current secret key"""
+    if not data:
+        return None
+        
+    encrypted_data = base64.urlsafe_b64decode(data.encode())
+    return base64.urlsafe_b64encode(get_fernet().rotate(encrypted_data)).decode()
+
+def needs_rotation(data: str) -> bool:
+    """Check whether data was encrypted with a key other than the current secret key"""
+    if not data:
+        return False
+
+    try:
+        Fernet(get_encryption_key()).decrypt(base64.urlsafe_b64decode(data.encode()))
+        return False
+    except InvalidToken:
+        return True
+
+
+# Decrypted bank credentials, keyed by bank ID. Entries also remember the
+# ciphertexts they were decrypted from, so a changed credential is never
+# served from the cache, even if another process made the change.
+_credential_cache: Dict[int, Tuple[float, Tuple[Optional[str], Optional[str]], Tuple[Optional[str], Optional[str]]]] = {}
+_credential_lock = threading.Lock()
+
+def get_bank_credentials(bank) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Decrypted (api_key, api_secret) of a bank
+    Cached for BANK_CREDENTIAL_CACHE_TTL_SECONDS
+    """
+    encrypted = (bank.api_key, bank.api_secret)
+    now = time.monotonic()
+
+    with _credential_lock:
+        cached = _credential_cache.get(bank.id)
+    if cached and cached[0] > now and cached[1] == encrypted:
+        return cached[2]
+
+    credentials = (
+        decrypt_data(bank.api_key) if bank.api_key else None,
+        decrypt_data(bank.api_secret) if bank.api_secret else None
+    )
+    with _credential_lock:
+        _credential_cache[bank.id] = (now + settings.BANK_CREDENTIAL_CACHE_TTL_SECONDS, encrypted, credentials)
+    return credentials
+
+def invalidate_bank_credentials(bank_id: Optional[int] = None) -> None:
+    """Drop cached credentials of a bank, or of every bank"""
+    with _credential_lock:
+        if bank_id is None:
+            _credential_cache.clear()
+        else:
+            _credential_cache.pop(bank_id, None)